@@ -0,0 +1,145 @@
+import random
+import timeit
+from functools import lru_cache
+
+import lib
+from bitword import BitWord
+
+
+def ripple_add(a, b, width, carry_in=0):
+    """Bit-serial ripple-carry adder over int words, returns (sum, carry out)."""
+    result = 0
+    carry = carry_in
+    for i in range(width):
+        x = (a >> i) & 1
+        y = (b >> i) & 1
+        result |= (x ^ y ^ carry) << i
+        carry = (x & y) | (carry & (x ^ y))
+    return result, carry
+
+
+def _finish(g, p, a, b, width, carry_in):
+    """Builds the sum from prefix generate/propagate words."""
+    mask = (1 << width) - 1
+    carries = g | (p if carry_in else 0)
+    total = (a ^ b ^ ((carries << 1) | carry_in)) & mask
+    return total, (carries >> (width - 1)) & 1
+
+
+def kogge_stone_add(a, b, width, carry_in=0):
+    """Kogge-Stone parallel-prefix adder: log2(width) levels of whole-word operations."""
+    mask = (1 << width) - 1
+    g = a & b & mask
+    p = (a ^ b) & mask
+    distance = 1
+    while distance < width:
+        g = (g | (p & (g << distance))) & mask
+        p = p & ((p << distance) | ((1 << distance) - 1))
+        distance <<= 1
+    return _finish(g, p, a, b, width, carry_in)
+
+
+@lru_cache(maxsize=None)
+def _brent_kung_levels(width):
+    """Position masks of the up-sweep and down-sweep levels of a Brent-Kung tree."""
+    up = []
+    distance = 1
+    while distance < width:
+        positions = sum(1 << i for i in range(2 * distance - 1, width, 2 * distance))
+        up.append((distance, positions))
+        distance <<= 1
+    down = []
+    while distance > 1:
+        distance >>= 1
+        positions = sum(1 << i for i in range(3 * distance - 1, width, 2 * distance))
+        if positions:
+            down.append((distance, positions))
+    return up + down
+
+
+def brent_kung_add(a, b, width, carry_in=0):
+    """Brent-Kung parallel-prefix adder: sparse up-sweep then down-sweep of the prefix tree."""
+    mask = (1 << width) - 1
+    g = a & b & mask
+    p = (a ^ b) & mask
+    for distance, positions in _brent_kung_levels(width):
+        g |= p & (g << distance) & positions
+        p = (p & ~positions) | (p & (p << distance) & positions)
+    return _finish(g, p & mask, a, b, width, carry_in)
+
+
+ADDERS = {
+    'ripple': ripple_add,
+    'kogge_stone': kogge_stone_add,
+    'brent_kung': brent_kung_add,
+}
+
+
+def carry_save_add(a, b, c, width):
+    """3:2 compressor: reduces three words to a sum word and a carry word."""
+    mask = (1 << width) - 1
+    return (a ^ b ^ c) & mask, (((a & b) | (a & c) | (b & c)) << 1) & mask
+
+
+def carry_save_sum(operands, width, adder=kogge_stone_add):
+    """Sums many words modulo 2 ** width with a carry-save tree and one final carry-propagate add."""
+    words = list(operands)
+    if not words:
+        return 0
+    while len(words) > 2:
+        reduced = []
+        for i in range(0, len(words) - 2, 3):
+            reduced.extend(carry_save_add(words[i], words[i + 1], words[i + 2], width))
+        reduced.extend(words[len(words) - len(words) % 3:])
+        words = reduced
+    if len(words) == 1:
+        return words[0]
+    return adder(words[0], words[1], width)[0]
+
+
+def sum_complement(values, width, adder=kogge_stone_add):
+    """
+    Sums decimal values in complement code. Operands are sign-extended by enough
+    guard bits to hold the exact sum, so the overflow flag is exact.
+    """
+    values = list(values)
+    extended = width + max(1, len(values)).bit_length()
+    words = (BitWord.from_complement(n, width).to_complement() for n in values)
+    total = BitWord(carry_save_sum((BitWord.from_complement(n, extended).value for n in words),
+                                   extended, adder), extended).to_complement()
+    limit = 1 << (width - 1)
+    return BitWord(total, width), not -limit <= total < limit
+
+
+def benchmark(widths=(8, 64, 256, 1024, 4096), number=20, seed=0):
+    """Times every adder against the string ripple path lib.add_binary, in seconds per addition."""
+    rng = random.Random(seed)
+    results = {}
+    for width in widths:
+        a, b = rng.getrandbits(width), rng.getrandbits(width)
+        a_bin, b_bin = lib.dec_to_bin(a, width), lib.dec_to_bin(b, width)
+        timings = {'string_ripple': timeit.timeit(lambda: lib.add_binary(a_bin, b_bin), number=number) / number}
+        for name, adder in ADDERS.items():
+            timings[name] = timeit.timeit(lambda: adder(a, b, width), number=number) / number
+        operands = [rng.getrandbits(width) for _ in range(64)]
+        timings['sequential_sum_64'] = timeit.timeit(
+            lambda: _sequential_sum(operands, width), number=number) / number
+        timings['carry_save_sum_64'] = timeit.timeit(
+            lambda: carry_save_sum(operands, width), number=number) / number
+        results[width] = timings
+    return results
+
+
+def _sequential_sum(operands, width):
+    total = 0
+    for word in operands:
+        total = kogge_stone_add(total, word, width)[0]
+    return total
+
+
+if __name__ == '__main__':
+    for width, timings in benchmark().items():
+        print(f'{width} bits')
+        for name, seconds in timings.items():
+            base = timings['sequential_sum_64' if name.endswith('_64') else 'string_ripple']
+            print(f'  {name:18} {seconds * 1e6:12.2f} us  x{base / seconds:10.1f}')
@@ -0,0 +1,96 @@
+"""
+Micro-operation tracing for the string ALU in lib.
+
+    with tracing(capacity=1024) as tracer:
+        add_binary('1011', '0111')
+    tracer.steps              # last steps, oldest first
+    tracer.carry_chains       # Counter {chain length: count}
+
+When no tracer is installed every instrumented function pays one global
+lookup per call and a None check per step.
+"""
+from collections import Counter, defaultdict, deque, namedtuple
+from contextlib import contextmanager
+
+import lib
+
+Step = namedtuple('Step', 'operation micro_op position inputs outputs')
+
+NORMALIZING = ('float_to_ieee', 'pack_ieee')
+
+
+class Tracer:
+    """
+    Keeps the last ``capacity`` steps in a ring buffer and aggregates statistics
+    over every step seen, including the ones already dropped from the buffer.
+
+    Attributes:
+        steps (deque): Ring buffer of Step records.
+        operations (Counter): Finished calls per operation.
+        micro_ops (Counter): Steps per (operation, micro-op).
+        carry_chains (Counter): Lengths of runs of consecutive carry-outs in full adders.
+        borrow_chains (Counter): Lengths of runs of consecutive borrow-outs in full subtractors.
+        normalization_shifts (defaultdict): Per operation, a Counter of shifts per call.
+    """
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.reset()
+
+    def reset(self):
+        self.steps = deque(maxlen=self.capacity)
+        self.operations = Counter()
+        self.micro_ops = Counter()
+        self.carry_chains = Counter()
+        self.borrow_chains = Counter()
+        self.normalization_shifts = defaultdict(Counter)
+        self._chains = {}
+        self._shifts = Counter()
+
+    def step(self, operation, micro_op, position, inputs, outputs):
+        self.steps.append(Step(operation, micro_op, position, inputs, outputs))
+        self.micro_ops[operation, micro_op] += 1
+        if micro_op == 'full_add' or micro_op == 'full_sub':
+            if outputs[1]:
+                self._chains[operation, micro_op] = self._chains.get((operation, micro_op), 0) + 1
+            else:
+                self._close_chain(operation, micro_op)
+        elif micro_op == 'normalize':
+            self._shifts[operation] += 1
+
+    def end(self, operation):
+        """Marks the end of one call, closing open carry chains and shift counts."""
+        self.operations[operation] += 1
+        for key in [key for key in self._chains if key[0] == operation]:
+            self._close_chain(*key)
+        if operation in NORMALIZING:
+            self.normalization_shifts[operation][self._shifts.pop(operation, 0)] += 1
+
+    def _close_chain(self, operation, micro_op):
+        length = self._chains.pop((operation, micro_op), 0)
+        if length:
+            (self.carry_chains if micro_op == 'full_add' else self.borrow_chains)[length] += 1
+
+    def mean_carry_chain(self):
+        total = sum(self.carry_chains.values())
+        return sum(length * count for length, count in self.carry_chains.items()) / total if total else 0.0
+
+    def summary(self):
+        return {
+            'operations': dict(self.operations),
+            'carry_chains': dict(sorted(self.carry_chains.items())),
+            'borrow_chains': dict(sorted(self.borrow_chains.items())),
+            'normalization_shifts': {name: dict(sorted(counts.items()))
+                                     for name, counts in self.normalization_shifts.items()},
+        }
+
+
+@contextmanager
+def tracing(capacity=4096, tracer=None):
+    """Installs a tracer into lib for the duration of the block and yields it."""
+    tracer = tracer if tracer is not None else Tracer(capacity)
+    previous = lib._tracer
+    lib._tracer = tracer
+    try:
+        yield tracer
+    finally:
+        lib._tracer = previous
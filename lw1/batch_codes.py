@@ -0,0 +1,135 @@
+import numpy as np
+
+
+def code_dtype(bits):
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if bits <= np.iinfo(dtype).bits:
+            return dtype
+    raise ValueError('Batch codes support at most 64 bits')
+
+
+def _split(values, bits):
+    if not 1 <= bits <= 64:
+        raise ValueError('Batch codes support widths from 1 to 64 bits')
+    values = np.asarray(values, dtype=np.int64)
+    negative = values < 0
+    magnitude = values.astype(np.uint64)
+    magnitude = np.where(negative, ~magnitude + np.uint64(1), magnitude)
+    sign = np.uint64(1 << (bits - 1))
+    low = np.uint64((1 << (bits - 1)) - 1)
+    return negative, magnitude, sign, low
+
+
+def direct_code_batch(values, bits):
+    negative, magnitude, sign, low = _split(values, bits)
+    codes = np.where(negative, sign | (magnitude & low), magnitude & low)
+    return codes.astype(code_dtype(bits))
+
+
+def reverse_code_batch(values, bits):
+    negative, magnitude, sign, low = _split(values, bits)
+    codes = np.where(negative, sign | (~magnitude & low), magnitude & low)
+    return codes.astype(code_dtype(bits))
+
+
+def complement_code_batch(values, bits):
+    negative, magnitude, sign, low = _split(values, bits)
+    codes = np.where(negative, sign | ((~magnitude + np.uint64(1)) & low), magnitude & low)
+    return codes.astype(code_dtype(bits))
+
+
+def encode_batch(values, bits):
+    """Returns the direct, reverse and complement codes of every value at once."""
+    negative, magnitude, sign, low = _split(values, bits)
+    dtype = code_dtype(bits)
+    positive = magnitude & low
+    direct = np.where(negative, sign | positive, positive).astype(dtype)
+    reverse = np.where(negative, sign | (~magnitude & low), positive).astype(dtype)
+    complement = np.where(negative, sign | ((~magnitude + np.uint64(1)) & low), positive).astype(dtype)
+    return direct, reverse, complement
+
+
+def complement_to_dec_batch(codes, bits):
+    codes = np.asarray(codes).astype(np.uint64)
+    if bits == 64:
+        return codes.view(np.int64)
+    sign = (codes >> np.uint64(bits - 1)) & np.uint64(1)
+    return codes.astype(np.int64) - (sign.astype(np.int64) << np.int64(bits))
+
+
+def reverse_to_dec_batch(codes, bits):
+    codes = np.asarray(codes).astype(np.uint64)
+    sign = (codes >> np.uint64(bits - 1)) & np.uint64(1)
+    low = np.uint64((1 << (bits - 1)) - 1)
+    return np.where(sign.astype(bool), -(~codes & low).astype(np.int64), (codes & low).astype(np.int64))
+
+
+def direct_to_dec_batch(codes, bits):
+    codes = np.asarray(codes).astype(np.uint64)
+    sign = (codes >> np.uint64(bits - 1)) & np.uint64(1)
+    magnitude = (codes & np.uint64((1 << (bits - 1)) - 1)).astype(np.int64)
+    return np.where(sign.astype(bool), -magnitude, magnitude)
+
+
+def pack_bits(codes, bits):
+    """
+    Packs codes into a uint8 bit matrix with one row per code.
+
+    Bits are stored most significant first, so unpacking a row with
+    ``np.unpackbits(row, count=bits)`` gives the same digits as the string codes.
+    """
+    codes = np.asarray(codes).astype('>u8')
+    digits = np.unpackbits(codes.view(np.uint8).reshape(-1, 8), axis=1)
+    return np.packbits(digits[:, 64 - bits:], axis=1)
+
+
+def unpack_bits(matrix, bits):
+    digits = np.unpackbits(np.asarray(matrix, dtype=np.uint8), axis=1, count=bits)
+    padded = np.zeros((digits.shape[0], 64), dtype=np.uint8)
+    padded[:, 64 - bits:] = digits
+    codes = np.packbits(padded, axis=1).view('>u8').reshape(-1)
+    return codes.astype(code_dtype(bits))
+
+
+def add_complement_batch(a, b, bits=16):
+    """Vectorized add_complement: returns the sum codes and the overflow flags."""
+    ca = complement_code_batch(a, bits).astype(np.uint64)
+    cb = complement_code_batch(b, bits).astype(np.uint64)
+    total = (ca + cb) & np.uint64((1 << bits) - 1)
+    sign = np.uint64(bits - 1)
+    overflow = ((ca >> sign) == (cb >> sign)) & ((total >> sign) != (ca >> sign))
+    return total.astype(code_dtype(bits)), overflow
+
+
+def subtract_complement_batch(a, b, bits=16):
+    return add_complement_batch(a, -np.asarray(b, dtype=np.int64), bits)
+
+
+def multiply_direct_batch(a, b, bits=16):
+    """Vectorized multiply_direct: returns the product codes and the overflow flags."""
+    if bits > 32:
+        raise ValueError('Batch multiplication supports at most 32 bits')
+    da = direct_code_batch(a, bits).astype(np.uint64)
+    db = direct_code_batch(b, bits).astype(np.uint64)
+    sign = np.uint64(bits - 1)
+    low = np.uint64((1 << (bits - 1)) - 1)
+    product = (da & low) * (db & low)
+    codes = (((da ^ db) >> sign) << sign) | (product & low)
+    return codes.astype(code_dtype(bits)), product > low
+
+
+def divide_direct_batch(a, b, bits=16, precision=5):
+    """
+    Vectorized divide_direct: returns the signed quotients as fixed-point
+    integers with ``precision`` fractional bits.
+    """
+    if bits - 1 + precision > 63:
+        raise ValueError('Batch division supports at most 63 bits of dividend and precision')
+    da = direct_code_batch(a, bits).astype(np.uint64)
+    db = direct_code_batch(b, bits).astype(np.uint64)
+    low = np.uint64((1 << (bits - 1)) - 1)
+    if not (db & low).all():
+        raise ValueError('Division by zero')
+    quotient = ((da & low) << np.uint64(precision)) // (db & low)
+    negative = ((da ^ db) >> np.uint64(bits - 1)).astype(bool)
+    return np.where(negative, -quotient.astype(np.int64), quotient.astype(np.int64))
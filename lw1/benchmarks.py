@@ -0,0 +1,182 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+
+import conversion
+import lib
+from softfloat_scalar import BINARY32
+
+WIDTHS = (8, 16, 64, 256, 1024, 4096)
+THRESHOLD = 0.25
+# float_to_ieee and add_ieee time binary32, so for them the width only sets the
+# binary exponent of the operands, kept one below the largest binary32 exponent
+# so that operands and sums stay finite
+MAX_FLOAT_EXPONENT = BINARY32.max_exponent - 1 - BINARY32.bias - 1
+
+
+def _bits(rng, width):
+    return lib.dec_to_bin(rng.getrandbits(width), width)
+
+
+def _magnitude(rng, width):
+    return rng.getrandbits(width - 1) if width > 1 else 0
+
+
+def _float(rng, width):
+    return rng.uniform(1.0, 2.0) * 2.0 ** min(width, MAX_FLOAT_EXPONENT) * rng.choice((-1, 1))
+
+
+def _dec_to_bin(rng, width):
+    n = rng.getrandbits(width)
+    return lambda: lib.dec_to_bin(n, width)
+
+
+def _complement_code(rng, width):
+    n = -_magnitude(rng, width)
+    return lambda: lib.complement_code(n, width)
+
+
+def _add_complement(rng, width):
+    a, b = _magnitude(rng, width), -_magnitude(rng, width)
+    return lambda: lib.add_complement(a, b, width)
+
+
+def _binary_multiply(rng, width):
+    a, b = _bits(rng, width), _bits(rng, width)
+    return lambda: lib.binary_multiply(a, b)
+
+
+def _binary_divide(rng, width):
+    a, b = _bits(rng, width), _bits(rng, max(1, width // 2))
+    b = b[:-1] + '1'
+    return lambda: lib.binary_divide(a, b, 5)
+
+
+def _float_to_ieee(rng, width):
+    f = _float(rng, width)
+    return lambda: lib.float_to_ieee(f)
+
+
+def _add_ieee(rng, width):
+    a, b = _float(rng, width), _float(rng, width)
+    return lambda: lib.add_ieee(a, b)
+
+
+OPERATIONS = {
+    'dec_to_bin': _dec_to_bin,
+    'complement_code': _complement_code,
+    'add_complement': _add_complement,
+    'binary_multiply': _binary_multiply,
+    'binary_divide': _binary_divide,
+    'float_to_ieee': _float_to_ieee,
+    'add_ieee': _add_ieee,
+}
+
+
+def measure(func, repeat=3, budget=1.0):
+    """
+    Best time per call in seconds. The call count is calibrated like timeit's
+    autorange; repeats stop early once ``budget`` seconds are spent, so
+    multi-second calls at 4096 bits are timed only once.
+    """
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    best = elapsed / number
+    spent = elapsed
+    for _ in range(repeat - 1):
+        if spent >= budget:
+            break
+        elapsed = timer.timeit(number)
+        best = min(best, elapsed / number)
+        spent += elapsed
+    return best
+
+
+def run(operations=tuple(OPERATIONS), widths=WIDTHS, repeat=3, budget=1.0, seed=0):
+    """
+    Returns {operation: {width: seconds per call}} with widths as strings, ready for JSON.
+    The conversion caches are disabled meanwhile, since every operation repeats
+    one operand and would otherwise time a cache hit.
+    """
+    results = {}
+    cache_size = conversion.cache_info()['dec_to_bin']['maxsize']
+    conversion.set_cache_size(0)
+    try:
+        for name in operations:
+            rng = random.Random(seed)
+            results[name] = {str(width): measure(OPERATIONS[name](rng, width), repeat, budget) for width in widths}
+    finally:
+        conversion.set_cache_size(cache_size)
+    return results
+
+
+def compare(baseline, current, threshold=THRESHOLD):
+    """
+    Lists the (operation, width, baseline seconds, current seconds) entries
+    that became slower than the baseline by more than ``threshold``.
+    Entries missing from either side are ignored.
+    """
+    regressions = []
+    for name, timings in current.items():
+        for width, seconds in timings.items():
+            reference = baseline.get(name, {}).get(width)
+            if reference and seconds > reference * (1 + threshold):
+                regressions.append((name, width, reference, seconds))
+    return regressions
+
+
+def save(path, results):
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    with open(path, 'w') as file:
+        json.dump(report, file, indent=2)
+
+
+def load(path):
+    with open(path) as file:
+        return json.load(file)['results']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Times lw1 arithmetic across operand widths.')
+    parser.add_argument('--ops', default=','.join(OPERATIONS))
+    parser.add_argument('--widths', default=','.join(map(str, WIDTHS)))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--budget', type=float, default=1.0, help='seconds spent per measurement before repeats stop')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', metavar='PATH', help='write the results as a JSON baseline')
+    parser.add_argument('--baseline', metavar='PATH', help='compare against a saved baseline')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='allowed slowdown, 0.25 means 25%%')
+    args = parser.parse_args(argv)
+
+    operations = [name.strip() for name in args.ops.split(',') if name.strip()]
+    for name in operations:
+        if name not in OPERATIONS:
+            parser.error(f'unknown operation: {name}')
+    widths = [int(width) for width in args.widths.split(',')]
+
+    results = run(operations, widths, args.repeat, args.budget, args.seed)
+    for name, timings in results.items():
+        print(name)
+        for width, seconds in timings.items():
+            print(f'  {width:>5} bits {seconds * 1e6:14.2f} us')
+
+    if args.save:
+        save(args.save, results)
+    if args.baseline:
+        regressions = compare(load(args.baseline), results, args.threshold)
+        for name, width, reference, seconds in regressions:
+            print(f'REGRESSION {name} {width} bits: {reference * 1e6:.2f} us -> {seconds * 1e6:.2f} us '
+                  f'(+{(seconds / reference - 1) * 100:.0f}%)', file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
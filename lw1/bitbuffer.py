@@ -0,0 +1,132 @@
+"""
+In-place arithmetic over ASCII bit strings held in bytearray/memoryview buffers.
+
+Operands are right aligned: a shorter operand behaves as if it were padded
+with leading zeros, so no zfill copies are made. Results are written into
+buffers supplied by the caller and can be reused across a whole pipeline.
+"""
+
+ZERO = ord('0')
+ONE = ord('1')
+POINT = ord('.')
+
+
+def from_str(bin_str, width=None):
+    """Allocates a buffer holding the bits, zero padded on the left to ``width``."""
+    width = max(width or 0, len(bin_str))
+    buffer = bytearray(b'0' * width)
+    buffer[width - len(bin_str):] = bin_str.encode('ascii')
+    return buffer
+
+
+def to_str(buffer):
+    return bytes(buffer).decode('ascii')
+
+
+def fill(buffer, digit=ZERO):
+    view = memoryview(buffer)
+    for i in range(len(view)):
+        view[i] = digit
+
+
+def strip(buffer):
+    """Returns a view of the buffer without leading zeros, keeping at least one digit."""
+    view = memoryview(buffer)
+    start = 0
+    while start < len(view) - 1 and view[start] == ZERO:
+        start += 1
+    return view[start:]
+
+
+def compare(a, b):
+    """Unsigned comparison of two bit buffers: 1, 0 or -1, like lib.binary_compare."""
+    a, b = memoryview(a), memoryview(b)
+    length = max(len(a), len(b))
+    offset_a = length - len(a)
+    offset_b = length - len(b)
+    for i in range(length):
+        x = a[i - offset_a] if i >= offset_a else ZERO
+        y = b[i - offset_b] if i >= offset_b else ZERO
+        if x != y:
+            return 1 if x == ONE else -1
+    return 0
+
+
+def add_into(out, a, b, carry=0):
+    """
+    Writes a + b into ``out`` (right aligned, as wide as ``out``) and returns the carry out.
+    ``out`` may be one of the operands.
+    """
+    out, a, b = memoryview(out), memoryview(a), memoryview(b)
+    offset_a = len(out) - len(a)
+    offset_b = len(out) - len(b)
+    for i in range(len(out) - 1, -1, -1):
+        total = carry
+        if i >= offset_a and a[i - offset_a] == ONE:
+            total += 1
+        if i >= offset_b and b[i - offset_b] == ONE:
+            total += 1
+        out[i] = ONE if total & 1 else ZERO
+        carry = total >> 1
+    return carry
+
+
+def subtract_into(out, a, b):
+    """
+    Writes a - b into ``out`` (right aligned, as wide as ``out``) and returns the borrow out.
+    ``out`` may be one of the operands.
+    """
+    out, a, b = memoryview(out), memoryview(a), memoryview(b)
+    offset_a = len(out) - len(a)
+    offset_b = len(out) - len(b)
+    borrow = 0
+    for i in range(len(out) - 1, -1, -1):
+        difference = -borrow
+        if i >= offset_a and a[i - offset_a] == ONE:
+            difference += 1
+        if i >= offset_b and b[i - offset_b] == ONE:
+            difference -= 1
+        borrow = 1 if difference < 0 else 0
+        out[i] = ONE if difference & 1 else ZERO
+    return borrow
+
+
+def quotient_size(dividend_width, precision):
+    return dividend_width + (precision + 1 if precision > 0 else 0)
+
+
+def divide_into(out, a, b, precision, remainder=None):
+    """
+    Restoring division of bit buffers, writing the quotient into ``out``.
+
+    ``out`` needs ``quotient_size(len(a), precision)`` bytes and ``remainder``, if
+    given, at least ``len(b) + 1``. Returns a view of the quotient formatted like
+    lib.binary_divide.
+    """
+    divisor = strip(b)
+    if len(divisor) == 1 and divisor[0] == ZERO:
+        raise ValueError('Division by zero')
+    a, out = memoryview(a), memoryview(out)
+    width = len(divisor) + 1
+    if remainder is None:
+        remainder = bytearray(width)
+    current = memoryview(remainder)[:width]
+    fill(current)
+
+    position = 0
+    for i in range(len(a) + precision):
+        if i == len(a):
+            out[position] = POINT
+            position += 1
+        current[:-1] = current[1:]
+        current[-1] = a[i] if i < len(a) else ZERO
+        if compare(current, divisor) >= 0:
+            subtract_into(current, current, divisor)
+            out[position] = ONE
+        else:
+            out[position] = ZERO
+        position += 1
+
+    integer = strip(out[:len(a)])
+    start = len(a) - len(integer)
+    return out[start:position]
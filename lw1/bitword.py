@@ -0,0 +1,112 @@
+class BitWord:
+    """
+    Fixed-width machine word backed by a native int.
+
+    The bit pattern is kept in ``value`` (always masked to ``width`` bits) and is
+    only rendered as a string of '0'/'1' characters when printed.
+    """
+    __slots__ = ('value', 'width')
+
+    def __init__(self, value, width):
+        self.width = width
+        self.value = value & ((1 << width) - 1)
+
+    @classmethod
+    def from_str(cls, bin_str):
+        return cls(int(bin_str, 2) if bin_str else 0, len(bin_str))
+
+    @classmethod
+    def from_direct(cls, n, width):
+        sign = 1 if n < 0 else 0
+        magnitude = abs(n) & _low_mask(width)
+        return cls((sign << (width - 1)) | magnitude, width) if width else cls(0, 0)
+
+    @classmethod
+    def from_reverse(cls, n, width):
+        if n >= 0:
+            return cls.from_direct(n, width)
+        return cls((1 << (width - 1)) | (~abs(n) & _low_mask(width)), width)
+
+    @classmethod
+    def from_complement(cls, n, width):
+        if n >= 0:
+            return cls.from_direct(n, width)
+        return cls((1 << (width - 1)) | (-abs(n) & _low_mask(width)), width)
+
+    @property
+    def sign(self):
+        return self.value >> (self.width - 1) if self.width else 0
+
+    @property
+    def magnitude(self):
+        return self.value & _low_mask(self.width)
+
+    def to_unsigned(self):
+        return self.value
+
+    def to_direct(self):
+        return -self.magnitude if self.sign else self.magnitude
+
+    def to_reverse(self):
+        if not self.sign:
+            return self.magnitude
+        return -(~self.value & _low_mask(self.width))
+
+    def to_complement(self):
+        return self.value - (1 << self.width) if self.sign else self.value
+
+    def add(self, other):
+        """Unsigned addition, returns the wrapped sum and the carry out."""
+        width = max(self.width, other.width)
+        total = self.value + other.value
+        return BitWord(total, width), total >> width
+
+    def add_complement(self, other):
+        """Complement-code addition, returns the sum and the overflow flag."""
+        result, _ = self.add(other)
+        overflow = self.sign == other.sign and result.sign != self.sign
+        return result, overflow
+
+    def negate(self):
+        return BitWord(-self.value, self.width)
+
+    def sub_complement(self, other):
+        return self.add_complement(other.negate())
+
+    def compare(self, other):
+        """Unsigned comparison of the bit patterns: 1, 0 or -1."""
+        return (self.value > other.value) - (self.value < other.value)
+
+    def __eq__(self, other):
+        if not isinstance(other, BitWord):
+            return NotImplemented
+        return self.value == other.value and self.width == other.width
+
+    def __hash__(self):
+        return hash((self.value, self.width))
+
+    def __int__(self):
+        return self.value
+
+    def __len__(self):
+        return self.width
+
+    def __str__(self):
+        return format(self.value, f'0{self.width}b') if self.width else ''
+
+    def __repr__(self):
+        return f"BitWord('{self}')"
+
+
+def _low_mask(width):
+    return (1 << (width - 1)) - 1 if width else 0
+
+
+def add_complement(a_dec, b_dec, bits=16):
+    a = BitWord.from_complement(a_dec, bits)
+    b = BitWord.from_complement(b_dec, bits)
+    return a.add_complement(b)
+
+
+def subtract_complement(a_dec, b_dec, bits=16):
+    return add_complement(a_dec, -b_dec, bits)
@@ -0,0 +1,81 @@
+import numpy as np
+
+from bitword import BitWord
+from batch_codes import code_dtype, complement_code_batch, complement_to_dec_batch
+
+RADIX_BITS = {4: 2, 8: 3}
+
+
+def _recoding_table(k):
+    """Booth digit of every (k + 1)-bit window y[ki + k - 1 .. ki - 1]."""
+    table = []
+    for window in range(1 << (k + 1)):
+        digit = (window & 1) - ((window >> k) << (k - 1))
+        for j in range(1, k):
+            digit += ((window >> j) & 1) << (j - 1)
+        table.append(digit)
+    return table
+
+
+_TABLES = {radix: _recoding_table(k) for radix, k in RADIX_BITS.items()}
+
+
+def booth_digits(multiplier, width, radix=4):
+    """Recodes a signed multiplier of the given width into radix-4 or radix-8 Booth digits, least significant first."""
+    k = RADIX_BITS[radix]
+    table = _TABLES[radix]
+    extended = multiplier << 1
+    window_mask = (1 << (k + 1)) - 1
+    return [table[(extended >> (k * i)) & window_mask] for i in range(-(-width // k))]
+
+
+def booth_multiply(a, b, radix=4):
+    """
+    Multiplies two complement-code words with Booth recoding.
+
+    Returns the double-width product and a flag telling whether the product
+    does not fit into the operand width.
+    """
+    width = max(a.width, b.width)
+    k = RADIX_BITS[radix]
+    multiplicand = a.to_complement()
+    # Only the hard multiple 3M needs an addition, the rest are shifts and negations
+    multiples = {0: 0, 1: multiplicand, 2: multiplicand << 1, 3: (multiplicand << 1) + multiplicand,
+                 4: multiplicand << 2}
+    mask = (1 << (2 * width)) - 1
+    product = 0
+    for i, digit in enumerate(booth_digits(b.to_complement(), width, radix)):
+        if digit:
+            partial = multiples[abs(digit)] if digit > 0 else -multiples[-digit]
+            product = (product + (partial << (k * i))) & mask
+    result = BitWord(product, 2 * width)
+    limit = 1 << (width - 1)
+    return result, not -limit <= result.to_complement() < limit
+
+
+def booth_multiply_batch(a, b, width=16, radix=4):
+    """
+    Vectorized Booth multiplication of arrays of decimal values in complement code.
+
+    Returns the double-width product codes and the overflow flags.
+    """
+    if width > 32:
+        raise ValueError('Batch Booth multiplication supports at most 32 bits')
+    k = RADIX_BITS[radix]
+    table = np.array(_TABLES[radix], dtype=np.int64)
+    multiplicand = complement_to_dec_batch(complement_code_batch(a, width), width)
+    extended = complement_to_dec_batch(complement_code_batch(b, width), width) << 1
+    multiples = {m: multiplicand * m for m in range((1 << (k - 1)) + 1)}
+    product = np.zeros(np.broadcast(multiplicand, extended).shape, dtype=np.int64)
+    window_mask = (1 << (k + 1)) - 1
+    for i in range(-(-width // k)):
+        digits = table[(extended >> (k * i)) & window_mask]
+        partial = np.zeros_like(product)
+        for m, multiple in multiples.items():
+            if m:
+                partial += np.where(np.abs(digits) == m, multiple, 0)
+        product += np.where(digits < 0, -partial, partial) << (k * i)
+    limit = 1 << (width - 1)
+    overflow = (product < -limit) | (product >= limit)
+    codes = product.astype(np.uint64) & np.uint64((1 << (2 * width)) - 1)
+    return codes.astype(code_dtype(2 * width)), overflow
@@ -0,0 +1,117 @@
+import struct
+
+import numpy as np
+
+from batch_codes import encode_batch, complement_to_dec_batch, reverse_to_dec_batch, direct_to_dec_batch
+
+MAGIC = b'LW1CODES'
+VERSION = 1
+HEADER = struct.Struct('<8sII')
+MAX_WIDTH = 16
+
+_ENCODINGS = ('direct', 'reverse', 'complement')
+_tables = {}
+
+
+def _dtypes(width):
+    if width <= 8:
+        return np.dtype('u1'), np.dtype('i1')
+    return np.dtype('<u2'), np.dtype('<i2')
+
+
+class CodeTable:
+    """
+    Lookup tables with the direct, reverse and complement codes of every value
+    of a given width, and the decoders of every bit pattern of that width.
+    """
+    def __init__(self, width, codes, values):
+        self.width = width
+        self._offset = 1 << (width - 1)
+        self._codes = codes
+        self._values = values
+
+    @classmethod
+    def build(cls, width):
+        if not 1 <= width <= MAX_WIDTH:
+            raise ValueError(f'Code tables support widths from 1 to {MAX_WIDTH} bits')
+        code_type, value_type = _dtypes(width)
+        domain = np.arange(-(1 << (width - 1)), 1 << (width - 1))
+        codes = [encoding.astype(code_type) for encoding in encode_batch(domain, width)]
+        patterns = np.arange(1 << width, dtype=np.uint64)
+        values = [
+            decoder(patterns, width).astype(value_type)
+            for decoder in (direct_to_dec_batch, reverse_to_dec_batch, complement_to_dec_batch)
+        ]
+        return cls(width, codes, values)
+
+    @classmethod
+    def load(cls, path):
+        """Maps a table saved with ``save`` into memory without reading it."""
+        with open(path, 'rb') as file:
+            magic, version, width = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a code table file')
+        code_type, value_type = _dtypes(width)
+        size = 1 << width
+        offset = HEADER.size
+        arrays = []
+        for dtype in [code_type] * 3 + [value_type] * 3:
+            arrays.append(np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(size,)))
+            offset += size * dtype.itemsize
+        return cls(width, arrays[:3], arrays[3:])
+
+    def save(self, path):
+        with open(path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.width))
+            for array in self._codes + self._values:
+                file.write(np.ascontiguousarray(array).tobytes())
+
+    def _index(self, n):
+        index = n + self._offset
+        if not 0 <= index < len(self._codes[0]):
+            raise ValueError(f'{n} does not fit into {self.width} bits')
+        return index
+
+    def _pattern(self, code):
+        # Negative codes would index numpy arrays from the end
+        if not 0 <= code < len(self._values[0]):
+            raise ValueError(f'{code} is not a {self.width}-bit code')
+        return code
+
+    def direct_code(self, n):
+        return int(self._codes[0][self._index(n)])
+
+    def reverse_code(self, n):
+        return int(self._codes[1][self._index(n)])
+
+    def complement_code(self, n):
+        return int(self._codes[2][self._index(n)])
+
+    def encode(self, n):
+        index = self._index(n)
+        return tuple(int(codes[index]) for codes in self._codes)
+
+    def direct_to_dec(self, code):
+        return int(self._values[0][self._pattern(code)])
+
+    def reverse_to_dec(self, code):
+        return int(self._values[1][self._pattern(code)])
+
+    def complement_to_dec(self, code):
+        return int(self._values[2][self._pattern(code)])
+
+    def to_str(self, code):
+        return format(code, f'0{self.width}b')
+
+
+def get_table(width):
+    """Returns the table of the given width, building it on first use."""
+    if width not in _tables:
+        _tables[width] = CodeTable.build(width)
+    return _tables[width]
+
+
+def load_table(path):
+    table = CodeTable.load(path)
+    _tables.setdefault(table.width, table)
+    return table
@@ -0,0 +1,117 @@
+"""
+Fast paths for lib.dec_to_bin and lib.bin_to_dec.
+
+Both work on 8-bit chunks through lookup tables, so a conversion is linear in
+the width, and the most recent results are kept in LRU caches whose hit/miss
+counters are available through cache_info().
+"""
+from functools import lru_cache
+
+CHUNK_BITS = 8
+CACHE_SIZE = 4096
+
+
+def _build_chunks(bits):
+    """All bit strings of the given width in numeric order, so a chunk's index is its value."""
+    chunks = ['']
+    for _ in range(bits):
+        chunks = [chunk + bit for chunk in chunks for bit in '01']
+    return chunks
+
+
+CHUNKS = _build_chunks(CHUNK_BITS)
+CHUNK_VALUES = {chunk: value for value, chunk in enumerate(CHUNKS)}
+# Leading chunks of strings whose length is not a multiple of CHUNK_BITS
+for _width in range(1, CHUNK_BITS):
+    CHUNK_VALUES.update((chunk, value) for value, chunk in enumerate(_build_chunks(_width)))
+_CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+
+def _dec_to_bin(n, bits):
+    if bits <= 0:
+        return ''
+    if n <= 0:
+        return '0' * bits
+    parts = []
+    count = 0
+    while n and count < bits:
+        parts.append(CHUNKS[n & _CHUNK_MASK])
+        n >>= CHUNK_BITS
+        count += CHUNK_BITS
+    binary = ''.join(reversed(parts))
+    if len(binary) < bits:
+        return '0' * (bits - len(binary)) + binary
+    return binary[len(binary) - bits:]
+
+
+def _bin_to_dec(bin_str):
+    dec = 0
+    head = len(bin_str) % CHUNK_BITS
+    try:
+        if head:
+            dec = CHUNK_VALUES[bin_str[:head]]
+        for i in range(head, len(bin_str), CHUNK_BITS):
+            dec = (dec << CHUNK_BITS) | CHUNK_VALUES[bin_str[i:i + CHUNK_BITS]]
+    except KeyError:
+        return _digits_to_dec(bin_str)
+    return dec
+
+
+def _digits_to_dec(bin_str):
+    """The original per-character loop, kept for strings that are not plain '0'/'1'."""
+    dec = 0
+    for bit in bin_str:
+        dec = dec * 2 + int(bit)
+    return dec
+
+
+def _legacy_dec_to_bin(n, bits):
+    """The original per-bit loop, kept for non-int arguments."""
+    if bits == 0:
+        return ''
+    if n == 0:
+        return '0' * bits
+    binary = ''
+    count = 0
+    while n > 0 and count < bits:
+        binary = str(n % 2) + binary
+        n = n // 2
+        count += 1
+    while len(binary) < bits:
+        binary = '0' + binary
+    return binary[-bits:]
+
+
+_cached_dec_to_bin = lru_cache(maxsize=CACHE_SIZE)(_dec_to_bin)
+_cached_bin_to_dec = lru_cache(maxsize=CACHE_SIZE)(_bin_to_dec)
+
+
+def dec_to_bin(n, bits):
+    if type(n) is not int or type(bits) is not int:
+        return _legacy_dec_to_bin(n, bits)
+    return _cached_dec_to_bin(n, bits)
+
+
+def bin_to_dec(bin_str):
+    # Other sequences of bits, such as lists of ints, are cached under their string spelling
+    if type(bin_str) is not str:
+        bin_str = ''.join(str(int(bit)) for bit in bin_str)
+    return _cached_bin_to_dec(bin_str)
+
+
+def set_cache_size(maxsize):
+    """Replaces both caches with empty ones of the given size (0 disables caching, None is unbounded)."""
+    global _cached_dec_to_bin, _cached_bin_to_dec
+    _cached_dec_to_bin = lru_cache(maxsize=maxsize)(_dec_to_bin)
+    _cached_bin_to_dec = lru_cache(maxsize=maxsize)(_bin_to_dec)
+
+
+def cache_info():
+    """Hit/miss counters and sizes of both caches."""
+    return {name: cache.cache_info()._asdict() for name, cache in
+            (('dec_to_bin', _cached_dec_to_bin), ('bin_to_dec', _cached_bin_to_dec))}
+
+
+def cache_clear():
+    _cached_dec_to_bin.cache_clear()
+    _cached_bin_to_dec.cache_clear()
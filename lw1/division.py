@@ -0,0 +1,167 @@
+from fractions import Fraction
+from itertools import islice
+
+RESTORING = 'restoring'
+NON_RESTORING = 'non_restoring'
+NEWTON = 'newton'
+
+NEWTON_MIN_BLOCK = 64
+
+
+class Quotient:
+    """
+    Result of a binary division: ``integer`` and ``precision`` fractional bits
+    packed into ``fraction``, plus the sign of the quotient.
+    """
+    __slots__ = ('negative', 'integer', 'fraction', 'precision')
+
+    def __init__(self, negative, integer, fraction, precision):
+        self.negative = negative
+        self.integer = integer
+        self.fraction = fraction
+        self.precision = precision
+
+    def to_fraction(self):
+        value = Fraction((self.integer << self.precision) | self.fraction, 1 << self.precision)
+        return -value if self.negative else value
+
+    def to_decimal(self, digits=5):
+        """Renders the exact binary value with ``digits`` decimal places, rounding half to even."""
+        scaled = ((self.integer << self.precision) | self.fraction) * 10 ** digits
+        q, r = divmod(scaled, 1 << self.precision)
+        half = 1 << self.precision >> 1
+        if r > half or (r == half and self.precision and q & 1):
+            q += 1
+        text = str(q).rjust(digits + 1, '0')
+        if digits:
+            text = f'{text[:-digits]}.{text[-digits:]}'
+        return f'-{text}' if self.negative and q else text
+
+    def to_binary(self):
+        """Renders the quotient magnitude the way lib.binary_divide does."""
+        text = format(self.integer, 'b')
+        if self.precision:
+            text += '.' + format(self.fraction, f'0{self.precision}b')
+        return text
+
+    def __str__(self):
+        return ('-' if self.negative else '') + self.to_binary()
+
+    def __repr__(self):
+        return f"Quotient('{self}')"
+
+
+def _digits(dividend):
+    return format(dividend, 'b') if dividend else '0'
+
+
+def _dividend_bits(dividend):
+    for digit in _digits(dividend):
+        yield 1 if digit == '1' else 0
+    while True:
+        yield 0
+
+
+def _restoring(dividend, divisor):
+    remainder = 0
+    for bit in _dividend_bits(dividend):
+        remainder = (remainder << 1) | bit
+        if remainder >= divisor:
+            remainder -= divisor
+            yield 1
+        else:
+            yield 0
+
+
+def _non_restoring(dividend, divisor):
+    remainder = 0
+    for bit in _dividend_bits(dividend):
+        if remainder >= 0:
+            remainder = ((remainder << 1) | bit) - divisor
+        else:
+            remainder = ((remainder << 1) | bit) + divisor
+        yield 1 if remainder >= 0 else 0
+
+
+def reciprocal(divisor, precision):
+    """
+    Returns floor(2 ** (n + precision) / divisor), n being the divisor width,
+    computed with Newton-Raphson iterations that double the precision each step.
+    """
+    n = divisor.bit_length()
+    top = min(n, 64)
+    bits = top
+    x = (1 << (2 * top)) // (divisor >> (n - top))
+    while bits < precision:
+        x <<= bits
+        bits *= 2
+        scale = n + bits
+        x += (x * ((1 << scale) - divisor * x)) >> scale
+    x >>= bits - precision
+
+    target = 1 << (n + precision)
+    while x * divisor > target:
+        x -= 1
+    while (x + 1) * divisor <= target:
+        x += 1
+    return x
+
+
+def _newton(dividend, divisor):
+    block = max(NEWTON_MIN_BLOCK, divisor.bit_length())
+    shift = divisor.bit_length() + block
+    inverse = reciprocal(divisor, block)
+    digits = _digits(dividend)
+    remainder = 0
+    pos = 0
+    while True:
+        chunk = digits[pos:pos + block]
+        pos += block
+        partial = (remainder << block) | (int(chunk.ljust(block, '0'), 2) if chunk else 0)
+        q = (partial * inverse) >> shift
+        remainder = partial - q * divisor
+        while remainder >= divisor:
+            q += 1
+            remainder -= divisor
+        while remainder < 0:
+            q -= 1
+            remainder += divisor
+        for digit in format(q, f'0{block}b'):
+            yield 1 if digit == '1' else 0
+
+
+_MODES = {
+    RESTORING: _restoring,
+    NON_RESTORING: _non_restoring,
+    NEWTON: _newton,
+}
+
+
+def quotient_bits(dividend, divisor, mode=RESTORING):
+    """
+    Lazily yields the quotient bits of two non-negative integers.
+
+    The first ``max(1, dividend.bit_length())`` bits form the integer part,
+    every following bit is the next fractional bit.
+    """
+    if divisor <= 0 or dividend < 0:
+        raise ValueError('Division by zero' if divisor == 0 else 'Operands must be non-negative')
+    if mode not in _MODES:
+        raise ValueError(f'Unknown division mode: {mode}')
+    return _MODES[mode](dividend, divisor)
+
+
+def _collect(bits, count):
+    digits = bytearray(48 + bit for bit in islice(bits, count))
+    return int(digits, 2) if digits else 0
+
+
+def divide(a, b, precision=0, mode=RESTORING):
+    if b == 0:
+        raise ValueError('Division by zero')
+    negative = (a < 0) != (b < 0)
+    dividend, divisor = abs(a), abs(b)
+    bits = quotient_bits(dividend, divisor, mode)
+    integer = _collect(bits, len(_digits(dividend)))
+    fraction = _collect(bits, precision)
+    return Quotient(negative, integer, fraction, precision)
@@ -0,0 +1,214 @@
+from fractions import Fraction
+
+import numpy as np
+
+from bitword import BitWord
+
+FLOOR = 'floor'
+TOWARD_ZERO = 'toward_zero'
+NEAREST_EVEN = 'nearest_even'
+NEAREST_AWAY = 'nearest_away'
+
+SATURATE = 'saturate'
+WRAP = 'wrap'
+
+
+class QFormat:
+    """
+    Signed Qm.n fixed-point format: a sign bit, ``integer_bits`` and
+    ``fraction_bits``, stored in complement code. A value is its raw integer
+    divided by 2 ** fraction_bits.
+    """
+    def __init__(self, integer_bits, fraction_bits, name=None):
+        self.integer_bits = integer_bits
+        self.fraction_bits = fraction_bits
+        self.name = name or f'Q{integer_bits}.{fraction_bits}'
+        self.width = 1 + integer_bits + fraction_bits
+        self.min_raw = -(1 << (self.width - 1))
+        self.max_raw = (1 << (self.width - 1)) - 1
+        self.scale = 1 << fraction_bits
+
+    def __eq__(self, other):
+        if not isinstance(other, QFormat):
+            return NotImplemented
+        return (self.integer_bits, self.fraction_bits) == (other.integer_bits, other.fraction_bits)
+
+    def __hash__(self):
+        return hash((self.integer_bits, self.fraction_bits))
+
+    def __repr__(self):
+        return f'QFormat({self.integer_bits}, {self.fraction_bits}, {self.name!r})'
+
+
+Q7 = QFormat(0, 7, 'Q7')
+Q15 = QFormat(0, 15, 'Q15')
+Q31 = QFormat(0, 31, 'Q31')
+Q7_8 = QFormat(7, 8)
+Q15_16 = QFormat(15, 16)
+
+
+def round_quotient(numerator, denominator, rounding=NEAREST_EVEN):
+    """Integer numerator / denominator rounded with the given mode."""
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    q, r = divmod(numerator, denominator)
+    if not r or rounding == FLOOR:
+        return q
+    if rounding == TOWARD_ZERO:
+        return q + 1 if numerator < 0 else q
+    twice = 2 * r
+    if rounding == NEAREST_EVEN:
+        return q + 1 if twice > denominator or (twice == denominator and q & 1) else q
+    if rounding == NEAREST_AWAY:
+        return q + 1 if twice > denominator or (twice == denominator and numerator >= 0) else q
+    raise ValueError(f'Unknown rounding mode: {rounding}')
+
+
+def fit(raw, fmt, overflow=SATURATE):
+    """Brings a raw value into the format range, returns (raw, overflowed)."""
+    if fmt.min_raw <= raw <= fmt.max_raw:
+        return raw, False
+    if overflow == SATURATE:
+        return (fmt.max_raw if raw > 0 else fmt.min_raw), True
+    if overflow == WRAP:
+        return BitWord(raw, fmt.width).to_complement(), True
+    raise ValueError(f'Unknown overflow mode: {overflow}')
+
+
+def from_fraction(x, fmt, rounding=NEAREST_EVEN, overflow=SATURATE):
+    """Quantizes an exact value (int, float, Fraction or decimal string) to a raw value."""
+    x = Fraction(x)
+    return fit(round_quotient(x.numerator * fmt.scale, x.denominator, rounding), fmt, overflow)[0]
+
+
+def from_float(x, fmt, rounding=NEAREST_EVEN, overflow=SATURATE):
+    return from_fraction(float(x), fmt, rounding, overflow)
+
+
+def to_fraction(raw, fmt):
+    return Fraction(raw, fmt.scale)
+
+
+def to_float(raw, fmt):
+    return raw / fmt.scale
+
+
+def to_word(raw, fmt):
+    return BitWord.from_complement(raw, fmt.width)
+
+
+def from_word(word):
+    return word.to_complement()
+
+
+def to_string(raw, fmt):
+    """Complement code of the value with a point before the fraction bits."""
+    bits = str(to_word(raw, fmt))
+    return f'{bits[:fmt.width - fmt.fraction_bits]}.{bits[fmt.width - fmt.fraction_bits:]}' if fmt.fraction_bits else bits
+
+
+def add(a, b, fmt, overflow=SATURATE):
+    return fit(a + b, fmt, overflow)
+
+
+def subtract(a, b, fmt, overflow=SATURATE):
+    return fit(a - b, fmt, overflow)
+
+
+def multiply(a, b, fmt, rounding=NEAREST_EVEN, overflow=SATURATE):
+    """The exact product has 2n fraction bits, it is rounded back to n."""
+    return fit(round_quotient(a * b, fmt.scale, rounding), fmt, overflow)
+
+
+def divide(a, b, fmt, rounding=NEAREST_EVEN, overflow=SATURATE):
+    if b == 0:
+        raise ValueError('Division by zero')
+    return fit(round_quotient(a * fmt.scale, b, rounding), fmt, overflow)
+
+
+def _check_batch(fmt):
+    if fmt.width > 32:
+        raise ValueError('Batch fixed-point arithmetic supports at most 32 bits')
+
+
+def round_quotient_batch(numerator, denominator, rounding=NEAREST_EVEN):
+    """Vectorized round_quotient over int64 arrays."""
+    numerator = np.asarray(numerator, dtype=np.int64)
+    denominator = np.asarray(denominator, dtype=np.int64)
+    negative = denominator < 0
+    numerator = np.where(negative, -numerator, numerator)
+    denominator = np.where(negative, -denominator, denominator)
+    q, r = np.divmod(numerator, denominator)
+    if rounding == FLOOR:
+        return q
+    if rounding == TOWARD_ZERO:
+        return q + ((r != 0) & (numerator < 0))
+    twice = 2 * r
+    if rounding == NEAREST_EVEN:
+        return q + ((twice > denominator) | ((twice == denominator) & (q & 1 == 1)))
+    if rounding == NEAREST_AWAY:
+        return q + ((twice > denominator) | ((twice == denominator) & (numerator >= 0)))
+    raise ValueError(f'Unknown rounding mode: {rounding}')
+
+
+def fit_batch(raw, fmt, overflow=SATURATE):
+    raw = np.asarray(raw, dtype=np.int64)
+    overflowed = (raw < fmt.min_raw) | (raw > fmt.max_raw)
+    if overflow == SATURATE:
+        return np.clip(raw, fmt.min_raw, fmt.max_raw), overflowed
+    if overflow == WRAP:
+        return ((raw - fmt.min_raw) & ((1 << fmt.width) - 1)) + fmt.min_raw, overflowed
+    raise ValueError(f'Unknown overflow mode: {overflow}')
+
+
+def from_float_batch(values, fmt, rounding=NEAREST_EVEN, overflow=SATURATE):
+    """Quantizes a float array. Scaling by a power of two is exact, so only the final rounding is inexact."""
+    _check_batch(fmt)
+    values = np.asarray(values, dtype=np.float64)
+    if not np.isfinite(values).all():
+        raise ValueError('Cannot quantize NaN or infinity')
+    # Both reductions are exact and keep the scaled values inside the int64 range
+    period = 2.0 ** (fmt.integer_bits + 1)
+    values = np.fmod(values, period) if overflow == WRAP else np.clip(values, -period, period)
+    scaled = np.ldexp(values, fmt.fraction_bits)
+    if rounding == FLOOR:
+        rounded = np.floor(scaled)
+    elif rounding == TOWARD_ZERO:
+        rounded = np.trunc(scaled)
+    elif rounding == NEAREST_EVEN:
+        rounded = np.rint(scaled)
+    elif rounding == NEAREST_AWAY:
+        magnitude = np.abs(scaled)
+        floor = np.floor(magnitude)
+        rounded = np.copysign(floor + (magnitude - floor >= 0.5), scaled)
+    else:
+        raise ValueError(f'Unknown rounding mode: {rounding}')
+    return fit_batch(rounded.astype(np.int64), fmt, overflow)[0]
+
+
+def to_float_batch(raw, fmt):
+    return np.ldexp(np.asarray(raw, dtype=np.int64).astype(np.float64), -fmt.fraction_bits)
+
+
+def add_batch(a, b, fmt, overflow=SATURATE):
+    _check_batch(fmt)
+    return fit_batch(np.asarray(a, dtype=np.int64) + np.asarray(b, dtype=np.int64), fmt, overflow)
+
+
+def subtract_batch(a, b, fmt, overflow=SATURATE):
+    _check_batch(fmt)
+    return fit_batch(np.asarray(a, dtype=np.int64) - np.asarray(b, dtype=np.int64), fmt, overflow)
+
+
+def multiply_batch(a, b, fmt, rounding=NEAREST_EVEN, overflow=SATURATE):
+    _check_batch(fmt)
+    product = np.asarray(a, dtype=np.int64) * np.asarray(b, dtype=np.int64)
+    return fit_batch(round_quotient_batch(product, fmt.scale, rounding), fmt, overflow)
+
+
+def divide_batch(a, b, fmt, rounding=NEAREST_EVEN, overflow=SATURATE):
+    _check_batch(fmt)
+    b = np.asarray(b, dtype=np.int64)
+    if (b == 0).any():
+        raise ValueError('Division by zero')
+    return fit_batch(round_quotient_batch(np.asarray(a, dtype=np.int64) * fmt.scale, b, rounding), fmt, overflow)
@@ -1,23 +1,15 @@
+import conversion
+import softfloat_scalar
+from softfloat_scalar import BINARY32
+
+# Set by alu_trace.tracing(); every instrumented function checks it once per call
+_tracer = None
+
 def dec_to_bin(n, bits):
-    if bits == 0:
-        return ''
-    if n == 0:
-        return '0' * bits
-    binary = ''
-    count = 0
-    while n > 0 and count < bits:
-        binary = str(n % 2) + binary
-        n = n // 2
-        count += 1
-    while len(binary) < bits:
-        binary = '0' + binary
-    return binary[-bits:]
+    return conversion.dec_to_bin(n, bits)
 
 def bin_to_dec(bin_str):
-    dec = 0
-    for bit in bin_str:
-        dec = dec * 2 + int(bit)
-    return dec
+    return conversion.bin_to_dec(bin_str)
 
 def direct_code(n, bits):
     if n >= 0:
@@ -63,10 +55,15 @@ def add_binary(a, b):
     b = b.zfill(max_len)
     carry = 0
     result = []
+    tracer = _tracer
     for i in reversed(range(max_len)):
         s = int(a[i]) + int(b[i]) + carry
         result.append(str(s % 2))
+        if tracer is not None:
+            tracer.step('add_binary', 'full_add', i, (int(a[i]), int(b[i]), carry), (s % 2, s // 2))
         carry = s // 2
+    if tracer is not None:
+        tracer.end('add_binary')
     if carry:
         result.append('1')
     return ''.join(reversed(result)), carry
@@ -111,10 +108,15 @@ def binary_add(a, b):
     b = b.zfill(max_len)
     carry = 0
     result = []
+    tracer = _tracer
     for i in reversed(range(max_len)):
         s = int(a[i]) + int(b[i]) + carry
         result.append(str(s % 2))
+        if tracer is not None:
+            tracer.step('binary_add', 'full_add', i, (int(a[i]), int(b[i]), carry), (s % 2, s // 2))
         carry = s // 2
+    if tracer is not None:
+        tracer.end('binary_add')
     if carry:
         result.append('1')
     return ''.join(reversed(result))
@@ -125,7 +127,9 @@ def binary_subtract(a, b):
     b = b.zfill(max_len)
     result = []
     borrow = 0
+    tracer = _tracer
     for i in reversed(range(max_len)):
+        borrow_in = borrow
         a_val = int(a[i]) - borrow
         b_val = int(b[i])
         if a_val < b_val:
@@ -134,6 +138,10 @@ def binary_subtract(a, b):
         else:
             borrow = 0
         result.append(str(a_val - b_val))
+        if tracer is not None:
+            tracer.step('binary_subtract', 'full_sub', i, (int(a[i]), b_val, borrow_in), (a_val - b_val, borrow))
+    if tracer is not None:
+        tracer.end('binary_subtract')
     return ''.join(reversed(result)).lstrip('0') or '0'
 
 def binary_multiply(a_bin, b_bin):
@@ -151,16 +159,23 @@ def binary_divide(a_bin, b_bin, precision):
     quotient = ''
     current = ''
     divisor = b_bin.lstrip('0') or '0'
+    tracer = _tracer
 
-    for bit in a_bin:
+    for i, bit in enumerate(a_bin):
         current += bit
         current = current.lstrip('0') or '0'
+        if tracer is not None:
+            tracer.step('binary_divide', 'shift', i, (int(bit),), (current,))
         if binary_compare(current, divisor) >= 0:
             quotient += '1'
             current = binary_subtract(current, divisor)
             current = current.lstrip('0') or '0'
+            if tracer is not None:
+                tracer.step('binary_divide', 'subtract', i, (divisor,), (1, current))
         else:
             quotient += '0'
+            if tracer is not None:
+                tracer.step('binary_divide', 'skip', i, (divisor,), (0, current))
 
     quotient = quotient.lstrip('0') or '0'
     if '.' in quotient:
@@ -168,15 +183,23 @@ def binary_divide(a_bin, b_bin, precision):
 
     if precision > 0:
         quotient += '.' if '.' not in quotient else ''
-        for _ in range(precision):
+        for i in range(-1, -precision - 1, -1):
             current += '0'
+            if tracer is not None:
+                tracer.step('binary_divide', 'shift', i, (0,), (current,))
             if binary_compare(current, divisor) >= 0:
                 quotient += '1'
                 current = binary_subtract(current, divisor)
                 current = current.lstrip('0') or '0'
+                if tracer is not None:
+                    tracer.step('binary_divide', 'subtract', i, (divisor,), (1, current))
             else:
                 quotient += '0'
+                if tracer is not None:
+                    tracer.step('binary_divide', 'skip', i, (divisor,), (0, current))
 
+    if tracer is not None:
+        tracer.end('binary_divide')
     return quotient if quotient != '' else '0'
 
 def direct_to_dec(binary_str):
@@ -223,110 +246,60 @@ def divide_direct(a_dec, b_dec, bits=16, precision=5):
 
     return result_bin, round(dec, 5)
 
-def float_to_ieee(f):
-    if f == 0:
-        return '0' * 32
-
-    sign = '1' if f < 0 else '0'
-    f = abs(f)
-
-    exp = 0
-    if f >= 2.0:
-        while f >= 2.0:
-            f /= 2
-            exp += 1
-    elif f < 1.0:
-        while f < 1.0:
-            f *= 2
-            exp -= 1
-    exp += 127
-
-    f -= 1.0
-    mantissa = []
-    for _ in range(23):
-        f *= 2
-        if f >= 1.0:
-            mantissa.append('1')
-            f -= 1.0
-        else:
-            mantissa.append('0')
-
-    return f"{sign}{exp:08b}{''.join(mantissa)}"
-
-def add_ieee(a_dec, b_dec):
-    def parse_ieee(ieee):
-        sign = ieee[0]
-        exponent = int(ieee[1:9], 2)
-        mantissa_bits = ieee[9:]
-        mantissa = 1.0 if exponent != 0 else 0.0
-        for i, bit in enumerate(mantissa_bits):
-            mantissa += int(bit) * 2**(-i-1)
-        return sign, exponent, mantissa, mantissa_bits
-
-    def align_mantissas(sign1, exp1, mant1, sign2, exp2, mant2):
-        if exp1 < exp2:
-            return align_mantissas(sign2, exp2, mant2, sign1, exp1, mant1)
-
-        diff = exp1 - exp2
-        if diff > 0:
-            mant2_adjusted = mant2 / (2**diff)
-            exp2_adjusted = exp1
-        else:
-            mant2_adjusted = mant2
-            exp2_adjusted = exp2
-
-        return (sign1, exp1, mant1, sign2, exp2_adjusted, mant2_adjusted)
-
-    def pack_ieee(sign, exponent, mantissa):
-        if mantissa == 0:
-            return '0' * 32
-
-        original_sign = sign
-        mantissa = abs(mantissa)
-
-        while mantissa >= 2.0:
-            mantissa /= 2
-            exponent += 1
-        while mantissa < 1.0 and exponent > 0:
-            mantissa *= 2
-            exponent -= 1
-
-        if exponent <= 0:
-            exponent = 0
-            mantissa /= 2**(-exponent + 1)
-
-        mantissa -= 1.0
-        mantissa_bits = []
-        for _ in range(23):
-            mantissa *= 2
-            if mantissa >= 1.0:
-                mantissa_bits.append('1')
-                mantissa -= 1.0
-            else:
-                mantissa_bits.append('0')
-
-        exponent = max(0, min(exponent, 255))
-        return f"{original_sign}{exponent:08b}{''.join(mantissa_bits)}"
-
-    a_ieee = float_to_ieee(a_dec)
-    b_ieee = float_to_ieee(b_dec)
-
-    sign_a, exp_a, mant_a, _ = parse_ieee(a_ieee)
-    sign_b, exp_b, mant_b, _ = parse_ieee(b_ieee)
-
-    sign1, exp, mant1, sign2, exp, mant2 = align_mantissas(
-        sign_a, exp_a, mant_a,
-        sign_b, exp_b, mant_b
-    )
-
-    mant1 = mant1 if sign1 == '0' else -mant1
-    mant2 = mant2 if sign2 == '0' else -mant2
-
-    result_mant = mant1 + mant2
-    result_sign = '0' if result_mant >= 0 else '1'
-
-    result_ieee = pack_ieee(result_sign, exp, abs(result_mant))
-    decoded = (-1 if result_sign == '1' else 1) * abs(result_mant) * (2**(exp - 127))
-
-    return result_ieee, decoded
+def _encode_ieee(x, fmt):
+    # Floats are exact rationals already; ints, Fractions and decimal strings are rounded exactly too
+    if isinstance(x, float):
+        return softfloat_scalar.from_float(x, fmt)
+    return softfloat_scalar.from_fraction(x, fmt)
+
+def _decode_ieee(bits, fmt):
+    # Formats wider than binary64 decode to an exact Fraction when finite
+    if softfloat_scalar._fits_binary64(fmt) or softfloat_scalar.is_nan(bits, fmt) or \
+            softfloat_scalar.is_inf(bits, fmt):
+        return softfloat_scalar.to_float(bits, fmt)
+    return softfloat_scalar.to_fraction(bits, fmt)
+
+def _exponent(bits, fmt):
+    # Unbiased exponent of a finite non-zero pattern, None for zeros, infinities and NaN
+    _, exponent, fraction = softfloat_scalar.unpack(bits, fmt)
+    if exponent == 0 and fraction == 0 or softfloat_scalar.is_nan(bits, fmt) or softfloat_scalar.is_inf(bits, fmt):
+        return None
+    return max(exponent, 1) - fmt.bias
+
+def _trace_normalize(tracer, operation, start, stop):
+    # One step per shift of the significand, from exponent start to stop
+    step = 1 if stop > start else -1
+    for exponent in range(start + step, stop + step, step):
+        tracer.step(operation, 'normalize', exponent, (step,), (exponent,))
+
+def float_to_ieee(f, fmt=BINARY32):
+    tracer = _tracer
+    try:
+        bits = _encode_ieee(f, fmt)
+        exponent = _exponent(bits, fmt)
+        if tracer is not None and exponent is not None:
+            _trace_normalize(tracer, 'float_to_ieee', 0, exponent)
+        return softfloat_scalar.to_string(bits, fmt)
+    finally:
+        if tracer is not None:
+            tracer.end('float_to_ieee')
+
+def add_ieee(a_dec, b_dec, fmt=BINARY32):
+    tracer = _tracer
+    try:
+        a = int(float_to_ieee(a_dec, fmt), 2)
+        b = int(float_to_ieee(b_dec, fmt), 2)
+        result = softfloat_scalar.add(a, b, fmt)
+        if tracer is not None:
+            exponents = sorted((e for e in (_exponent(a, fmt), _exponent(b, fmt)) if e is not None), reverse=True)
+            if len(exponents) == 2:
+                tracer.step('add_ieee', 'align', 0, tuple(exponents), (exponents[0] - exponents[1],))
+            result_exponent = _exponent(result, fmt)
+            if exponents and result_exponent is not None:
+                _trace_normalize(tracer, 'pack_ieee', exponents[0], result_exponent)
+            tracer.end('pack_ieee')
+        return softfloat_scalar.to_string(result, fmt), _decode_ieee(result, fmt)
+    finally:
+        if tracer is not None:
+            tracer.end('add_ieee')
 
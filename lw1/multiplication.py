@@ -0,0 +1,134 @@
+from bitword import BitWord
+
+SCHOOLBOOK = 'schoolbook'
+KARATSUBA = 'karatsuba'
+TOOM3 = 'toom3'
+
+LIMB_BITS = 32
+LIMB_MASK = (1 << LIMB_BITS) - 1
+
+# Operand widths (in bits) from which the faster splitting strategies pay off
+KARATSUBA_THRESHOLD = 1024
+TOOM3_THRESHOLD = 4096
+
+
+def choose_strategy(width):
+    if width >= TOOM3_THRESHOLD:
+        return TOOM3
+    if width >= KARATSUBA_THRESHOLD:
+        return KARATSUBA
+    return SCHOOLBOOK
+
+
+def multiply(a, b, strategy=None):
+    """Multiplies two integers of any sign and width with the given strategy."""
+    negative = (a < 0) != (b < 0)
+    a, b = abs(a), abs(b)
+    if strategy is None:
+        strategy = choose_strategy(max(a.bit_length(), b.bit_length()))
+    product = _STRATEGIES[strategy](a, b)
+    return -product if negative else product
+
+
+def _to_limbs(n):
+    limbs = []
+    while n:
+        limbs.append(n & LIMB_MASK)
+        n >>= LIMB_BITS
+    return limbs
+
+
+def _schoolbook(a, b):
+    a_limbs = _to_limbs(a)
+    b_limbs = _to_limbs(b)
+    if not a_limbs or not b_limbs:
+        return 0
+    result = [0] * (len(a_limbs) + len(b_limbs))
+    for i, x in enumerate(a_limbs):
+        if not x:
+            continue
+        carry = 0
+        for j, y in enumerate(b_limbs):
+            t = result[i + j] + x * y + carry
+            result[i + j] = t & LIMB_MASK
+            carry = t >> LIMB_BITS
+        result[i + len(b_limbs)] += carry
+    product = 0
+    for limb in reversed(result):
+        product = (product << LIMB_BITS) | limb
+    return product
+
+
+def _karatsuba(a, b):
+    k = max(a.bit_length(), b.bit_length()) // 2
+    if k == 0:
+        return a * b
+    mask = (1 << k) - 1
+    a1, a0 = a >> k, a & mask
+    b1, b0 = b >> k, b & mask
+    z0 = multiply(a0, b0)
+    z2 = multiply(a1, b1)
+    z1 = multiply(a0 + a1, b0 + b1) - z0 - z2
+    return (z2 << (2 * k)) + (z1 << k) + z0
+
+
+def _toom3(a, b):
+    k = (max(a.bit_length(), b.bit_length()) + 2) // 3
+    if k == 0:
+        return a * b
+    mask = (1 << k) - 1
+    a0, a1, a2 = a & mask, (a >> k) & mask, a >> (2 * k)
+    b0, b1, b2 = b & mask, (b >> k) & mask, b >> (2 * k)
+
+    # Evaluation at 0, 1, -1, -2 and infinity
+    p = a0 + a2
+    q = b0 + b2
+    pm1, qm1 = p - a1, q - b1
+    r0 = multiply(a0, b0)
+    r1 = multiply(p + a1, q + b1)
+    rm1 = multiply(pm1, qm1)
+    rm2 = multiply(((pm1 + a2) << 1) - a0, ((qm1 + b2) << 1) - b0)
+    rinf = multiply(a2, b2)
+
+    # Bodrato interpolation sequence
+    c3 = (rm2 - r1) // 3
+    c1 = (r1 - rm1) >> 1
+    c2 = rm1 - r0
+    c3 = ((c2 - c3) >> 1) + (rinf << 1)
+    c2 = c2 + c1 - rinf
+    c1 = c1 - c3
+
+    return (rinf << (4 * k)) + (c3 << (3 * k)) + (c2 << (2 * k)) + (c1 << k) + r0
+
+
+_STRATEGIES = {
+    SCHOOLBOOK: _schoolbook,
+    KARATSUBA: _karatsuba,
+    TOOM3: _toom3,
+}
+
+
+def multiply_words(a, b, width=None, code='complement', strategy=None):
+    """
+    Multiplies two direct-code or complement-code words.
+
+    Returns the product encoded in ``width`` bits (double width by default)
+    and a flag telling whether the product does not fit into that width.
+    """
+    if code == 'complement':
+        product = multiply(a.to_complement(), b.to_complement(), strategy)
+        encode = BitWord.from_complement
+    elif code == 'direct':
+        product = multiply(a.to_direct(), b.to_direct(), strategy)
+        encode = BitWord.from_direct
+    else:
+        raise ValueError(f'Unknown code: {code}')
+
+    if width is None:
+        width = a.width + b.width
+    limit = 1 << (width - 1)
+    if code == 'complement':
+        overflow = not -limit <= product < limit
+    else:
+        overflow = abs(product) >= limit
+    return encode(product, width), overflow
@@ -0,0 +1,130 @@
+"""
+Array versions of the softfloat_scalar operations, built on NumPy.
+
+The scalar API is re-exported, so softfloat stays the single entry point.
+"""
+import numpy as np
+
+from batch_codes import code_dtype
+from softfloat_scalar import (FloatFormat, BINARY16, BINARY32, BINARY64, BINARY128, BFLOAT16, FLOAT8_E4M3FN,
+                              FLOAT8_E5M2, pack, unpack, to_string, is_nan, is_inf, infinity, _decode, round_pack,
+                              from_float, from_fraction, to_fraction, to_float, _fits_binary64, add, subtract,
+                              multiply, divide, fma)
+
+
+_NUMPY_TYPES = {
+    BINARY16: np.float16,
+    BINARY32: np.float32,
+    BINARY64: np.float64,
+}
+
+
+def bits_dtype(fmt):
+    """Unsigned dtype holding the patterns, object (Python ints) for formats wider than 64 bits."""
+    return code_dtype(fmt.width) if fmt.width <= 64 else np.dtype(object)
+
+
+def encode_array(values, fmt=BINARY32):
+    """
+    Rounds an array of floats into the format, ties to even, and returns the
+    bit patterns. Formats that fit inside binary64 are rounded with whole-array
+    integer operations on the binary64 fields.
+    """
+    x = np.asarray(values, dtype=np.float64)
+    if fmt in _NUMPY_TYPES:
+        with np.errstate(over='ignore', invalid='ignore'):
+            return x.astype(_NUMPY_TYPES[fmt]).view(bits_dtype(fmt))
+    if not _fits_binary64(fmt):
+        return np.array([from_float(v, fmt) for v in x.ravel().tolist()], dtype=object).reshape(x.shape)
+
+    source = x.view(np.uint64)
+    sign = (source >> np.uint64(63)).astype(np.int64)
+    biased = ((source >> np.uint64(52)) & np.uint64(0x7ff)).astype(np.int64)
+    significand = (source & np.uint64((1 << 52) - 1)).astype(np.int64)
+    significand = np.where(biased == 0, significand, significand | (1 << 52))
+    exponent = np.maximum(biased, 1) - 1075
+    top = exponent + np.frexp(significand.astype(np.float64))[1] - 1
+
+    lsb = np.maximum(top, 1 - fmt.bias) - fmt.fraction_bits
+    shift = lsb - exponent
+    right = np.clip(shift, 1, 55)
+    mantissa = np.where(shift > 0, significand >> right, significand << np.clip(-shift, 0, 52))
+    guard = np.where(shift > 0, (significand >> (right - 1)) & 1, 0)
+    rest = np.where(shift > 0, significand & ((1 << (right - 1)) - 1), 0) != 0
+    mantissa += guard & (rest | (mantissa & 1))
+    carry = mantissa >> fmt.precision
+    mantissa >>= carry
+    lsb += carry
+
+    fraction = mantissa & fmt.fraction_mask
+    normal = (mantissa >> fmt.fraction_bits) != 0
+    field = lsb + fmt.fraction_bits + fmt.bias
+    overflow = normal & (field >= fmt.max_exponent)
+    if fmt.finite:
+        overflow &= (field > fmt.max_exponent) | (fraction == fmt.fraction_mask)
+    result = (sign << (fmt.width - 1)) | (np.where(normal, field, 0) << fmt.fraction_bits) | fraction
+    result = np.where(overflow | np.isinf(x), _infinity_array(sign, fmt), result)
+    result = np.where(significand == 0, sign << (fmt.width - 1), result)
+    result = np.where(np.isnan(x), fmt.quiet_nan, result)
+    return result.astype(bits_dtype(fmt))
+
+
+def _infinity_array(sign, fmt):
+    return np.where(sign == 1, infinity(1, fmt), infinity(0, fmt))
+
+
+def decode_array(bits, fmt=BINARY32):
+    """Converts an array of bit patterns to the nearest float64 values."""
+    if fmt in _NUMPY_TYPES:
+        return np.asarray(bits).astype(bits_dtype(fmt)).view(_NUMPY_TYPES[fmt]).astype(np.float64)
+    if not _fits_binary64(fmt):
+        bits = np.asarray(bits, dtype=object)
+        return np.array([to_float(int(b), fmt) for b in bits.ravel()], dtype=np.float64).reshape(bits.shape)
+
+    bits = np.asarray(bits).astype(np.int64)
+    sign = bits >> (fmt.width - 1)
+    biased = (bits >> fmt.fraction_bits) & fmt.max_exponent
+    fraction = bits & fmt.fraction_mask
+    significand = np.where(biased == 0, fraction, fraction | (1 << fmt.fraction_bits))
+    value = np.ldexp(significand.astype(np.float64), np.maximum(biased, 1) - fmt.bias - fmt.fraction_bits)
+    special = biased == fmt.max_exponent
+    if fmt.finite:
+        value = np.where(special & (fraction == fmt.fraction_mask), np.nan, value)
+    else:
+        value = np.where(special, np.where(fraction == 0, np.inf, np.nan), value)
+    return np.where(sign == 1, -value, value)
+
+
+def as_bits(array, fmt=BINARY32):
+    """Returns the bit patterns of a float array, or the array itself if it already holds patterns."""
+    array = np.asarray(array)
+    if array.dtype.kind == 'f':
+        return encode_array(array, fmt)
+    return array.astype(bits_dtype(fmt))
+
+
+def _batch(operation, fmt, *arrays):
+    operands = np.broadcast_arrays(*(as_bits(array, fmt) for array in arrays))
+    columns = [operand.ravel().tolist() for operand in operands]
+    result = [operation(*values, fmt) for values in zip(*columns)]
+    return np.array(result, dtype=bits_dtype(fmt)).reshape(operands[0].shape)
+
+
+def add_batch(a, b, fmt=BINARY32):
+    return _batch(add, fmt, a, b)
+
+
+def subtract_batch(a, b, fmt=BINARY32):
+    return _batch(subtract, fmt, a, b)
+
+
+def multiply_batch(a, b, fmt=BINARY32):
+    return _batch(multiply, fmt, a, b)
+
+
+def divide_batch(a, b, fmt=BINARY32):
+    return _batch(divide, fmt, a, b)
+
+
+def fma_batch(a, b, c, fmt=BINARY32):
+    return _batch(fma, fmt, a, b, c)
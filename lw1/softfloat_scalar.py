@@ -0,0 +1,303 @@
+"""
+IEEE-754 style binary formats and exact scalar arithmetic on their bit patterns.
+
+Patterns are Python ints and every operation rounds once, to nearest with ties
+to even. Kept free of NumPy so that lib can use it; softfloat adds the array
+versions.
+"""
+import math
+from fractions import Fraction
+
+
+class FloatFormat:
+    """
+    Layout of an IEEE-754 style binary format.
+
+    Attributes:
+        exponent_bits (int): Width of the biased exponent field.
+        fraction_bits (int): Width of the trailing significand field.
+        finite (bool): The format has no infinities and the all-ones exponent
+            holds normal numbers, only the all-ones pattern is NaN (FP8 E4M3FN).
+    """
+    def __init__(self, exponent_bits, fraction_bits, name=None, finite=False):
+        self.exponent_bits = exponent_bits
+        self.fraction_bits = fraction_bits
+        self.finite = finite
+        self.name = name or f'e{exponent_bits}m{fraction_bits}' + ('fn' if finite else '')
+        self.width = 1 + exponent_bits + fraction_bits
+        self.precision = fraction_bits + 1
+        self.bias = (1 << (exponent_bits - 1)) - 1
+        self.max_exponent = (1 << exponent_bits) - 1
+        self.fraction_mask = (1 << fraction_bits) - 1
+        if finite:
+            self.quiet_nan = (self.max_exponent << fraction_bits) | self.fraction_mask
+            self.infinity = None
+        else:
+            self.quiet_nan = (self.max_exponent << fraction_bits) | (1 << (fraction_bits - 1))
+            self.infinity = self.max_exponent << fraction_bits
+
+    def __eq__(self, other):
+        if not isinstance(other, FloatFormat):
+            return NotImplemented
+        return (self.exponent_bits, self.fraction_bits, self.finite) == \
+            (other.exponent_bits, other.fraction_bits, other.finite)
+
+    def __hash__(self):
+        return hash((self.exponent_bits, self.fraction_bits, self.finite))
+
+    def __repr__(self):
+        finite = ', finite=True' if self.finite else ''
+        return f'FloatFormat({self.exponent_bits}, {self.fraction_bits}, {self.name!r}{finite})'
+
+
+BINARY16 = FloatFormat(5, 10, 'binary16')
+BINARY32 = FloatFormat(8, 23, 'binary32')
+BINARY64 = FloatFormat(11, 52, 'binary64')
+BINARY128 = FloatFormat(15, 112, 'binary128')
+BFLOAT16 = FloatFormat(8, 7, 'bfloat16')
+FLOAT8_E4M3FN = FloatFormat(4, 3, 'float8_e4m3fn', finite=True)
+FLOAT8_E5M2 = FloatFormat(5, 2, 'float8_e5m2')
+
+
+def pack(sign, exponent, fraction, fmt=BINARY32):
+    return (sign << (fmt.width - 1)) | (exponent << fmt.fraction_bits) | fraction
+
+
+def unpack(bits, fmt=BINARY32):
+    sign = bits >> (fmt.width - 1)
+    exponent = (bits >> fmt.fraction_bits) & fmt.max_exponent
+    return sign, exponent, bits & fmt.fraction_mask
+
+
+def to_string(bits, fmt=BINARY32):
+    return format(bits, f'0{fmt.width}b')
+
+
+def is_nan(bits, fmt=BINARY32):
+    _, exponent, fraction = unpack(bits, fmt)
+    if fmt.finite:
+        return exponent == fmt.max_exponent and fraction == fmt.fraction_mask
+    return exponent == fmt.max_exponent and fraction != 0
+
+
+def is_inf(bits, fmt=BINARY32):
+    _, exponent, fraction = unpack(bits, fmt)
+    return not fmt.finite and exponent == fmt.max_exponent and fraction == 0
+
+
+def infinity(sign, fmt=BINARY32):
+    """Signed infinity, or NaN in formats without infinities."""
+    if fmt.finite:
+        return pack(sign, fmt.max_exponent, fmt.fraction_mask, fmt)
+    return pack(sign, fmt.max_exponent, 0, fmt)
+
+
+def _decode(bits, fmt):
+    """Returns (sign, significand, exponent) so that the value is significand * 2 ** exponent."""
+    sign, exponent, fraction = unpack(bits, fmt)
+    if exponent == 0:
+        return sign, fraction, 1 - fmt.bias - fmt.fraction_bits
+    return sign, fraction | (1 << fmt.fraction_bits), exponent - fmt.bias - fmt.fraction_bits
+
+
+def round_pack(sign, significand, exponent, fmt=BINARY32):
+    """
+    Rounds the exact value (-1) ** sign * significand * 2 ** exponent to the
+    nearest representable number, ties to even, and packs it.
+    """
+    if significand == 0:
+        return pack(sign, 0, 0, fmt)
+
+    top = exponent + significand.bit_length() - 1
+    emin = 1 - fmt.bias
+    lsb = max(top, emin) - fmt.fraction_bits
+    shift = lsb - exponent
+
+    if shift <= 0:
+        mantissa = significand << -shift
+    else:
+        mantissa = significand >> shift
+        guard = (significand >> (shift - 1)) & 1
+        round_bit = (significand >> (shift - 2)) & 1 if shift >= 2 else 0
+        sticky = shift >= 3 and significand & ((1 << (shift - 2)) - 1) != 0
+        if guard and (round_bit or sticky or mantissa & 1):
+            mantissa += 1
+            if mantissa >> fmt.precision:
+                mantissa >>= 1
+                lsb += 1
+
+    if mantissa >> fmt.fraction_bits:
+        biased = lsb + fmt.fraction_bits + fmt.bias
+        fraction = mantissa & fmt.fraction_mask
+        if biased > fmt.max_exponent or biased == fmt.max_exponent and \
+                (not fmt.finite or fraction == fmt.fraction_mask):
+            return infinity(sign, fmt)
+        return pack(sign, biased, fraction, fmt)
+    return pack(sign, 0, mantissa, fmt)
+
+
+def from_float(x, fmt=BINARY32):
+    x = float(x)
+    sign = 1 if math.copysign(1.0, x) < 0 else 0
+    if math.isnan(x):
+        return fmt.quiet_nan
+    if math.isinf(x):
+        return infinity(sign, fmt)
+    numerator, denominator = abs(x).as_integer_ratio()
+    return round_pack(sign, numerator, 1 - denominator.bit_length(), fmt)
+
+
+def from_fraction(x, fmt=BINARY32):
+    """Rounds an exact rational (int, Fraction or decimal string) into the format."""
+    x = Fraction(x)
+    sign = 1 if x < 0 else 0
+    numerator, denominator = abs(x.numerator), x.denominator
+    if numerator == 0:
+        return pack(0, 0, 0, fmt)
+    # Quotient bits for the significand plus guard and round, then the sticky bit
+    shift = max(0, fmt.precision + 2 + denominator.bit_length() - numerator.bit_length())
+    quotient, remainder = divmod(numerator << shift, denominator)
+    quotient = (quotient << 1) | (remainder != 0)
+    return round_pack(sign, quotient, -shift - 1, fmt)
+
+
+def to_fraction(bits, fmt=BINARY32):
+    """Exact value of a finite pattern."""
+    if is_nan(bits, fmt) or is_inf(bits, fmt):
+        raise ValueError(f'{to_string(bits, fmt)} is not a finite {fmt.name} number')
+    sign, significand, exponent = _decode(bits, fmt)
+    value = Fraction(significand << exponent) if exponent >= 0 else Fraction(significand, 1 << -exponent)
+    return -value if sign else value
+
+
+def to_float(bits, fmt=BINARY32):
+    """Nearest Python float, formats wider than binary64 are rounded once through the exact fraction."""
+    if is_nan(bits, fmt):
+        return math.nan
+    sign = unpack(bits, fmt)[0]
+    if is_inf(bits, fmt):
+        value = math.inf
+    elif _fits_binary64(fmt):
+        _, significand, exponent = _decode(bits, fmt)
+        value = math.ldexp(significand, exponent)
+    else:
+        try:
+            value = float(abs(to_fraction(bits, fmt)))
+        except OverflowError:
+            value = math.inf
+    return -value if sign else value
+
+
+def _fits_binary64(fmt):
+    """Every finite value of the format is exactly representable as a Python float."""
+    if fmt.exponent_bits == 11:
+        return not fmt.finite and fmt.fraction_bits <= 52
+    return fmt.exponent_bits < 11 and fmt.fraction_bits <= 52
+
+
+def add(a, b, fmt=BINARY32):
+    if is_nan(a, fmt) or is_nan(b, fmt):
+        return fmt.quiet_nan
+    if is_inf(a, fmt) or is_inf(b, fmt):
+        if is_inf(a, fmt) and is_inf(b, fmt) and a != b:
+            return fmt.quiet_nan
+        return a if is_inf(a, fmt) else b
+
+    sign_a, sig_a, exp_a = _decode(a, fmt)
+    sign_b, sig_b, exp_b = _decode(b, fmt)
+    if sig_a == 0 and sig_b == 0:
+        return pack(sign_a & sign_b, 0, 0, fmt)
+    if sig_b == 0:
+        return a
+    if sig_a == 0:
+        return b
+
+    if exp_a < exp_b:
+        sign_a, sig_a, exp_a, sign_b, sig_b, exp_b = sign_b, sig_b, exp_b, sign_a, sig_a, exp_a
+
+    # Three extra bits hold guard, round and sticky of the aligned operand
+    sig_a <<= 3
+    sig_b <<= 3
+    diff = exp_a - exp_b
+    if diff:
+        sticky = sig_b & ((1 << diff) - 1) != 0
+        sig_b = (sig_b >> diff) | sticky
+
+    total = (-sig_a if sign_a else sig_a) + (-sig_b if sign_b else sig_b)
+    if total == 0:
+        return pack(0, 0, 0, fmt)
+    return round_pack(1 if total < 0 else 0, abs(total), exp_a - 3, fmt)
+
+
+def subtract(a, b, fmt=BINARY32):
+    return add(a, b ^ (1 << (fmt.width - 1)), fmt)
+
+
+def multiply(a, b, fmt=BINARY32):
+    if is_nan(a, fmt) or is_nan(b, fmt):
+        return fmt.quiet_nan
+    sign_a, sig_a, exp_a = _decode(a, fmt)
+    sign_b, sig_b, exp_b = _decode(b, fmt)
+    sign = sign_a ^ sign_b
+    if is_inf(a, fmt) or is_inf(b, fmt):
+        if sig_a == 0 or sig_b == 0:
+            return fmt.quiet_nan
+        return infinity(sign, fmt)
+    return round_pack(sign, sig_a * sig_b, exp_a + exp_b, fmt)
+
+
+def divide(a, b, fmt=BINARY32):
+    if is_nan(a, fmt) or is_nan(b, fmt):
+        return fmt.quiet_nan
+    sign_a, sig_a, exp_a = _decode(a, fmt)
+    sign_b, sig_b, exp_b = _decode(b, fmt)
+    sign = sign_a ^ sign_b
+    if is_inf(a, fmt):
+        return fmt.quiet_nan if is_inf(b, fmt) else infinity(sign, fmt)
+    if is_inf(b, fmt):
+        return pack(sign, 0, 0, fmt)
+    if sig_b == 0:
+        return fmt.quiet_nan if sig_a == 0 else infinity(sign, fmt)
+    if sig_a == 0:
+        return pack(sign, 0, 0, fmt)
+
+    # Enough quotient bits for the significand plus guard and round, then the sticky bit
+    shift = max(0, fmt.precision + 2 + sig_b.bit_length() - sig_a.bit_length())
+    quotient, remainder = divmod(sig_a << shift, sig_b)
+    quotient = (quotient << 1) | (remainder != 0)
+    return round_pack(sign, quotient, exp_a - exp_b - shift - 1, fmt)
+
+
+def fma(a, b, c, fmt=BINARY32):
+    """Computes a * b + c with a single rounding."""
+    if is_nan(a, fmt) or is_nan(b, fmt) or is_nan(c, fmt):
+        return fmt.quiet_nan
+    sign_a, sig_a, exp_a = _decode(a, fmt)
+    sign_b, sig_b, exp_b = _decode(b, fmt)
+    sign_c, sig_c, exp_c = _decode(c, fmt)
+    sign_p = sign_a ^ sign_b
+
+    if is_inf(a, fmt) or is_inf(b, fmt):
+        if sig_a == 0 or sig_b == 0:
+            return fmt.quiet_nan
+        if is_inf(c, fmt) and sign_c != sign_p:
+            return fmt.quiet_nan
+        return infinity(sign_p, fmt)
+    if is_inf(c, fmt):
+        return c
+
+    sig_p = sig_a * sig_b
+    exp_p = exp_a + exp_b
+    if sig_p == 0:
+        if sig_c == 0:
+            return pack(sign_p & sign_c, 0, 0, fmt)
+        return c
+    if sig_c == 0:
+        return round_pack(sign_p, sig_p, exp_p, fmt)
+
+    exponent = min(exp_p, exp_c)
+    total = ((-sig_p if sign_p else sig_p) << (exp_p - exponent)) + \
+        ((-sig_c if sign_c else sig_c) << (exp_c - exponent))
+    if total == 0:
+        return pack(0, 0, 0, fmt)
+    return round_pack(1 if total < 0 else 0, abs(total), exponent, fmt)
@@ -0,0 +1,198 @@
+import argparse
+import csv
+import io
+import json
+import math
+import sys
+from collections import deque
+from functools import partial
+from itertools import islice
+from multiprocessing import Pool
+
+from lib import *
+
+OPERATIONS = ('add', 'sub', 'mul', 'div', 'ieee_add')
+FIELDS = ('bin', 'dec', 'overflow', 'error')
+
+
+class BadRecord(ValueError):
+    """An input record that does not hold two operands, reported in place of its results."""
+
+
+def run_operation(name, a, b, bits=16, precision=5):
+    try:
+        if name == 'ieee_add':
+            a, b = float(a), float(b)
+            # The stream works on finite numbers; inf and nan records are reported, not encoded
+            if not (math.isfinite(a) and math.isfinite(b)):
+                raise ValueError(f'Operands must be finite: {a}, {b}')
+            result_bin, result_dec = add_ieee(a, b)
+            return {'bin': result_bin, 'dec': result_dec}
+        a, b = int(str(a)), int(str(b))
+        if name == 'add':
+            result_bin, overflow = add_complement(a, b, bits)
+            return {'bin': result_bin, 'dec': complement_to_dec(result_bin), 'overflow': overflow}
+        if name == 'sub':
+            result_bin, overflow = subtract_complement(a, b, bits)
+            return {'bin': result_bin, 'dec': complement_to_dec(result_bin), 'overflow': overflow}
+        if name == 'mul':
+            result_bin, overflow = multiply_direct(a, b, bits)
+            return {'bin': result_bin, 'dec': direct_to_dec(result_bin), 'overflow': overflow}
+        if name == 'div':
+            result_bin, result_dec = divide_direct(a, b, bits, precision)
+            return {'bin': result_bin, 'dec': result_dec}
+    except (ValueError, TypeError, OverflowError) as error:
+        return {'error': str(error)}
+    raise ValueError(f'Unknown operation: {name}')
+
+
+def csv_header(operations):
+    return ['a', 'b'] + [f'{name}_{field}' for name in operations for field in FIELDS]
+
+
+def process_chunk(pairs, operations, bits=16, precision=5, output_format='jsonl'):
+    """Runs the operations on a chunk of operand pairs and returns the serialized records."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n') if output_format == 'csv' else None
+    for pair in pairs:
+        if isinstance(pair, BadRecord):
+            a = b = None
+            results = {name: {'error': str(pair)} for name in operations}
+        else:
+            a, b = pair
+            results = {name: run_operation(name, a, b, bits, precision) for name in operations}
+        if writer:
+            row = [a, b]
+            for name in operations:
+                row += [results[name].get(field, '') for field in FIELDS]
+            writer.writerow(row)
+        else:
+            buffer.write(json.dumps({'a': a, 'b': b, **results}) + '\n')
+    return buffer.getvalue()
+
+
+def _is_number(value):
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_operand(value):
+    return isinstance(value, (str, int, float)) and not isinstance(value, bool)
+
+
+def read_pairs(file, input_format='csv'):
+    """
+    Lazily reads operand pairs from CSV rows or JSONL objects/arrays.
+
+    Malformed records are yielded as BadRecord errors naming their line, so the
+    rest of the stream still runs.
+    """
+    if input_format == 'jsonl':
+        for number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield BadRecord(f'Line {number}: invalid JSON')
+                continue
+            if isinstance(record, dict):
+                missing = [key for key in ('a', 'b') if key not in record]
+                if missing:
+                    yield BadRecord(f"Line {number}: missing {', '.join(missing)}")
+                    continue
+                pair = record['a'], record['b']
+            elif isinstance(record, list) and len(record) == 2:
+                pair = tuple(record)
+            else:
+                yield BadRecord(f'Line {number}: expected an object with a and b or a pair')
+                continue
+            if all(_is_operand(value) for value in pair):
+                yield pair
+            else:
+                yield BadRecord(f'Line {number}: operands must be numbers or strings')
+        return
+    reader = csv.reader(file)
+    for index, row in enumerate(reader):
+        if not row:
+            continue
+        if index == 0 and not _is_number(row[0]):
+            continue
+        if len(row) < 2:
+            yield BadRecord(f'Line {reader.line_num}: expected two columns, got {len(row)}')
+            continue
+        yield row[0].strip(), row[1].strip()
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def map_chunks(worker, chunks, workers=1):
+    """
+    Maps the worker over chunks in order, keeping at most two chunks per
+    process in flight so memory stays bounded for endless inputs.
+    """
+    if workers <= 1:
+        yield from map(worker, chunks)
+        return
+    with Pool(workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(worker, (chunk,)))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+def run(input_file, output_file, operations=OPERATIONS, input_format='csv', output_format='jsonl',
+        bits=16, precision=5, chunk_size=1024, workers=1):
+    if output_format == 'csv':
+        csv.writer(output_file, lineterminator='\n').writerow(csv_header(operations))
+    worker = partial(process_chunk, operations=tuple(operations), bits=bits,
+                     precision=precision, output_format=output_format)
+    chunks = chunked(read_pairs(input_file, input_format), chunk_size)
+    for block in map_chunks(worker, chunks, workers):
+        output_file.write(block)
+        output_file.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Runs lw1 arithmetic over a stream of operand pairs.')
+    parser.add_argument('input', nargs='?', default='-', help='CSV or JSONL file with operand pairs, - for stdin')
+    parser.add_argument('-o', '--output', default='-', help='output file, - for stdout')
+    parser.add_argument('--ops', default=','.join(OPERATIONS), help='comma separated operations')
+    parser.add_argument('--input-format', choices=('csv', 'jsonl'))
+    parser.add_argument('--output-format', choices=('csv', 'jsonl'), default='jsonl')
+    parser.add_argument('--bits', type=int, default=16)
+    parser.add_argument('--precision', type=int, default=5)
+    parser.add_argument('--chunk-size', type=int, default=1024)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    operations = [name.strip() for name in args.ops.split(',') if name.strip()]
+    for name in operations:
+        if name not in OPERATIONS:
+            parser.error(f'unknown operation: {name}')
+    input_format = args.input_format or ('jsonl' if args.input.endswith('.jsonl') else 'csv')
+
+    input_file = sys.stdin if args.input == '-' else open(args.input, newline='')
+    output_file = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    try:
+        run(input_file, output_file, operations, input_format, args.output_format,
+            args.bits, args.precision, args.chunk_size, args.workers)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,34 @@
+import contextlib
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
 import unittest
+from fractions import Fraction
+from itertools import islice
+from unittest import mock
+
+import numpy as np
 
 from lib import *
+from bitword import BitWord, add_complement as word_add_complement, subtract_complement as word_subtract_complement
+from multiplication import multiply, multiply_words, choose_strategy, SCHOOLBOOK, KARATSUBA, TOOM3
+from division import divide, quotient_bits, reciprocal, RESTORING, NON_RESTORING, NEWTON
+import softfloat
+from code_tables import CodeTable, get_table
+import adders
+import alu_trace
+import bitbuffer
+import conversion
+import fixed_point
+import benchmarks
+import stream
+import verify
+from booth import booth_digits, booth_multiply, booth_multiply_batch
+from batch_codes import encode_batch, complement_to_dec_batch, direct_to_dec_batch, pack_bits, unpack_bits
 
 class TestBinaryOperations(unittest.TestCase):
 
@@ -136,5 +164,729 @@ class TestBinaryOperations(unittest.TestCase):
         self.assertEqual(ieee_sum, '01000000010000000000000000000000')
         self.assertAlmostEqual(float_sum, 3.0, places=5)
 
+class TestBitWord(unittest.TestCase):
+
+    def test_encodings_match_string_codes(self):
+        for n in range(-130, 130):
+            self.assertEqual(str(BitWord.from_direct(n, 8)), direct_code(n, 8))
+            self.assertEqual(str(BitWord.from_reverse(n, 8)), reverse_code(n, 8))
+            self.assertEqual(str(BitWord.from_complement(n, 8)), complement_code(n, 8))
+
+    def test_decoders_match_string_decoders(self):
+        for n in range(-127, 128):
+            self.assertEqual(BitWord.from_complement(n, 8).to_complement(), n)
+            self.assertEqual(BitWord.from_direct(n, 8).to_direct(), n)
+            self.assertEqual(BitWord.from_reverse(n, 8).to_reverse(), n)
+        self.assertEqual(BitWord.from_str('10000000').to_complement(), complement_to_dec('10000000'))
+
+    def test_add_complement_matches_string_implementation(self):
+        for a in range(-128, 128, 7):
+            for b in range(-128, 128, 5):
+                word, overflow = word_add_complement(a, b, 8)
+                self.assertEqual((str(word), overflow), add_complement(a, b, 8))
+                word, overflow = word_subtract_complement(a, b, 8)
+                self.assertEqual((str(word), overflow), subtract_complement(a, b, 8))
+
+    def test_add_returns_carry(self):
+        word, carry = BitWord.from_str('1111').add(BitWord.from_str('0001'))
+        self.assertEqual((str(word), carry), ('0000', 1))
+
+    def test_compare_matches_binary_compare(self):
+        for a, b in [('0101', '0101'), ('0101', '0011'), ('0011', '0101')]:
+            self.assertEqual(BitWord.from_str(a).compare(BitWord.from_str(b)), binary_compare(a, b))
+
+    def test_wide_words(self):
+        a = BitWord.from_complement(-(1 << 4000), 4096)
+        b = BitWord.from_complement(1 << 4000, 4096)
+        word, overflow = a.add_complement(b)
+        self.assertEqual(word.value, 0)
+        self.assertFalse(overflow)
+
+class TestBatchCodes(unittest.TestCase):
+
+    def test_encode_batch_matches_string_codes(self):
+        values = np.arange(-130, 130)
+        direct, reverse, complement = encode_batch(values, 8)
+        for n, d, r, c in zip(values.tolist(), direct.tolist(), reverse.tolist(), complement.tolist()):
+            self.assertEqual(format(d, '08b'), direct_code(n, 8))
+            self.assertEqual(format(r, '08b'), reverse_code(n, 8))
+            self.assertEqual(format(c, '08b'), complement_code(n, 8))
+
+    def test_encode_batch_uses_smallest_dtype(self):
+        self.assertEqual(encode_batch([1], 16)[0].dtype, np.uint16)
+        self.assertEqual(encode_batch([1], 33)[0].dtype, np.uint64)
+
+    def test_bit_matrix_rows_match_string_codes(self):
+        values = np.array([-5, 0, 5, -4096])
+        _, _, complement = encode_batch(values, 13)
+        matrix = pack_bits(complement, 13)
+        self.assertEqual(matrix.shape, (4, 2))
+        for n, row in zip(values.tolist(), matrix):
+            self.assertEqual(''.join(map(str, np.unpackbits(row, count=13))), complement_code(n, 13))
+        np.testing.assert_array_equal(unpack_bits(matrix, 13), complement)
+
+    def test_decoders_invert_encoders(self):
+        values = np.arange(-127, 128)
+        direct, _, complement = encode_batch(values, 8)
+        np.testing.assert_array_equal(complement_to_dec_batch(complement, 8), values)
+        np.testing.assert_array_equal(direct_to_dec_batch(direct, 8), values)
+        extremes = np.array([-2 ** 63, -1, 2 ** 63 - 1])
+        np.testing.assert_array_equal(complement_to_dec_batch(encode_batch(extremes, 64)[2], 64), extremes)
+
+class TestMultiplication(unittest.TestCase):
+
+    def test_strategies_agree_with_native_product(self):
+        cases = [(0, 5), (-7, 3), (12345, -6789), ((1 << 3000) - 1, -(1 << 2500) + 3), (-(3 ** 2000), -(5 ** 1500))]
+        for strategy in (SCHOOLBOOK, KARATSUBA, TOOM3):
+            for a, b in cases:
+                self.assertEqual(multiply(a, b, strategy), a * b)
+
+    def test_strategy_is_chosen_by_width(self):
+        self.assertEqual(choose_strategy(64), SCHOOLBOOK)
+        self.assertEqual(choose_strategy(2048), KARATSUBA)
+        self.assertEqual(choose_strategy(8192), TOOM3)
+
+    def test_multiply_words_in_direct_code_matches_multiply_direct(self):
+        for a, b in [(-5, -3), (5, -3), (32767, 2), (181, 181)]:
+            word, overflow = multiply_words(BitWord.from_direct(a, 16), BitWord.from_direct(b, 16), 16, 'direct')
+            self.assertEqual((str(word), overflow), multiply_direct(a, b, 16))
+
+    def test_multiply_words_in_complement_code(self):
+        word, overflow = multiply_words(BitWord.from_complement(-128, 8), BitWord.from_complement(127, 8))
+        self.assertEqual(word.width, 16)
+        self.assertEqual(word.to_complement(), -128 * 127)
+        self.assertFalse(overflow)
+        word, overflow = multiply_words(BitWord.from_complement(-128, 8), BitWord.from_complement(-1, 8), 8)
+        self.assertTrue(overflow)
+
+    def test_multiply_words_wide_operands(self):
+        a = BitWord.from_complement(-(1 << 3000) + 1, 4096)
+        b = BitWord.from_complement((1 << 3000) - 1, 4096)
+        word, overflow = multiply_words(a, b)
+        self.assertEqual(word.to_complement(), -((1 << 3000) - 1) ** 2)
+        self.assertFalse(overflow)
+        _, overflow = multiply_words(a, b, 4096)
+        self.assertTrue(overflow)
+
+class TestDivision(unittest.TestCase):
+
+    def test_modes_match_binary_divide(self):
+        for mode in (RESTORING, NON_RESTORING, NEWTON):
+            self.assertEqual(divide(10, 3, 3, mode).to_binary(), '11.010')
+            self.assertEqual(divide(32767, 3, 5, mode).to_binary(), binary_divide(dec_to_bin(32767, 15), dec_to_bin(3, 15), 5))
+            self.assertEqual(divide(10, 2, 0, mode).to_binary(), binary_divide('1010', '0010', 0))
+
+    def test_modes_agree_with_integer_division(self):
+        cases = [(1, 3), (12345, 7), ((1 << 300) + 5, (1 << 150) - 3), (3 ** 200, 7 ** 60)]
+        for mode in (RESTORING, NON_RESTORING, NEWTON):
+            for a, b in cases:
+                q = divide(a, b, 100, mode)
+                self.assertEqual((q.integer << 100) | q.fraction, (a << 100) // b)
+
+    def test_quotient_bits_are_lazy(self):
+        for mode in (RESTORING, NON_RESTORING, NEWTON):
+            bits = list(islice(quotient_bits(1, 3, mode), 10001))
+            self.assertEqual(bits[0], 0)
+            self.assertEqual(bits[1:], [0, 1] * 5000)
+
+    def test_reciprocal(self):
+        for divisor in (1, 3, 255, (1 << 500) + 1):
+            for precision in (0, 10, 200):
+                self.assertEqual(reciprocal(divisor, precision), (1 << (divisor.bit_length() + precision)) // divisor)
+
+    def test_exact_decimal_rendering(self):
+        q = divide(-10, 3, 5)
+        self.assertEqual(str(q), '-11.01010')
+        self.assertEqual(q.to_fraction(), Fraction(-53, 16))
+        self.assertEqual(q.to_decimal(5), '-3.31250')
+        self.assertEqual(divide(1, 3, 200).to_decimal(50), '0.' + '3' * 50)
+
+    def test_division_by_zero(self):
+        with self.assertRaises(ValueError):
+            divide(1, 0)
+
+class TestSoftFloat(unittest.TestCase):
+
+    def test_from_float_matches_float_to_ieee(self):
+        for x in (0.0, 1.0, 2.0, -1.0, -2.0, 3.0, 0.75, -12.5):
+            self.assertEqual(softfloat.to_string(softfloat.from_float(x)), float_to_ieee(x))
+
+    def test_round_trip_and_rounding(self):
+        self.assertEqual(softfloat.to_float(softfloat.from_float(0.1)), float(np.float32(0.1)))
+        self.assertEqual(softfloat.from_float(1e39), softfloat.BINARY32.infinity)
+        self.assertEqual(softfloat.from_float(1e-45), 1)
+        self.assertEqual(softfloat.from_float(1e-46), 0)
+        self.assertEqual(softfloat.from_float(65520.0, softfloat.BINARY16), softfloat.BINARY16.infinity)
+
+    def test_batch_operations_match_numpy_bit_patterns(self):
+        rng = np.random.default_rng(7)
+        cases = [
+            (softfloat.BINARY16, np.float16, np.uint16),
+            (softfloat.BINARY32, np.float32, np.uint32),
+            (softfloat.BINARY64, np.float64, np.uint64),
+        ]
+        operations = [
+            (np.add, softfloat.add_batch),
+            (np.subtract, softfloat.subtract_batch),
+            (np.multiply, softfloat.multiply_batch),
+            (np.divide, softfloat.divide_batch),
+        ]
+        for fmt, float_type, uint_type in cases:
+            patterns = rng.integers(0, 1 << fmt.width, (2, 2000), dtype=np.uint64).astype(uint_type)
+            a, b = patterns.view(float_type)
+            specials = np.array([0.0, -0.0, np.inf, -np.inf, np.nan, 1.0, -1.0], dtype=float_type)
+            a = np.concatenate([a, np.repeat(specials, 7)])
+            b = np.concatenate([b, np.tile(specials, 7)])
+            with np.errstate(all='ignore'):
+                for native, batch in operations:
+                    expected = native(a, b)
+                    result = batch(a, b, fmt)
+                    nan = np.isnan(expected)
+                    np.testing.assert_array_equal(result[~nan], expected.view(uint_type)[~nan])
+                    self.assertTrue(np.isnan(result.view(float_type)[nan]).all())
+
+    def test_fma_rounds_once(self):
+        fmt = softfloat.BINARY32
+        a = softfloat.from_float(1 + 2 ** -12)
+        c = softfloat.from_float(-(1 + 2 ** -11))
+        self.assertEqual(softfloat.to_float(softfloat.fma(a, a, c, fmt)), 2 ** -24)
+        self.assertEqual(softfloat.add(softfloat.multiply(a, a, fmt), c, fmt), 0)
+        result = softfloat.fma_batch(np.float32([1 + 2 ** -12]), np.float32([1 + 2 ** -12]), np.float32([-(1 + 2 ** -11)]))
+        self.assertEqual(result.view(np.float32)[0], np.float32(2 ** -24))
+
+    def test_special_values(self):
+        fmt = softfloat.BINARY32
+        inf = fmt.infinity
+        self.assertTrue(softfloat.is_nan(softfloat.add(inf, inf | 1 << 31, fmt)))
+        self.assertTrue(softfloat.is_nan(softfloat.multiply(inf, 0, fmt)))
+        self.assertTrue(softfloat.is_nan(softfloat.fma(inf, 0, softfloat.from_float(1.0), fmt)))
+        self.assertEqual(softfloat.divide(softfloat.from_float(-1.0), 0, fmt), inf | 1 << 31)
+        self.assertEqual(softfloat.add(1 << 31, 1 << 31, fmt), 1 << 31)
+
+    def test_narrow_formats(self):
+        e4m3, e5m2 = softfloat.FLOAT8_E4M3FN, softfloat.FLOAT8_E5M2
+        self.assertEqual(softfloat.from_float(448.0, e4m3), 0x7e)
+        self.assertEqual(softfloat.from_float(464.0, e4m3), 0x7e)
+        self.assertEqual(softfloat.from_float(480.0, e4m3), e4m3.quiet_nan)
+        self.assertEqual(softfloat.from_float(-np.inf, e4m3), 0xff)
+        self.assertFalse(softfloat.is_inf(0x7f, e4m3))
+        self.assertEqual(softfloat.to_float(0x7e, e4m3), 448.0)
+        self.assertEqual(softfloat.to_float(0x01, e4m3), 2 ** -9)
+        self.assertEqual(softfloat.from_float(61440.0, e5m2), e5m2.infinity)
+        self.assertEqual(softfloat.to_float(0x7b, e5m2), 57344.0)
+        bfloat = softfloat.BFLOAT16
+        self.assertEqual(softfloat.from_float(1 + 2 ** -8, bfloat), 0x3f80)
+        self.assertEqual(softfloat.from_float(3.39e38, bfloat), 0x7f7f)
+        self.assertEqual(softfloat.from_float(3.4e38, bfloat), bfloat.infinity)
+
+    def test_binary128_is_exact(self):
+        fmt = softfloat.BINARY128
+        tenth = softfloat.from_fraction('0.1', fmt)
+        self.assertEqual(softfloat.to_string(tenth, fmt)[:20], '00111111111110111001')
+        self.assertLess(abs(softfloat.to_fraction(tenth, fmt) - Fraction(1, 10)), Fraction(1, 10 ** 34))
+        self.assertEqual(softfloat.to_float(tenth, fmt), 0.1)
+        third = softfloat.divide(softfloat.from_fraction(1, fmt), softfloat.from_fraction(3, fmt), fmt)
+        self.assertEqual(third, softfloat.from_fraction(Fraction(1, 3), fmt))
+        huge = softfloat.from_fraction(10 ** 4000, fmt)
+        self.assertEqual(softfloat.to_float(huge, fmt), np.inf)
+        self.assertEqual(softfloat.to_fraction(huge, fmt) // 10 ** 3966, 10 ** 34)
+
+    def test_encode_and_decode_arrays(self):
+        rng = np.random.default_rng(11)
+        values = np.concatenate([rng.standard_normal(3000) * 2.0 ** rng.integers(-30, 30, 3000),
+                                 [0.0, -0.0, np.inf, -np.inf, 1e-300, 1e300, 448.0, 480.0, 57344.0]])
+        for fmt in (softfloat.BFLOAT16, softfloat.FLOAT8_E4M3FN, softfloat.FLOAT8_E5M2, softfloat.BINARY16,
+                    softfloat.BINARY128):
+            encoded = softfloat.encode_array(values, fmt)
+            self.assertEqual(encoded.dtype, softfloat.bits_dtype(fmt))
+            self.assertEqual(encoded.tolist(), [softfloat.from_float(x, fmt) for x in values])
+            decoded = softfloat.decode_array(encoded, fmt)
+            expected = [softfloat.to_float(int(bits), fmt) for bits in encoded]
+            np.testing.assert_array_equal(decoded, expected)
+        self.assertTrue(np.isnan(softfloat.decode_array([0x7f, 0xff], softfloat.FLOAT8_E4M3FN)).all())
+        result = softfloat.add_batch(np.array([1.5, 448.0]), np.array([0.25, 448.0]), softfloat.FLOAT8_E4M3FN)
+        np.testing.assert_array_equal(result, [softfloat.from_float(1.75, softfloat.FLOAT8_E4M3FN), 0x7f])
+
+    def test_lib_pipeline_accepts_formats(self):
+        for fmt in (softfloat.BFLOAT16, softfloat.FLOAT8_E5M2, softfloat.BINARY64):
+            self.assertEqual(float_to_ieee(-0.15625, fmt), softfloat.to_string(softfloat.from_float(-0.15625, fmt), fmt))
+            result_bin, result_dec = add_ieee(1.5, 2.25, fmt)
+            expected = softfloat.add(softfloat.from_float(1.5, fmt), softfloat.from_float(2.25, fmt), fmt)
+            self.assertEqual(result_bin, softfloat.to_string(expected, fmt))
+        self.assertEqual(add_ieee(1.5, 2.25), add_ieee(1.5, 2.25, softfloat.BINARY32))
+
+    def test_lib_pipeline_handles_format_range(self):
+        formats = (softfloat.BINARY16, softfloat.BINARY64, softfloat.BINARY128, softfloat.BFLOAT16,
+                   softfloat.FLOAT8_E4M3FN, softfloat.FLOAT8_E5M2)
+        for fmt in formats:
+            for value in (0.0, -0.15625, 1e-6, 0.001, 1000.0, 1e300):
+                expected = softfloat.from_fraction(value, fmt)
+                self.assertEqual(float_to_ieee(value, fmt), softfloat.to_string(expected, fmt))
+                self.assertEqual(len(float_to_ieee(value, fmt)), fmt.width)
+            self.assertEqual(float_to_ieee(float('inf'), fmt), softfloat.to_string(softfloat.from_float(float('inf'), fmt), fmt))
+        self.assertEqual(float_to_ieee(0.001, softfloat.FLOAT8_E4M3FN), '00000001')
+        self.assertEqual(float_to_ieee(1000.0, softfloat.FLOAT8_E4M3FN), '01111111')
+        self.assertEqual(float_to_ieee(1e-6, softfloat.BINARY16), '0000000000010001')
+        result_bin, result_dec = add_ieee(300, 300, softfloat.FLOAT8_E4M3FN)
+        self.assertEqual(result_bin, '01111111')
+        self.assertNotEqual(result_dec, result_dec)
+        self.assertEqual(add_ieee(1.0, 2 ** -60, softfloat.BINARY128)[1], 1 + Fraction(1, 2 ** 60))
+        self.assertEqual(add_ieee(60000.0, 60000.0, softfloat.BINARY16), ('0111110000000000', float('inf')))
+
+    def test_binary32_rounds_like_every_format(self):
+        self.assertEqual(float_to_ieee(0.1), '00111101110011001100110011001101')
+        self.assertEqual(float_to_ieee(1e-40), '00000000000000010001011011000010')
+        self.assertEqual(float_to_ieee(5.1e38), '01111111100000000000000000000000')
+        self.assertEqual(float_to_ieee(-0.0), '1' + '0' * 31)
+        self.assertEqual(add_ieee(3e38, 3e38), ('01111111100000000000000000000000', float('inf')))
+        self.assertEqual(add_ieee(0.1, 0.2)[1], float(np.float32(0.1) + np.float32(0.2)))
+        same = softfloat.FloatFormat(8, 23)
+        for value in (0.1, 1e-40, 5.1e38, -300.25):
+            self.assertEqual(float_to_ieee(value), float_to_ieee(value, same))
+            self.assertEqual(float_to_ieee(value), softfloat.to_string(softfloat.from_float(value)))
+
+    def test_lib_does_not_import_numpy(self):
+        code = 'import sys, lib; lib.float_to_ieee(1.5); sys.exit("numpy" in sys.modules)'
+        self.assertEqual(subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(__file__))).returncode, 0)
+
+class TestCodeTables(unittest.TestCase):
+
+    def test_table_matches_string_codes(self):
+        table = get_table(8)
+        for n in range(-128, 128):
+            self.assertEqual(table.to_str(table.direct_code(n)), direct_code(n, 8))
+            self.assertEqual(table.to_str(table.reverse_code(n)), reverse_code(n, 8))
+            self.assertEqual(table.to_str(table.complement_code(n)), complement_code(n, 8))
+        for code in range(256):
+            bin_str = dec_to_bin(code, 8)
+            self.assertEqual(table.complement_to_dec(code), complement_to_dec(bin_str))
+            self.assertEqual(table.direct_to_dec(code), direct_to_dec(bin_str))
+
+    def test_table_is_built_once(self):
+        self.assertIs(get_table(8), get_table(8))
+
+    def test_out_of_range_value(self):
+        with self.assertRaises(ValueError):
+            get_table(8).direct_code(128)
+
+    def test_out_of_range_code(self):
+        table = get_table(8)
+        for code in (-1, 256, 1 << 20):
+            for decoder in (table.direct_to_dec, table.reverse_to_dec, table.complement_to_dec):
+                with self.assertRaises(ValueError):
+                    decoder(code)
+        self.assertEqual(table.complement_to_dec(255), -1)
+
+    def test_save_and_load_with_mmap(self):
+        table = CodeTable.build(16)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'codes16.bin')
+            table.save(path)
+            self.assertEqual(os.path.getsize(path), 16 + 6 * 2 * 65536)
+            loaded = CodeTable.load(path)
+            self.assertIsInstance(loaded._codes[0], np.memmap)
+            for n in (-32768, -12345, -1, 0, 1, 32767):
+                self.assertEqual(loaded.encode(n), table.encode(n))
+                self.assertEqual(loaded.complement_to_dec(loaded.complement_code(n)), n)
+            self.assertEqual(loaded.reverse_to_dec(0xFFFF), 0)
+
+class TestStream(unittest.TestCase):
+
+    def test_streams_jsonl_records(self):
+        output = io.StringIO()
+        stream.run(io.StringIO('a,b\n5,3\n1,0\n'), output, ['add', 'div'], chunk_size=1)
+        first, second = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(first['add'], {'bin': '0000000000001000', 'dec': 8, 'overflow': False})
+        self.assertEqual(first['div']['bin'], divide_direct(5, 3)[0])
+        self.assertEqual(second['div'], {'error': 'Division by zero'})
+
+    def test_streams_csv_from_jsonl(self):
+        output = io.StringIO()
+        stream.run(io.StringIO('{"a": 2, "b": 3}\n[1.5, 2.25]\n'), output, ['mul', 'ieee_add'],
+                   input_format='jsonl', output_format='csv')
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0], ','.join(stream.csv_header(['mul', 'ieee_add'])))
+        self.assertTrue(lines[1].startswith('2,3,0000000000000110,6,False,,'))
+        self.assertIn('invalid literal', lines[2])
+        self.assertTrue(lines[2].endswith(f'{add_ieee(1.5, 2.25)[0]},3.75,,'))
+
+    def test_parallel_chunks_keep_order(self):
+        pairs = ''.join(f'{i},{i + 1}\n' for i in range(50))
+        output = io.StringIO()
+        stream.run(io.StringIO(pairs), output, ['add'], chunk_size=7, workers=2)
+        decimals = [json.loads(line)['add']['dec'] for line in output.getvalue().splitlines()]
+        self.assertEqual(decimals, [2 * i + 1 for i in range(50)])
+
+    def test_malformed_records_are_reported_per_record(self):
+        output = io.StringIO()
+        stream.run(io.StringIO('a,b\n5\n1,2\n'), output, ['add'])
+        first, second = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(first, {'a': None, 'b': None, 'add': {'error': 'Line 2: expected two columns, got 1'}})
+        self.assertEqual(second['add']['dec'], 3)
+        output = io.StringIO()
+        stream.run(io.StringIO('{"a": 1}\n[1, 2, 3]\n{oops\n{"a": 1, "b": 2}\n'), output, ['add', 'mul'],
+                   input_format='jsonl', output_format='csv')
+        lines = output.getvalue().splitlines()[1:]
+        self.assertEqual(lines[0], ',,,,,Line 1: missing b,,,,Line 1: missing b')
+        self.assertIn('expected an object with a and b or a pair', lines[1])
+        self.assertIn('Line 3: invalid JSON', lines[2])
+        self.assertTrue(lines[3].startswith('1,2,0000000000000011,3,False,,'))
+
+    def test_non_numeric_jsonl_operands_are_reported_per_record(self):
+        output = io.StringIO()
+        stream.run(io.StringIO('{"a": null, "b": 1}\n[[1], 2]\n{"a": 1, "b": {}}\n[true, 1]\n{"a": 1.5, "b": "2.25"}\n'),
+                   output, ['ieee_add', 'add'], input_format='jsonl')
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(len(records), 5)
+        for number, record in enumerate(records[:4], 1):
+            self.assertEqual(record['ieee_add'], {'error': f'Line {number}: operands must be numbers or strings'})
+        self.assertEqual(records[4]['ieee_add']['dec'], 3.75)
+        self.assertIn('error', stream.run_operation('ieee_add', None, 1))
+
+    def test_non_finite_ieee_operands_are_errors(self):
+        for a, b in (('inf', '1'), ('1', 'nan'), ('1e400', '2'), (float('-inf'), 0.0)):
+            self.assertIn('finite', stream.run_operation('ieee_add', a, b)['error'])
+        self.assertEqual(stream.run_operation('ieee_add', '1.5', '2.25')['dec'], 3.75)
+
+class TestVerify(unittest.TestCase):
+
+    def test_exhaustive_8_bit_domain(self):
+        for operation in ('add', 'mul', 'div'):
+            report = verify.verify(operation, bits=8, rows_per_shard=64)
+            self.assertEqual(report['mismatches'], 0, operation)
+        self.assertEqual(verify.verify('add', bits=8)['pairs'], 256 * 256)
+
+    def test_reports_subtraction_of_minimum_value(self):
+        # -(-128) has no 8-bit complement code, so subtract_complement loses the subtrahend
+        report = verify.verify('sub', bits=8)
+        self.assertEqual(report['mismatches'], 256)
+        self.assertTrue(all(b == -128 for _, b in report['examples']))
+
+    def test_samples_string_implementation(self):
+        pairs, mismatches, _ = verify.check_shard(range(-5, 5), 'add', bits=16, samples=20)
+        self.assertEqual((pairs, mismatches), (10 * 65536, 0))
+        pairs, mismatches, _ = verify.check_shard(range(100, 102), 'mul', bits=16, samples=20)
+        self.assertEqual(mismatches, 0)
+
+    def test_reports_whether_lib_was_checked(self):
+        self.assertTrue(verify.verify('add', bits=8)['lib_checked'])
+        self.assertFalse(verify.verify('mul', bits=8)['lib_checked'])
+        self.assertFalse(verify.verify('add', bits=8, samples=0)['lib_checked'])
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            verify.main(['--ops', 'add,mul', '--bits', '8'])
+        self.assertEqual(output.getvalue().count('lib not checked'), 1)
+
+class TestAdders(unittest.TestCase):
+
+    def test_adders_match_add_binary(self):
+        for a_bin, b_bin in [('0101', '0011'), ('1111', '0001'), ('1111', '1111'), ('0000', '0000')]:
+            expected_sum, expected_carry = add_binary(a_bin, b_bin)
+            for name, adder in adders.ADDERS.items():
+                total, carry = adder(bin_to_dec(a_bin), bin_to_dec(b_bin), 4)
+                self.assertEqual(carry, expected_carry, name)
+                self.assertEqual(dec_to_bin(total, 4), expected_sum[-4:], name)
+
+    def test_prefix_adders_on_odd_widths(self):
+        rng = np.random.default_rng(3)
+        for width in (1, 2, 3, 5, 7, 13, 31, 64, 100, 257):
+            for _ in range(20):
+                a, b = (int(x) for x in rng.integers(0, 1 << min(width, 62), 2))
+                a, b = a << (width - min(width, 62)), b << (width - min(width, 62))
+                for carry_in in (0, 1):
+                    total = a + b + carry_in
+                    expected = (total & ((1 << width) - 1), total >> width)
+                    self.assertEqual(adders.kogge_stone_add(a, b, width, carry_in), expected)
+                    self.assertEqual(adders.brent_kung_add(a, b, width, carry_in), expected)
+
+    def test_carry_save_sum_of_complement_codes(self):
+        values = [-128, 127, -5, 3, 99, -77, 12, -1, 0, 64]
+        word, overflow = adders.sum_complement(values, 8)
+        self.assertEqual(word.to_complement(), sum(values))
+        self.assertFalse(overflow)
+        word, overflow = adders.sum_complement([100, 100], 8)
+        self.assertEqual(str(word), add_complement(100, 100, 8)[0])
+        self.assertTrue(overflow)
+        self.assertEqual(adders.carry_save_sum([1, 2, 3, 4, 5], 8), 15)
+
+    def test_benchmark_reports_every_mode(self):
+        timings = adders.benchmark(widths=(8,), number=1)[8]
+        self.assertEqual(set(timings), {'string_ripple', 'ripple', 'kogge_stone', 'brent_kung',
+                                        'sequential_sum_64', 'carry_save_sum_64'})
+
+class TestBooth(unittest.TestCase):
+
+    def test_digits_recode_multiplier(self):
+        for radix, base in ((4, 4), (8, 8)):
+            for n in range(-128, 128):
+                digits = booth_digits(n, 8, radix)
+                self.assertEqual(sum(d * base ** i for i, d in enumerate(digits)), n)
+        self.assertEqual(len(booth_digits(-7, 16, 4)), 8)
+        self.assertEqual(len(booth_digits(-7, 16, 8)), 6)
+
+    def test_multiply_matches_integer_product(self):
+        for radix in (4, 8):
+            for a in range(-128, 128, 9):
+                for b in range(-128, 128, 11):
+                    product, overflow = booth_multiply(BitWord.from_complement(a, 8), BitWord.from_complement(b, 8), radix)
+                    self.assertEqual(product.width, 16)
+                    self.assertEqual(product.to_complement(), a * b)
+                    self.assertEqual(overflow, not -128 <= a * b < 128)
+
+    def test_multiply_wide_operands(self):
+        a, b = -(1 << 99) + 12345, (1 << 98) - 777
+        product, overflow = booth_multiply(BitWord.from_complement(a, 100), BitWord.from_complement(b, 100), 8)
+        self.assertEqual(product.to_complement(), a * b)
+        self.assertTrue(overflow)
+
+    def test_batch_multiply(self):
+        rng = np.random.default_rng(5)
+        a = rng.integers(-(1 << 31), 1 << 31, 500)
+        b = rng.integers(-(1 << 31), 1 << 31, 500)
+        for radix in (4, 8):
+            codes, overflow = booth_multiply_batch(a, b, 32, radix)
+            self.assertEqual(codes.dtype, np.uint64)
+            np.testing.assert_array_equal(codes.view(np.int64), a * b)
+            np.testing.assert_array_equal(overflow, (a * b < -(1 << 31)) | (a * b >= 1 << 31))
+        codes, overflow = booth_multiply_batch([-128, 127], [-1, 2], 8)
+        np.testing.assert_array_equal(codes, [128, 254])
+        np.testing.assert_array_equal(overflow, [True, True])
+
+class TestBitBuffer(unittest.TestCase):
+
+    PAIRS = [('1011', '110'), ('0', '0'), ('0001', '1'), ('111111', '000001'), ('100000', '11'), ('1', '101')]
+
+    def test_compare_matches_lib(self):
+        for a, b in self.PAIRS:
+            self.assertEqual(bitbuffer.compare(a.encode(), b.encode()), binary_compare(a, b))
+
+    def test_add_into_reuses_buffer(self):
+        out = bytearray(6)
+        for a, b in self.PAIRS:
+            view = memoryview(out)[6 - max(len(a), len(b)):]
+            carry = bitbuffer.add_into(view, a.encode(), b.encode())
+            self.assertEqual(('1' if carry else '') + bitbuffer.to_str(view), add_binary(a, b)[0])
+        self.assertEqual(len(out), 6)
+
+    def test_subtract_into_in_place(self):
+        a = bitbuffer.from_str('101101')
+        borrow = bitbuffer.subtract_into(a, a, b'1111')
+        self.assertEqual((bitbuffer.to_str(a), borrow), ('011110', 0))
+        self.assertEqual(bitbuffer.to_str(bitbuffer.strip(a)), binary_subtract('101101', '1111'))
+        self.assertEqual(bitbuffer.subtract_into(bytearray(3), b'001', b'010'), 1)
+
+    def test_divide_into_matches_lib(self):
+        for a, b in self.PAIRS:
+            if int(b, 2) == 0:
+                continue
+            for precision in (0, 3):
+                out = bytearray(bitbuffer.quotient_size(len(a), precision))
+                quotient = bitbuffer.divide_into(out, a.encode(), b.encode(), precision, bytearray(len(b) + 1))
+                self.assertEqual(bitbuffer.to_str(quotient), binary_divide(a, b, precision))
+        with self.assertRaises(ValueError):
+            bitbuffer.divide_into(bytearray(4), b'1010', b'000', 0)
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_compare_reports_only_regressions_beyond_threshold(self):
+        baseline = {'add_complement': {'8': 1.0, '16': 2.0}, 'binary_divide': {'8': 1.0}}
+        current = {'add_complement': {'8': 1.2, '16': 3.0, '64': 9.0}, 'float_to_ieee': {'8': 5.0}}
+        self.assertEqual(benchmarks.compare(baseline, current, 0.25), [('add_complement', '16', 2.0, 3.0)])
+        self.assertEqual(benchmarks.compare(baseline, current, 0.1),
+                         [('add_complement', '8', 1.0, 1.2), ('add_complement', '16', 2.0, 3.0)])
+        self.assertEqual(benchmarks.compare(baseline, baseline), [])
+
+    def test_run_times_conversions_without_the_cache(self):
+        calls = []
+        with mock.patch.object(benchmarks, 'measure', lambda *args: calls.append(conversion.cache_info()) or 0.0):
+            benchmarks.run(['dec_to_bin', 'add_complement'], [8, 64], repeat=1)
+        self.assertEqual(len(calls), 4)
+        self.assertTrue(all(info['dec_to_bin']['maxsize'] == 0 for info in calls))
+        self.assertEqual(conversion.cache_info()['bin_to_dec']['maxsize'], conversion.CACHE_SIZE)
+
+    def test_float_operands_fit_binary32(self):
+        rng = random.Random(0)
+        for width in benchmarks.WIDTHS:
+            for _ in range(20):
+                a, b = benchmarks._float(rng, width), benchmarks._float(rng, width)
+                self.assertLess(abs(a + b), softfloat.to_float(softfloat.BINARY32.infinity - 1, softfloat.BINARY32))
+                self.assertNotEqual(float_to_ieee(a)[1:9], '11111111')
+
+    def test_run_and_baseline_round_trip(self):
+        results = benchmarks.run(['dec_to_bin'], [8], repeat=1)
+        self.assertEqual(list(results), ['dec_to_bin'])
+        self.assertGreater(results['dec_to_bin']['8'], 0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            benchmarks.save(path, results)
+            self.assertEqual(benchmarks.load(path), results)
+            benchmarks.save(path, {'dec_to_bin': {'8': 1e-12}})
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as errors:
+                code = benchmarks.main(['--ops', 'dec_to_bin', '--widths', '8', '--repeat', '1', '--baseline', path])
+        self.assertEqual(code, 1)
+        self.assertIn('REGRESSION dec_to_bin 8 bits', errors.getvalue())
+
+class TestAluTrace(unittest.TestCase):
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(alu_trace.lib._tracer)
+        with alu_trace.tracing() as tracer:
+            self.assertIs(alu_trace.lib._tracer, tracer)
+        self.assertIsNone(alu_trace.lib._tracer)
+
+    def test_records_full_adder_steps_and_carry_chains(self):
+        with alu_trace.tracing() as tracer:
+            self.assertEqual(add_binary('1011', '0111'), ('10010', 1))
+            add_binary('0101', '0010')
+        self.assertEqual([step.position for step in tracer.steps][:4], [3, 2, 1, 0])
+        self.assertEqual(tracer.steps[0], alu_trace.Step('add_binary', 'full_add', 3, (1, 1, 0), (0, 1)))
+        self.assertEqual(tracer.carry_chains, {4: 1})
+        self.assertEqual(tracer.operations['add_binary'], 2)
+        self.assertEqual(tracer.mean_carry_chain(), 4)
+
+    def test_ring_buffer_keeps_latest_steps(self):
+        with alu_trace.tracing(capacity=5) as tracer:
+            binary_subtract('10000', '1')
+            binary_subtract('100', '1')
+        self.assertEqual(len(tracer.steps), 5)
+        self.assertEqual(tracer.steps[-1].position, 0)
+        self.assertEqual(tracer.micro_ops['binary_subtract', 'full_sub'], 8)
+        self.assertEqual(tracer.borrow_chains, {4: 1, 2: 1})
+
+    def test_divide_and_ieee_steps(self):
+        with alu_trace.tracing() as tracer:
+            self.assertEqual(binary_divide('1101', '11', 2), '100.01')
+            add_ieee(1.5, 300.25)
+        divide = [step.micro_op for step in tracer.steps if step.operation == 'binary_divide']
+        self.assertEqual(divide.count('shift'), 6)
+        self.assertEqual(divide.count('subtract'), 2)
+        self.assertEqual(tracer.normalization_shifts['float_to_ieee'], {0: 1, 8: 1})
+        self.assertEqual(tracer.normalization_shifts['pack_ieee'], {0: 1})
+        self.assertEqual(tracer.summary()['operations']['pack_ieee'], 1)
+
+    def test_ieee_spans_are_closed_on_every_path(self):
+        with alu_trace.tracing() as tracer:
+            self.assertEqual(float_to_ieee(0), '0' * 32)
+            add_ieee(1.5, 300.25)
+            add_ieee(2.0, -2.0)
+        self.assertEqual(tracer.operations['float_to_ieee'], 5)
+        self.assertEqual(tracer.operations['add_ieee'], 2)
+        self.assertEqual(tracer.operations['pack_ieee'], 2)
+        self.assertEqual(tracer.normalization_shifts['float_to_ieee'], {0: 2, 1: 2, 8: 1})
+        self.assertEqual(tracer.normalization_shifts['pack_ieee'], {0: 2})
+        self.assertFalse(tracer._shifts)
+        self.assertFalse(tracer._chains)
+
+class TestFixedPoint(unittest.TestCase):
+
+    def test_quantize_and_render(self):
+        fmt = fixed_point.Q7_8
+        self.assertEqual((fmt.width, fmt.min_raw, fmt.max_raw), (16, -32768, 32767))
+        self.assertEqual(fixed_point.from_float(-1.25, fmt), -320)
+        self.assertEqual(fixed_point.to_string(-320, fmt), '11111110.11000000')
+        self.assertEqual(fixed_point.to_fraction(fixed_point.from_fraction('0.1', fmt), fmt), Fraction(26, 256))
+        self.assertEqual(fixed_point.from_float(1000.0, fmt), fmt.max_raw)
+        self.assertEqual(fixed_point.from_float(128.0, fmt, overflow=fixed_point.WRAP), fmt.min_raw)
+
+    def test_rounding_modes(self):
+        fmt = fixed_point.QFormat(3, 0)
+        cases = {
+            fixed_point.FLOOR: [2, -3, 2, -3],
+            fixed_point.TOWARD_ZERO: [2, -2, 2, -2],
+            fixed_point.NEAREST_EVEN: [2, -2, 3, -3],
+            fixed_point.NEAREST_AWAY: [3, -3, 3, -3],
+        }
+        for rounding, expected in cases.items():
+            values = [2.5, -2.5, 2.75, -2.75]
+            self.assertEqual([fixed_point.from_float(x, fmt, rounding) for x in values], expected)
+            self.assertEqual(fixed_point.from_float_batch(values, fmt, rounding).tolist(), expected)
+
+    def test_arithmetic_is_exactly_rounded(self):
+        fmt = fixed_point.QFormat(3, 4)
+        for a in range(fmt.min_raw, fmt.max_raw + 1, 7):
+            for b in range(fmt.min_raw, fmt.max_raw + 1, 5):
+                total, overflow = fixed_point.add(a, b, fmt)
+                self.assertEqual(total, max(fmt.min_raw, min(fmt.max_raw, a + b)))
+                self.assertEqual(overflow, total != a + b)
+                product, _ = fixed_point.multiply(a, b, fmt, fixed_point.FLOOR, fixed_point.WRAP)
+                exact = (a * b) >> 4
+                self.assertEqual(product, ((exact + 128) % 256) - 128)
+                if b:
+                    quotient, overflow = fixed_point.divide(a, b, fmt)
+                    self.assertEqual(quotient, max(fmt.min_raw, min(fmt.max_raw, round(Fraction(a * 16, b)))))
+        with self.assertRaises(ValueError):
+            fixed_point.divide(1, 0, fmt)
+
+    def test_q15_multiply(self):
+        fmt = fixed_point.Q15
+        half = fixed_point.from_float(0.5, fmt)
+        self.assertEqual(fixed_point.multiply(half, -half, fmt), (-8192, False))
+        self.assertEqual(fixed_point.multiply(fmt.min_raw, fmt.min_raw, fmt), (fmt.max_raw, True))
+
+    def test_batch_matches_scalar(self):
+        rng = np.random.default_rng(3)
+        fmt = fixed_point.Q15_16
+        a = rng.integers(fmt.min_raw, fmt.max_raw + 1, 1000)
+        b = rng.integers(1, fmt.max_raw + 1, 1000) * rng.choice([-1, 1], 1000)
+        for overflow in (fixed_point.SATURATE, fixed_point.WRAP):
+            for batch, scalar in ((fixed_point.add_batch, fixed_point.add), (fixed_point.subtract_batch, fixed_point.subtract)):
+                raw, flags = batch(a, b, fmt, overflow)
+                self.assertEqual(list(zip(raw.tolist(), flags.tolist())),
+                                 [scalar(x, y, fmt, overflow) for x, y in zip(a.tolist(), b.tolist())])
+            for rounding in (fixed_point.FLOOR, fixed_point.TOWARD_ZERO, fixed_point.NEAREST_EVEN, fixed_point.NEAREST_AWAY):
+                for batch, scalar in ((fixed_point.multiply_batch, fixed_point.multiply),
+                                      (fixed_point.divide_batch, fixed_point.divide)):
+                    raw, flags = batch(a, b, fmt, rounding, overflow)
+                    self.assertEqual(list(zip(raw.tolist(), flags.tolist())),
+                                     [scalar(x, y, fmt, rounding, overflow) for x, y in zip(a.tolist(), b.tolist())])
+        np.testing.assert_array_equal(fixed_point.to_float_batch([65536, -32768], fmt), [1.0, -0.5])
+        with self.assertRaises(ValueError):
+            fixed_point.divide_batch(a, np.zeros_like(a), fmt)
+        with self.assertRaises(ValueError):
+            fixed_point.add_batch([1], [1], fixed_point.QFormat(40, 0))
+
+class TestConversion(unittest.TestCase):
+
+    def setUp(self):
+        conversion.cache_clear()
+
+    def test_matches_original_loops(self):
+        rng = np.random.default_rng(1)
+        for bits in (0, 1, 7, 8, 9, 16, 63, 100, 257):
+            for n in [0, 1, -5, (1 << bits) - 1, 1 << bits, 3 << bits] + rng.integers(0, 1 << 62, 5).tolist():
+                self.assertEqual(conversion.dec_to_bin(n, bits), conversion._legacy_dec_to_bin(n, bits))
+                text = conversion.dec_to_bin(n, bits)
+                self.assertEqual(conversion.bin_to_dec(text), conversion._digits_to_dec(text))
+        self.assertEqual(dec_to_bin(-3, 4), '0000')
+        self.assertEqual(dec_to_bin(19, 4), '0011')
+        self.assertEqual(bin_to_dec('1' * 300), (1 << 300) - 1)
+
+    def test_non_binary_input_keeps_original_behaviour(self):
+        self.assertEqual(bin_to_dec('12'), 4)
+        with self.assertRaises(ValueError):
+            bin_to_dec('1x')
+        self.assertEqual(dec_to_bin(5.0, 4), conversion._legacy_dec_to_bin(5.0, 4))
+
+    def test_bin_to_dec_accepts_sequences_of_bits(self):
+        self.assertEqual(bin_to_dec([1, 0, 1]), 5)
+        self.assertEqual(bin_to_dec(('1', '1', '0')), 6)
+        self.assertEqual(bin_to_dec([True, False]), 2)
+        self.assertEqual(bin_to_dec([1, 2]), conversion._digits_to_dec([1, 2]))
+        self.assertEqual(bin_to_dec([]), 0)
+
+    def test_cache_counters(self):
+        dec_to_bin(300, 16)
+        dec_to_bin(300, 16)
+        bin_to_dec('0000000100101100')
+        info = conversion.cache_info()
+        self.assertEqual((info['dec_to_bin']['hits'], info['dec_to_bin']['misses']), (1, 1))
+        self.assertEqual((info['bin_to_dec']['hits'], info['bin_to_dec']['misses']), (0, 1))
+        conversion.set_cache_size(0)
+        try:
+            dec_to_bin(300, 16)
+            self.assertEqual(conversion.cache_info()['dec_to_bin']['currsize'], 0)
+        finally:
+            conversion.set_cache_size(conversion.CACHE_SIZE)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,185 @@
+import argparse
+import random
+import time
+from functools import partial
+from multiprocessing import Pool
+
+import numpy as np
+
+import lib
+from batch_codes import (add_complement_batch, subtract_complement_batch, multiply_direct_batch,
+                         divide_direct_batch, complement_to_dec_batch, direct_to_dec_batch)
+
+OPERATIONS = ('add', 'sub', 'mul', 'div')
+MAX_REPORTED = 10
+# String implementation checks per shard; the exhaustive pass only covers the batch kernels
+SAMPLES = 4
+
+
+def operand_domain(operation, bits):
+    """Complement code covers [-2^(n-1), 2^(n-1)), direct code has no pattern for -2^(n-1)."""
+    high = (1 << (bits - 1)) - 1
+    return (-high - 1 if operation in ('add', 'sub') else -high), high
+
+
+def _check_sum(operation, a, b, bits):
+    exact = a + b if operation == 'add' else a - b
+    batch = add_complement_batch if operation == 'add' else subtract_complement_batch
+    codes, overflow = batch(a, b, bits)
+    low, high = operand_domain(operation, bits)
+    wrapped = ((exact - low) & ((1 << bits) - 1)) + low
+    expected_overflow = (exact < low) | (exact > high)
+    return (complement_to_dec_batch(codes, bits) != wrapped) | (overflow != expected_overflow)
+
+
+def _check_product(a, b, bits):
+    codes, overflow = multiply_direct_batch(a, b, bits)
+    exact = a * b
+    limit = (1 << (bits - 1)) - 1
+    magnitude = np.abs(exact)
+    expected = np.where(exact < 0, -(magnitude & limit), magnitude & limit)
+    return (direct_to_dec_batch(codes, bits) != expected) | (overflow != (magnitude > limit))
+
+
+def _check_quotient(a, b, bits, precision):
+    quotient = divide_direct_batch(a, b, bits, precision)
+    magnitude = np.abs(quotient)
+    scaled = np.abs(a) << precision
+    divisor = np.abs(b)
+    bounded = (magnitude * divisor <= scaled) & (scaled < (magnitude + 1) * divisor)
+    signed = (quotient == 0) | ((quotient < 0) == ((a < 0) != (b < 0)))
+    return ~(bounded & signed)
+
+
+def lib_sampled(operation, bits, samples):
+    """Whether a run cross-checks the string implementation in lib at all."""
+    return samples > 0 and (operation in ('add', 'sub') or bits == 16)
+
+
+def _sample_strings(operation, a, b, bits, precision, rng, samples):
+    """
+    Cross-checks the string implementation in lib against the batch results on
+    random pairs. lib.multiply_direct and lib.divide_direct always work on 16-bit
+    operands, so they are only sampled at that width.
+    """
+    mismatches = []
+    if not lib_sampled(operation, bits, samples):
+        return mismatches
+    for index in rng.sample(range(len(a)), min(samples, len(a))):
+        x, y = int(a[index]), int(b[index])
+        if operation == 'add':
+            codes, overflow = add_complement_batch([x], [y], bits)
+            expected = (format(int(codes[0]), f'0{bits}b'), bool(overflow[0]))
+            actual = lib.add_complement(x, y, bits)
+        elif operation == 'sub':
+            codes, overflow = subtract_complement_batch([x], [y], bits)
+            expected = (format(int(codes[0]), f'0{bits}b'), bool(overflow[0]))
+            actual = lib.subtract_complement(x, y, bits)
+        elif operation == 'mul':
+            codes, overflow = multiply_direct_batch([x], [y], bits)
+            expected = (format(int(codes[0]), f'0{bits}b'), bool(overflow[0]))
+            actual = lib.multiply_direct(x, y, bits)
+        else:
+            quotient = int(divide_direct_batch([x], [y], bits, precision)[0])
+            expected = abs(quotient)
+            result_bin, _ = lib.divide_direct(x, y, bits, precision)
+            integer, _, fraction = result_bin.partition('.')
+            actual = (int(integer, 2) << precision) | (int(fraction, 2) if fraction else 0)
+        if actual != expected:
+            mismatches.append((x, y, actual, expected))
+    return mismatches
+
+
+def check_shard(rows, operation, bits=16, precision=5, samples=SAMPLES, seed=0):
+    """
+    Checks every pair whose first operand lies in ``rows`` against the full
+    range of second operands. Returns (pairs, mismatch count, mismatch examples).
+    """
+    low, high = operand_domain(operation, bits)
+    a = np.repeat(np.arange(rows.start, rows.stop, dtype=np.int64), high - low + 1)
+    b = np.tile(np.arange(low, high + 1, dtype=np.int64), len(rows))
+    if operation == 'div':
+        keep = b != 0
+        a, b = a[keep], b[keep]
+
+    if operation in ('add', 'sub'):
+        bad = _check_sum(operation, a, b, bits)
+    elif operation == 'mul':
+        bad = _check_product(a, b, bits)
+    else:
+        bad = _check_quotient(a, b, bits, precision)
+
+    mismatches = int(bad.sum())
+    examples = [(int(x), int(y)) for x, y in zip(a[bad][:MAX_REPORTED], b[bad][:MAX_REPORTED])]
+    if samples:
+        rng = random.Random(seed + rows.start)
+        string_mismatches = _sample_strings(operation, a, b, bits, precision, rng, samples)
+        mismatches += len(string_mismatches)
+        examples += string_mismatches
+    return len(a), mismatches, examples
+
+
+def shards(operation, bits, rows_per_shard):
+    low, high = operand_domain(operation, bits)
+    for start in range(low, high + 1, rows_per_shard):
+        yield range(start, min(start + rows_per_shard, high + 1))
+
+
+def verify(operation, bits=16, precision=5, workers=1, rows_per_shard=16, samples=SAMPLES, seed=0):
+    """
+    Exhaustively verifies one operation and returns a report dictionary;
+    ``lib_checked`` tells whether the string implementation was sampled too.
+    """
+    worker = partial(check_shard, operation=operation, bits=bits, precision=precision,
+                     samples=samples, seed=seed)
+    pairs = mismatches = 0
+    examples = []
+    start = time.perf_counter()
+    if workers > 1:
+        with Pool(workers) as pool:
+            results = list(pool.imap_unordered(worker, shards(operation, bits, rows_per_shard)))
+    else:
+        results = map(worker, shards(operation, bits, rows_per_shard))
+    for shard_pairs, shard_mismatches, shard_examples in results:
+        pairs += shard_pairs
+        mismatches += shard_mismatches
+        examples += shard_examples[:MAX_REPORTED - len(examples)]
+    elapsed = time.perf_counter() - start
+    return {
+        'operation': operation,
+        'bits': bits,
+        'pairs': pairs,
+        'mismatches': mismatches,
+        'examples': examples,
+        'lib_checked': lib_sampled(operation, bits, samples),
+        'seconds': elapsed,
+        'pairs_per_second': pairs / elapsed if elapsed else float('inf'),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Exhaustively verifies lw1 arithmetic against integer semantics.')
+    parser.add_argument('--ops', default=','.join(OPERATIONS))
+    parser.add_argument('--bits', type=int, default=16)
+    parser.add_argument('--precision', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--rows', type=int, default=16, help='first operands per shard')
+    parser.add_argument('--sample', type=int, default=SAMPLES, help='string implementation checks per shard')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for operation in args.ops.split(','):
+        report = verify(operation, args.bits, args.precision, args.workers, args.rows, args.sample, args.seed)
+        failed |= report['mismatches'] > 0
+        print(f"{operation}: {report['pairs']} pairs, {report['mismatches']} mismatches, "
+              f"{report['seconds']:.2f} s, {report['pairs_per_second']:,.0f} pairs/s")
+        if not report['lib_checked']:
+            print('  lib not checked: only the batch kernels were verified')
+        for example in report['examples']:
+            print(f'  mismatch: {example}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+"""
+Tree walk of a formula with repeated subformulas against its hash-consed DAG.
+
+Run from the project root:
+    python -m logical_interpreter.benchmarks.bench_dag --pool 8 --repeats 64
+"""
+import argparse
+import random
+import time
+from itertools import product
+
+from logical_interpreter.benchmarks.bench_lexer import OPERATORS, generate_formula
+from logical_interpreter.logical_interpreter.log_dag import DAG, HashConsBuilder, topological_order
+from logical_interpreter.logical_interpreter.log_parser import parse
+
+
+def repeated_formula(pool: int, repeats: int, variables: int = 8, seed: int = 0) -> str:
+    """
+    Joins random picks from a small pool of subformulas.
+
+    Args:
+        pool (int): Number of distinct subformulas.
+        repeats (int): Number of subformulas joined.
+        variables (int): Number of distinct variables.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        str: The formula.
+    """
+    rng = random.Random(seed)
+    parts = ['(%s)' % generate_formula(20, variables, seed + i) for i in range(pool)]
+    return (' %s ' % rng.choice(OPERATORS)).join(rng.choice(parts) for _ in range(repeats))
+
+
+def run(pool: int = 8, repeats: int = 64, seed: int = 0) -> dict[str, float]:
+    """
+    Evaluates the formula on every row of its truth table as a tree and as a DAG.
+
+    Args:
+        pool (int): Number of distinct subformulas.
+        repeats (int): Number of subformulas joined.
+        seed (int): Seed of the formula generator.
+
+    Returns:
+        dict[str, float]: Node counts, the number of shared nodes and seconds spent by each evaluation.
+    """
+    text = repeated_formula(pool, repeats, seed=seed)
+    tree = parse(text)
+    builder = HashConsBuilder()
+    dag = DAG(parse(text, builder).ast)
+    rows = [dict(zip(tree.vars, values)) for values in product([0, 1], repeat=len(tree.vars))]
+
+    start = time.perf_counter()
+    expected = [tree.ast.eval(env) for env in rows]
+    tree_walk = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = [dag.eval(env) for env in rows]
+    elapsed = time.perf_counter() - start
+
+    assert result == expected
+    return {
+        'tree_nodes': len(topological_order(tree.ast)),
+        'dag_nodes': len(dag),
+        'shared': builder.shared,
+        'tree_walk': tree_walk,
+        'dag': elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmarks evaluation of hash-consed formulas.')
+    parser.add_argument('--pool', type=int, default=8)
+    parser.add_argument('--repeats', type=int, default=64)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    result = run(args.pool, args.repeats, args.seed)
+    print('%d tree nodes, %d DAG nodes, %d shared' % (result['tree_nodes'], result['dag_nodes'], result['shared']))
+    print('  tree walk %8.3f s' % result['tree_walk'])
+    print('  dag       %8.3f s  x%.1f' % (result['dag'], result['tree_walk'] / result['dag']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+Lexer throughput on generated formulas.
+
+Run from the project root:
+    python -m logical_interpreter.benchmarks.bench_lexer --tokens 1000000
+"""
+import argparse
+import random
+import re
+import time
+from typing import List, Tuple
+
+from logical_interpreter.logical_interpreter.lexer import iter_lex, lex
+from logical_interpreter.logical_interpreter.log_lexer import token_patterns
+
+OPERATORS = ['&', '|', '->', '~']
+
+
+def generate_formula(tokens: int, variables: int = 26, seed: int = 0) -> str:
+    """
+    Generates a random well-formed formula with roughly the given number of tokens.
+
+    Args:
+        tokens (int): Approximate number of tokens.
+        variables (int): Number of distinct variable names.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        str: The formula, split into lines of about 80 characters.
+    """
+    rng = random.Random(seed)
+    names = ['x%d' % i for i in range(variables)]
+    parts = []
+    count = 0
+    while count < tokens:
+        # Every group "(!a & b) |" adds 7 tokens
+        parts.append('(!%s %s %s) %s' % (rng.choice(names), rng.choice(OPERATORS), rng.choice(names),
+                                         rng.choice(OPERATORS)))
+        count += 7
+    parts.append(rng.choice(names))
+    lines = []
+    for i in range(0, len(parts), 6):
+        lines.append(' '.join(parts[i:i + 6]))
+    return '\n'.join(lines)
+
+
+def lex_sequential(characters: str, token_patterns: List[Tuple[re.Pattern, str]]) -> List[Tuple[str, str]]:
+    """
+    The previous lexer: tries every pattern in turn at every position. Kept as the baseline.
+
+    Args:
+        characters (str): The input string to be tokenized.
+        token_patterns (List[Tuple[re.Pattern, str]]): Regex patterns and their tags.
+
+    Returns:
+        List[Tuple[str, str]]: The tokens.
+    """
+    pos = 0
+    tokens = []
+    while pos < len(characters):
+        match = None
+        for regex, tag in token_patterns:
+            match = regex.match(characters, pos)
+            if match:
+                if tag:
+                    tokens.append((match.group(0), tag))
+                break
+        if not match:
+            raise SyntaxError('Illegal character: %s\n' % characters[pos])
+        pos = match.end(0)
+    return tokens
+
+
+def run(tokens: int = 10 ** 6, seed: int = 0) -> dict[str, float]:
+    """
+    Times the lexers on one generated formula.
+
+    Args:
+        tokens (int): Approximate number of tokens in the formula.
+        seed (int): Seed of the formula generator.
+
+    Returns:
+        dict[str, float]: Seconds spent by each lexer.
+    """
+    formula = generate_formula(tokens, seed=seed)
+    timings = {}
+
+    start = time.perf_counter()
+    expected = lex_sequential(formula, token_patterns)
+    timings['sequential'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = lex(formula, token_patterns)
+    timings['combined'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    count = sum(1 for _ in iter_lex(formula, token_patterns))
+    timings['combined_stream'] = time.perf_counter() - start
+
+    assert result == expected and count == len(expected)
+    timings['tokens'] = len(expected)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmarks the logical formula lexer.')
+    parser.add_argument('--tokens', type=int, default=10 ** 6)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    timings = run(args.tokens, args.seed)
+    tokens = timings.pop('tokens')
+    print('%d tokens' % tokens)
+    for name, seconds in timings.items():
+        print('  %-16s %8.3f s %12.0f tokens/s  x%.1f' % (name, seconds, tokens / seconds,
+                                                        timings['sequential'] / seconds))
+
+
+if __name__ == '__main__':
+    main()
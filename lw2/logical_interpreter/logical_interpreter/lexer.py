@@ -1,5 +1,79 @@
 import re
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+
+@lru_cache(maxsize=None)
+def compile_patterns(token_patterns: Tuple[Tuple[re.Pattern, str], ...]) -> Tuple[re.Pattern, Tuple[Optional[str], ...]]:
+    """
+    Combines token patterns into a single alternation of named groups.
+
+    The alternatives are tried in the order of the patterns, so the first
+    pattern that matches at a position wins, as in a sequential scan.
+
+    Args:
+        token_patterns (Tuple[Tuple[re.Pattern, str], ...]): Regex patterns and their tags.
+
+    Returns:
+        Tuple[re.Pattern, Tuple[Optional[str], ...]]: The combined regex and the tags
+        indexed by the group number of their alternative.
+    """
+    flags = 0
+    alternatives = []
+    for i, (regex, _) in enumerate(token_patterns):
+        flags |= regex.flags
+        alternatives.append('(?P<_%d>%s)' % (i, regex.pattern))
+    combined = re.compile('|'.join(alternatives), flags)
+    tags = [None] * (combined.groups + 1)
+    for i, (_, tag) in enumerate(token_patterns):
+        tags[combined.groupindex['_%d' % i]] = tag
+    return combined, tuple(tags)
+
+
+def error_position(characters: str, pos: int) -> Tuple[int, int]:
+    """
+    Converts an offset in the input into a 1-based line and column.
+
+    Args:
+        characters (str): The input string.
+        pos (int): Offset into the input.
+
+    Returns:
+        Tuple[int, int]: The line and column of the offset.
+    """
+    line = characters.count('\n', 0, pos) + 1
+    column = pos - (characters.rfind('\n', 0, pos) + 1) + 1
+    return line, column
+
+
+def iter_lex(characters: str, token_patterns: List[Tuple[re.Pattern, str]]) -> Iterator[Tuple[str, str]]:
+    """
+    Lexical analyzer that lazily tokenizes a string in a single pass over the input.
+
+    Args:
+        characters (str): The input string to be tokenized.
+        token_patterns (List[Tuple[re.Pattern, str]]): A list of tuples where each tuple contains a regex pattern (re.Pattern) and a tag (str).
+
+    Yields:
+        Tuple[str, str]: The matched text and its corresponding tag, for every pattern with a tag.
+
+    Raises:
+        SyntaxError: If an illegal character is encountered, with the line and column of the character.
+    """
+    regex, tags = compile_patterns(tuple(token_patterns))
+    pos = 0
+    for match in iter(regex.scanner(characters).match, None):
+        tag = tags[match.lastindex]
+        if tag:
+            yield match.group(), tag
+        pos = match.end()
+    if pos < len(characters):
+        line, column = error_position(characters, pos)
+        end = characters.find('\n', pos)
+        text = characters[pos - column + 1:end if end >= 0 else len(characters)]
+        raise SyntaxError('Illegal character %r at line %d, column %d' % (characters[pos], line, column),
+                          ('<formula>', line, column, text))
+
 
 def lex(characters: str, token_patterns: List[Tuple[re.Pattern, str]]) -> List[Tuple[str, str]]:
     """
@@ -13,21 +87,6 @@ def lex(characters: str, token_patterns: List[Tuple[re.Pattern, str]]) -> List[T
         List[Tuple[str, str]]: A list of tokens where each token is a tuple containing the matched text and its corresponding tag.
 
     Raises:
-        ValueError: If an illegal character is encountered in the input string.
+        SyntaxError: If an illegal character is encountered in the input string.
     """
-    pos = 0
-    tokens = []
-    while pos < len(characters):
-        match = None
-        for regex, tag in token_patterns:
-            match = regex.match(characters, pos)
-            if match:
-                text = match.group(0)
-                if tag:
-                    token = (text, tag)
-                    tokens.append(token)
-                break
-        if not match:
-            raise SyntaxError('Illegal character: %s\n' % characters[pos])
-        pos = match.end(0)
-    return tokens
+    return list(iter_lex(characters, token_patterns))
@@ -0,0 +1,94 @@
+from typing import Callable
+
+from logical_interpreter.logical_interpreter.log_ast import *
+
+# Python expression of every node over the names of its operands, the same
+# expressions the eval methods use, so results keep their values and types
+TEMPLATES = {
+    And: '{0} and {1}',
+    Or: '{0} or {1}',
+    Not: 'not {0}',
+    Implies: 'not {0} or {1}',
+    Equiv: '{0} == {1}',
+}
+
+
+def children(node: Expr) -> tuple[Expr, ...]:
+    """
+    Returns the operands of a node.
+
+    Args:
+        node (Expr): An AST node.
+
+    Returns:
+        tuple[Expr, ...]: The operands, empty for variables.
+
+    Raises:
+        TypeError: If the node is not one of the log_ast node types.
+    """
+    if isinstance(node, Var):
+        return ()
+    if isinstance(node, Not):
+        return (node.operand,)
+    if type(node) in TEMPLATES:
+        return node.left, node.right
+    raise TypeError(f'Cannot compile {type(node).__name__} nodes')
+
+
+def generate_source(ast: Expr, variables: list[str], name: str = 'formula') -> str:
+    """
+    Generates the source of a function evaluating the AST.
+
+    The function takes the variable values as positional arguments in the
+    order of ``variables``. Every operator node becomes one assignment to a
+    fresh temporary, visited in postorder without recursion, so arbitrarily
+    deep trees produce flat code. Nodes shared between subtrees are computed once.
+
+    Args:
+        ast (Expr): The root of the AST.
+        variables (list[str]): The variable names, in argument order.
+        name (str): The name of the generated function.
+
+    Returns:
+        str: The function source.
+    """
+    arguments = {variable: 'v%d' % i for i, variable in enumerate(variables)}
+    lines = ['def %s(%s):' % (name, ', '.join(arguments.values()))]
+    names = {}
+    stack = [(ast, False)]
+    while stack:
+        node, ready = stack.pop()
+        if id(node) in names:
+            continue
+        if isinstance(node, Var):
+            names[id(node)] = arguments[node.name]
+            continue
+        operands = children(node)
+        if not ready:
+            stack.append((node, True))
+            stack.extend((operand, False) for operand in reversed(operands))
+            continue
+        temp = 't%d' % (len(lines) - 1)
+        lines.append('    %s = %s' % (temp, TEMPLATES[type(node)].format(*(names[id(operand)] for operand in operands))))
+        names[id(node)] = temp
+    lines.append('    return %s' % names[id(ast)])
+    return '\n'.join(lines) + '\n'
+
+
+def compile_ast(ast: Expr, variables: list[str]) -> Callable[..., bool]:
+    """
+    Compiles the AST into a Python function with positional variable arguments.
+
+    Args:
+        ast (Expr): The root of the AST.
+        variables (list[str]): The variable names, in argument order.
+
+    Returns:
+        Callable[..., bool]: The compiled function, with its code in the ``source`` attribute.
+    """
+    source = generate_source(ast, variables)
+    namespace = {}
+    exec(compile(source, '<formula>', 'exec'), namespace)
+    function = namespace['formula']
+    function.source = source
+    return function
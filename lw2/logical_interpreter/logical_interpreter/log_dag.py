@@ -0,0 +1,164 @@
+from logical_interpreter.logical_interpreter.log_ast import *
+from logical_interpreter.logical_interpreter.log_bitset import use_counts
+from logical_interpreter.logical_interpreter.log_compiler import children
+
+
+def build(node_type: type, *args: Expr | str) -> Expr:
+    """
+    Builds a fresh node, the default builder of the parsers.
+
+    Args:
+        node_type (type): The node class.
+        *args (Expr | str): The operands, or the name of a variable.
+
+    Returns:
+        Expr: The new node.
+    """
+    return node_type(*args)
+
+
+class HashConsBuilder:
+    """
+    Builder interning structurally equal nodes, so that a parsed formula is a DAG.
+
+    A variable is interned per name, an operator node per class and operand
+    identities: since operands are interned first, equal subformulas end up as
+    the same object.
+
+    Attributes:
+        table (dict[tuple, Expr]): The interned nodes by class and operands.
+        shared (int): The number of nodes requested that were already interned.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty HashConsBuilder.
+        """
+        self.table = {}
+        self.shared = 0
+
+    def __call__(self, node_type: type, *args: Expr | str) -> Expr:
+        """
+        Returns the interned node, building it on first request.
+
+        Args:
+            node_type (type): The node class.
+            *args (Expr | str): The operands, or the name of a variable.
+
+        Returns:
+            Expr: The interned node.
+        """
+        # The table keeps every node alive, so operand ids are never reused
+        key = (node_type,) + tuple(arg if isinstance(arg, str) else id(arg) for arg in args)
+        node = self.table.get(key)
+        if node is None:
+            node = self.table[key] = node_type(*args)
+        else:
+            self.shared += 1
+        return node
+
+    def __len__(self) -> int:
+        """
+        Returns the number of distinct nodes built.
+
+        Returns:
+            int: The number of interned nodes.
+        """
+        return len(self.table)
+
+
+def topological_order(ast: Expr) -> list[Expr]:
+    """
+    Lists the distinct nodes of an AST or DAG, every node after its operands.
+
+    Args:
+        ast (Expr): The root.
+
+    Returns:
+        list[Expr]: The nodes in postorder, each once, the root last.
+
+    Raises:
+        TypeError: If the AST holds a node that is not one of the log_ast node types.
+    """
+    order = []
+    visited = set()
+    stack = [(ast, False)]
+    while stack:
+        node, ready = stack.pop()
+        if ready:
+            order.append(node)
+        elif id(node) not in visited:
+            visited.add(id(node))
+            stack.append((node, True))
+            stack.extend((operand, False) for operand in reversed(children(node)))
+    return order
+
+
+class DAG:
+    """
+    Formula DAG evaluated in topological order, every shared node computed once.
+
+    Attributes:
+        root (Expr): The root of the DAG.
+        order (list[Expr]): The distinct nodes, every node after its operands.
+        shared (int): The number of nodes with more than one parent.
+    """
+
+    def __init__(self, ast: Expr) -> None:
+        """
+        Initializes a DAG from the root of a (possibly hash-consed) AST.
+
+        Args:
+            ast (Expr): The root.
+
+        Raises:
+            TypeError: If the AST holds a node that is not one of the log_ast node types.
+        """
+        self.root = ast
+        self.order = topological_order(ast)
+        self.shared = sum(1 for count in use_counts(ast).values() if count > 1)
+        positions = {id(node): i for i, node in enumerate(self.order)}
+        # Node class and operand positions, or the variable name, per step
+        self._steps = [(Var, node.name) if isinstance(node, Var) else
+                       (type(node),) + tuple(positions[id(operand)] for operand in children(node))
+                       for node in self.order]
+
+    def __len__(self) -> int:
+        """
+        Returns the number of distinct nodes.
+
+        Returns:
+            int: The number of nodes.
+        """
+        return len(self.order)
+
+    def eval(self, env: dict[str, bool]) -> bool:
+        """
+        Evaluate the DAG in the given environment.
+
+        Every node is computed with the same operators as its eval method, so
+        the result equals the tree walk of the root.
+
+        Args:
+            env (dict[str, bool]): A dictionary mapping variable names to their boolean values.
+
+        Returns:
+            bool: The result of evaluating the DAG.
+        """
+        values = []
+        for step in self._steps:
+            kind = step[0]
+            if kind is Var:
+                value = env[step[1]]
+            elif kind is Not:
+                value = not values[step[1]]
+            elif kind is And:
+                value = values[step[1]] and values[step[2]]
+            elif kind is Or:
+                value = values[step[1]] or values[step[2]]
+            elif kind is Implies:
+                value = not values[step[1]] or values[step[2]]
+            else:
+                value = values[step[1]] == values[step[2]]
+            values.append(value)
+        return values[-1]
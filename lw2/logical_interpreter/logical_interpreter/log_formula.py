@@ -1,51 +1,208 @@
+import sys
+from itertools import product
+from typing import Iterator, Optional, TextIO
+
+from logical_interpreter.logical_interpreter.log_bdd import BDD
+from logical_interpreter.logical_interpreter.log_bitset import evaluate_column, iter_bits, iter_ones, row_values, to_bits
+from logical_interpreter.logical_interpreter.log_dag import HashConsBuilder
+from logical_interpreter.logical_interpreter.log_packed import PackedTruthTable
 from logical_interpreter.logical_interpreter.log_parser import parse
+from logical_interpreter.logical_interpreter.log_truth_table import TruthTable
+from logical_interpreter.logical_interpreter.log_writers import iter_normal_form, iter_table_lines, write
+
+# 'bitset' keeps the result column as one integer, 'packed' as NumPy uint64
+# words evaluated in chunks, for formulas with 25 and more variables, 'bdd'
+# as a reduced ordered BDD, for formulas too wide for any truth table
+BACKENDS = ('bitset', 'packed', 'bdd')
 
 class Formula:
     """
     Class representing a logical formula and its associated operations.
 
+    The formula is evaluated on all rows at once into a result column, an
+    integer whose bit i is the value on row i; the forms are read from it.
+    With the packed backend the column is kept in a PackedTruthTable and
+    converted to an integer only on access; with the bdd backend the formula
+    is kept as a BDD, the minterms are read from its paths and the column is
+    built from its nodes only on access.
+
     Attributes:
-        func (Callable): The parsed logical formula.
+        func (Callable): The parsed logical formula, with equal subformulas shared.
+        shared_nodes (int): The number of subformula occurrences that reused a shared node.
         variables (list[str]): The list of variables in the logical formula.
-        truth_table (list[tuple[dict[str, int], bool]]): The generated truth table.
+        size (int): The number of rows of the truth table.
+        backend (str): The truth-table backend, one of BACKENDS.
+        packed (Optional[PackedTruthTable]): The packed result column with the packed backend.
+        bdd (Optional[BDD]): The BDD manager with the bdd backend.
+        bdd_root (Optional[int]): The BDD node of the formula with the bdd backend.
+        column (int): The result column.
+        truth_table (TruthTable): The truth table, generated on first access.
     """
 
-    def __init__(self, logical_formula: str) -> None:
+    def __init__(self, logical_formula: str, backend: str = 'bitset') -> None:
         """
         Initializes a Formula instance.
 
         Args:
             logical_formula (str): The logical formula as a string.
+            backend (str): The truth-table backend, one of BACKENDS.
+
+        Raises:
+            ValueError: If the backend is unknown.
         """
-        self.func = parse(logical_formula)
+        if backend not in BACKENDS:
+            raise ValueError(f'Unknown backend: {backend}')
+        builder = HashConsBuilder()
+        self.func = parse(logical_formula, builder)
+        self.shared_nodes = builder.shared
         self.variables = self.func.vars
-        self.truth_table = self.generate_truth_table()
+        self.size = 1 << len(self.variables)
+        self.backend = backend
+        self.packed = None
+        self.bdd = None
+        self.bdd_root = None
+        self._column = None
+        if backend == 'packed':
+            try:
+                self.packed = PackedTruthTable(self.func.ast, self.variables)
+            except TypeError:
+                pass
+        elif backend == 'bdd':
+            try:
+                bdd = BDD(self.variables)
+                self.bdd_root = bdd.build(self.func.ast)
+                self.bdd = bdd
+            except TypeError:
+                pass
+        if self.packed is None and self.bdd is None:
+            self._column = self.generate_column()
+        self._truth_table = None
+
+    @property
+    def column(self) -> int:
+        """
+        The result column, bit i holding the value on row i.
+
+        Returns:
+            int: The result column.
+        """
+        if self._column is None:
+            if self.packed is not None:
+                self._column = self.packed.to_int()
+            else:
+                self._column = self.bdd.column(self.bdd_root)
+        return self._column
+
+    def generate_column(self) -> int:
+        """
+        Evaluates the logical formula on every row with bitwise operations on variable masks.
+
+        Falls back to evaluating the rows one by one if the AST holds unknown nodes.
 
-    def generate_truth_table(self) -> list[tuple[dict[str, int], bool]]:
+        Returns:
+            int: The result column.
+        """
+        try:
+            return evaluate_column(self.func.ast, self.variables)
+        except TypeError:
+            column = 0
+            for i, values in enumerate(product([0, 1], repeat=len(self.variables))):
+                if self.func.evaluate(values):
+                    column |= 1 << i
+            return column
+
+    @property
+    def truth_table(self) -> TruthTable:
+        """
+        The truth table of the logical formula.
+
+        Returns:
+            TruthTable: The generated truth table.
+        """
+        if self._truth_table is None:
+            self._truth_table = self.generate_truth_table()
+        return self._truth_table
+
+    def generate_truth_table(self) -> TruthTable:
         """
         Generates the truth table for the logical formula.
 
         Returns:
-            list[tuple[dict[str, int], bool]]: The generated truth table.
+            TruthTable: The generated truth table.
         """
-        from itertools import product
-        table = []
-        for values in product([0, 1], repeat=len(self.variables)):
-            env = dict(zip(self.variables, values))
-            result = self.func(env)
-            table.append((env, result))
-        return table
+        return TruthTable(self.variables, self.column)
 
-    def print_truth_table(self) -> None:
+    def bits(self) -> str:
+        """
+        Spells the result column as a string of 0 and 1, row 0 first.
+
+        Returns:
+            str: The values of the rows.
+        """
+        if self.packed is not None:
+            return self.packed.to_bits()
+        return to_bits(self.column, self.size)
+
+    def iter_bits(self) -> Iterator[str]:
+        """
+        Spells the result column as strings of 0 and 1, row 0 first, a chunk of rows at a time.
+
+        Yields:
+            str: The values of the rows of one chunk.
+        """
+        if self.packed is not None:
+            return self.packed.iter_bits()
+        return iter_bits(self.column, self.size)
+
+    def row(self, index: int) -> tuple[int, ...]:
+        """
+        Returns the variable values of a truth-table row.
+
+        Args:
+            index (int): The row index.
+
+        Returns:
+            tuple[int, ...]: The values of the variables, in order.
+        """
+        return row_values(index, len(self.variables))
+
+    def minterms(self) -> Iterator[int]:
+        """
+        Yields the indices of the rows where the formula is true.
+
+        Yields:
+            int: The row index.
+        """
+        if self.packed is not None:
+            return (index for chunk in self.packed.iter_minterms() for index in chunk.tolist())
+        if self.bdd is not None:
+            return self.bdd.iter_minterms(self.bdd_root)
+        return iter_ones(self.column, self.size)
+
+    def maxterms(self) -> Iterator[int]:
+        """
+        Yields the indices of the rows where the formula is false.
+
+        Yields:
+            int: The row index.
+        """
+        if self.packed is not None:
+            return (index for chunk in self.packed.iter_maxterms() for index in chunk.tolist())
+        if self.bdd is not None:
+            return self.bdd.iter_minterms(self.bdd.negate(self.bdd_root))
+        return iter_ones(self.column ^ ((1 << self.size) - 1), self.size)
+
+    def print_truth_table(self, file: Optional[TextIO] = None, fmt: str = 'text') -> None:
         """
         Prints the truth table in a formatted manner.
+
+        The rows are streamed to the file in buffered chunks, never held in memory at once.
+
+        Args:
+            file (Optional[TextIO]): The file to write to, standard output by default.
+            fmt (str): The table format: 'text', 'csv' or 'tsv'.
         """
-        header = self.variables + ['Result']
-        print(' | '.join(header))
-        print('-' * (len(header) * 4 - 1))
-        for row in self.truth_table:
-            values = [str(row[0][var]) for var in self.variables] + [str(int(row[1]))]
-            print(' | '.join(values))
+        write(file or sys.stdout, iter_table_lines(self.variables, self.iter_bits(), fmt))
 
     def disjunctive_form(self) -> str:
         """
@@ -54,12 +211,19 @@ class Formula:
         Returns:
             str: The disjunctive normal form.
         """
-        terms = []
-        for env, result in self.truth_table:
-            if result:
-                term = ' & '.join(f'{var}' if val else f'!{var}' for var, val in env.items())
-                terms.append(f'({term})')
-        return ' | '.join(terms)
+        return ''.join(iter_normal_form(self.variables, self.minterms()))
+
+    def write_disjunctive_form(self, file: TextIO) -> int:
+        """
+        Streams the disjunctive normal form of the logical formula to a file in buffered chunks.
+
+        Args:
+            file (TextIO): The file to write to.
+
+        Returns:
+            int: The number of characters written.
+        """
+        return write(file, iter_normal_form(self.variables, self.minterms()))
 
     def disjunction_digital_form(self) -> str:
         """
@@ -68,7 +232,7 @@ class Formula:
         Returns:
             str: The disjunction digital form.
         """
-        indices = [str(i) for i, (_, result) in enumerate(self.truth_table) if result]
+        indices = [str(i) for i in self.minterms()]
         return f'| ({", ".join(indices)})'
 
     def conjunctive_form(self) -> str:
@@ -78,12 +242,19 @@ class Formula:
         Returns:
             str: The conjunctive normal form.
         """
-        terms = []
-        for env, result in self.truth_table:
-            if not result:
-                term = ' | '.join(f'{var}' if not val else f'!{var}' for var, val in env.items())
-                terms.append(f'({term})')
-        return ' & '.join(terms)
+        return ''.join(iter_normal_form(self.variables, self.maxterms(), conjunctive=True))
+
+    def write_conjunctive_form(self, file: TextIO) -> int:
+        """
+        Streams the conjunctive normal form of the logical formula to a file in buffered chunks.
+
+        Args:
+            file (TextIO): The file to write to.
+
+        Returns:
+            int: The number of characters written.
+        """
+        return write(file, iter_normal_form(self.variables, self.maxterms(), conjunctive=True))
 
     def conjunction_digital_form(self) -> str:
         """
@@ -92,7 +263,7 @@ class Formula:
         Returns:
             str: The conjunction digital form.
         """
-        indices = [str(i) for i, (_, result) in enumerate(self.truth_table) if not result]
+        indices = [str(i) for i in self.maxterms()]
         return f'& ({", ".join(indices)})'
 
     def index_form(self) -> str:
@@ -102,6 +273,6 @@ class Formula:
         Returns:
             str: The index form in binary and decimal representation.
         """
-        binary_form = ''.join(str(int(result)) for _, result in self.truth_table)
+        binary_form = self.bits()
         decimal_form = str(int(binary_form, 2))
         return f'Binary: {binary_form}, Decimal: {decimal_form}'
\ No newline at end of file
@@ -1,5 +1,5 @@
 import re
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 from logical_interpreter.logical_interpreter import lexer
 
 # Compile all regex patterns before the loop for efficiency
@@ -27,3 +27,16 @@ def log_lex(characters: str) -> List[Tuple[str, str]]:
         list of tuples: A list of tokens where each token is a tuple containing the matched text and its corresponding tag.
     """
     return lexer.lex(characters, token_patterns)
+
+
+def iter_log_lex(characters: str) -> Iterator[Tuple[str, str]]:
+    """
+    Lazily tokenizes a string based on predefined token patterns.
+
+    Args:
+        characters (str): The input string to be tokenized.
+
+    Yields:
+        Tuple[str, str]: The matched text and its corresponding tag.
+    """
+    return lexer.iter_lex(characters, token_patterns)
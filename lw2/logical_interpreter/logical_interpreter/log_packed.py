@@ -0,0 +1,239 @@
+from typing import Iterator
+
+import numpy as np
+
+from logical_interpreter.logical_interpreter.log_ast import *
+from logical_interpreter.logical_interpreter.log_bitset import use_counts
+from logical_interpreter.logical_interpreter.log_compiler import children
+
+# Rows evaluated at once; every live node holds CHUNK_ROWS / 8 bytes
+CHUNK_ROWS = 1 << 20
+
+WORD_BITS = 64
+ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+# Word patterns of the variables that change more often than every 64 rows:
+# bit j of the word is set when bit b of j is set
+WORD_PATTERNS = [np.uint64(sum(1 << j for j in range(WORD_BITS) if j >> b & 1)) for b in range(6)]
+
+
+class PackedTruthTable:
+    """
+    Truth table of a formula stored as packed bits in uint64 words.
+
+    Bit j of word w holds row 64 * w + j, rows ordered as
+    itertools.product([0, 1], repeat=n), so the words read as one little-endian
+    integer equal the column of log_bitset. Rows are evaluated in chunks with
+    vectorized bitwise ufuncs; only the result column is kept.
+
+    Attributes:
+        variables (list[str]): The variable names, in truth-table order.
+        size (int): The number of rows.
+        chunk_rows (int): The number of rows evaluated at once.
+        words (np.ndarray): The result column.
+    """
+
+    def __init__(self, ast: Expr, variables: list[str], chunk_rows: int = CHUNK_ROWS) -> None:
+        """
+        Evaluates the AST on every row of the truth table.
+
+        Args:
+            ast (Expr): The root of the AST.
+            variables (list[str]): The variable names, in truth-table order.
+            chunk_rows (int): The number of rows evaluated at once, a power of two of at least 64.
+
+        Raises:
+            ValueError: If chunk_rows is not a power of two of at least 64.
+            TypeError: If the AST holds a node that is not one of the log_ast node types.
+        """
+        if chunk_rows < WORD_BITS or chunk_rows & (chunk_rows - 1):
+            raise ValueError(f'Chunk size must be a power of two of at least {WORD_BITS}: {chunk_rows}')
+        self.variables = variables
+        self.size = 1 << len(variables)
+        self.chunk_rows = min(chunk_rows, max(self.size, WORD_BITS))
+        self.words = np.empty(-(-self.size // WORD_BITS), dtype=np.uint64)
+        counts = use_counts(ast)
+        chunk_words = self.chunk_rows // WORD_BITS
+        for start in range(0, self.words.size, chunk_words):
+            self.words[start:start + chunk_words] = self._evaluate_chunk(ast, counts, start * WORD_BITS)
+        if self.size < WORD_BITS:
+            self.words &= np.uint64((1 << self.size) - 1)
+
+    def _variable_chunk(self, index: int, base: int) -> np.ndarray:
+        """
+        Builds the column of a variable over the chunk starting at a row.
+
+        Args:
+            index (int): The position of the variable.
+            base (int): The first row of the chunk.
+
+        Returns:
+            np.ndarray: The packed values of the variable.
+        """
+        words = self.chunk_rows // WORD_BITS
+        shift = len(self.variables) - 1 - index
+        if shift < 6:
+            return np.full(words, WORD_PATTERNS[shift], dtype=np.uint64)
+        block = 1 << (shift - 6)
+        if block >= words:
+            return np.full(words, ALL_ONES if base >> shift & 1 else 0, dtype=np.uint64)
+        return (np.arange(words, dtype=np.uint64) // np.uint64(block) & np.uint64(1)) * ALL_ONES
+
+    def _evaluate_chunk(self, ast: Expr, counts: dict[int, int], base: int) -> np.ndarray:
+        """
+        Evaluates the AST over the chunk starting at a row.
+
+        Operands are released as soon as their last parent is computed, so
+        memory stays proportional to the depth of the tree.
+
+        Args:
+            ast (Expr): The root of the AST.
+            counts (dict[int, int]): The number of parents of every node.
+            base (int): The first row of the chunk.
+
+        Returns:
+            np.ndarray: The packed result of the chunk.
+        """
+        positions = {name: i for i, name in enumerate(self.variables)}
+        pending = dict(counts)
+        values = {}
+        stack = [(ast, False)]
+        while stack:
+            node, ready = stack.pop()
+            if id(node) in values:
+                continue
+            if isinstance(node, Var):
+                values[id(node)] = self._variable_chunk(positions[node.name], base)
+                continue
+            operands = children(node)
+            if not ready:
+                stack.append((node, True))
+                stack.extend((operand, False) for operand in reversed(operands))
+                continue
+            args = [values[id(operand)] for operand in operands]
+            if isinstance(node, Not):
+                value = np.invert(args[0])
+            elif isinstance(node, And):
+                value = np.bitwise_and(args[0], args[1])
+            elif isinstance(node, Or):
+                value = np.bitwise_or(args[0], args[1])
+            elif isinstance(node, Implies):
+                value = np.bitwise_or(np.invert(args[0]), args[1])
+            else:
+                value = np.invert(np.bitwise_xor(args[0], args[1]))
+            for operand in operands:
+                pending[id(operand)] -= 1
+                if not pending[id(operand)]:
+                    del values[id(operand)]
+            values[id(node)] = value
+        return values[id(ast)]
+
+    def _iter_bits(self) -> Iterator[tuple[int, np.ndarray]]:
+        """
+        Unpacks the result column chunk by chunk.
+
+        Yields:
+            tuple[int, np.ndarray]: The first row of the chunk and its values as uint8 0 and 1.
+        """
+        chunk_words = self.chunk_rows // WORD_BITS
+        for start in range(0, self.words.size, chunk_words):
+            bits = np.unpackbits(self.words[start:start + chunk_words].view(np.uint8), bitorder='little')
+            yield start * WORD_BITS, bits[:self.size - start * WORD_BITS]
+
+    def iter_minterms(self) -> Iterator[np.ndarray]:
+        """
+        Yields the indices of the rows where the formula is true, chunk by chunk.
+
+        Yields:
+            np.ndarray: The row indices of one chunk, in increasing order.
+        """
+        for base, bits in self._iter_bits():
+            yield np.flatnonzero(bits) + base
+
+    def iter_maxterms(self) -> Iterator[np.ndarray]:
+        """
+        Yields the indices of the rows where the formula is false, chunk by chunk.
+
+        Yields:
+            np.ndarray: The row indices of one chunk, in increasing order.
+        """
+        for base, bits in self._iter_bits():
+            yield np.flatnonzero(bits == 0) + base
+
+    def minterms(self) -> np.ndarray:
+        """
+        Returns the indices of the rows where the formula is true.
+
+        Returns:
+            np.ndarray: The row indices, in increasing order.
+        """
+        return np.concatenate(list(self.iter_minterms()))
+
+    def maxterms(self) -> np.ndarray:
+        """
+        Returns the indices of the rows where the formula is false.
+
+        Returns:
+            np.ndarray: The row indices, in increasing order.
+        """
+        return np.concatenate(list(self.iter_maxterms()))
+
+    def count(self) -> int:
+        """
+        Counts the rows where the formula is true.
+
+        Returns:
+            int: The number of minterms.
+        """
+        return sum(int(np.count_nonzero(bits)) for _, bits in self._iter_bits())
+
+    def __getitem__(self, row: int) -> bool:
+        """
+        Returns the value of the formula on a row.
+
+        Args:
+            row (int): The row index.
+
+        Returns:
+            bool: The value on the row.
+        """
+        if not 0 <= row < self.size:
+            raise IndexError(f'Row {row} out of range')
+        return bool(int(self.words[row // WORD_BITS]) >> (row % WORD_BITS) & 1)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows.
+
+        Returns:
+            int: The number of rows.
+        """
+        return self.size
+
+    def iter_bits(self) -> Iterator[str]:
+        """
+        Spells the result column as strings of 0 and 1, row 0 first, a chunk at a time.
+
+        Yields:
+            str: The values of the rows of one chunk.
+        """
+        for _, bits in self._iter_bits():
+            yield (bits + ord('0')).tobytes().decode('ascii')
+
+    def to_bits(self) -> str:
+        """
+        Spells the result column as a string of 0 and 1, row 0 first.
+
+        Returns:
+            str: The values of the rows.
+        """
+        return ''.join(self.iter_bits())
+
+    def to_int(self) -> int:
+        """
+        Converts the result column into the integer column of log_bitset.
+
+        Returns:
+            int: The integer whose bit i is the value on row i.
+        """
+        return int.from_bytes(self.words.astype('<u8').tobytes(), 'little')
@@ -0,0 +1,92 @@
+from itertools import chain, product
+from typing import Iterable, Iterator, TextIO
+
+from logical_interpreter.logical_interpreter.log_bitset import row_values
+
+# Characters collected before one write to the file
+BUFFER_SIZE = 1 << 16
+
+# Separator of the cells of a table row in every table format
+SEPARATORS = {
+    'text': ' | ',
+    'csv': ',',
+    'tsv': '\t',
+}
+
+
+def iter_table_lines(variables: list[str], bits: Iterable[str], fmt: str = 'text') -> Iterator[str]:
+    """
+    Yields the lines of a truth table, the header first.
+
+    Args:
+        variables (list[str]): The variable names, in truth-table order.
+        bits (Iterable[str]): The results of the rows as strings of 0 and 1, in any chunks.
+        fmt (str): The table format, one of SEPARATORS.
+
+    Yields:
+        str: Every line, ending with a newline.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if fmt not in SEPARATORS:
+        raise ValueError(f'Unknown table format: {fmt}')
+    separator = SEPARATORS[fmt]
+    header = variables + ['Result']
+    yield separator.join(header) + '\n'
+    if fmt == 'text':
+        yield '-' * (len(header) * 4 - 1) + '\n'
+    for values, result in zip(product('01', repeat=len(variables)), chain.from_iterable(bits)):
+        yield separator.join(values + (result,)) + '\n'
+
+
+def iter_normal_form(variables: list[str], indices: Iterable[int], conjunctive: bool = False) -> Iterator[str]:
+    """
+    Yields the terms of the perfect disjunctive or conjunctive normal form and the operators between them.
+
+    Args:
+        variables (list[str]): The variable names, in truth-table order.
+        indices (Iterable[int]): The minterm indices, or the maxterm indices for the conjunctive form.
+        conjunctive (bool): Whether to spell the conjunctive form.
+
+    Yields:
+        str: The terms and the operators joining them.
+    """
+    inner, outer = (' | ', ' & ') if conjunctive else (' & ', ' | ')
+    negated = 1 if conjunctive else 0
+    first = True
+    for index in indices:
+        if not first:
+            yield outer
+        first = False
+        values = row_values(index, len(variables))
+        yield '(' + inner.join(f'!{var}' if val == negated else var for var, val in zip(variables, values)) + ')'
+
+
+def write(file: TextIO, parts: Iterable[str], buffer_size: int = BUFFER_SIZE) -> int:
+    """
+    Writes strings to a file, joining them into chunks of about buffer_size characters.
+
+    Args:
+        file (TextIO): Any object with a write method taking a string.
+        parts (Iterable[str]): The strings to write.
+        buffer_size (int): Characters collected before one write.
+
+    Returns:
+        int: The number of characters written.
+    """
+    buffer = []
+    buffered = 0
+    written = 0
+    for part in parts:
+        buffer.append(part)
+        buffered += len(part)
+        if buffered >= buffer_size:
+            file.write(''.join(buffer))
+            written += buffered
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        file.write(''.join(buffer))
+        written += buffered
+    return written
@@ -1,7 +1,7 @@
 import unittest
 import re
 
-from logical_interpreter.logical_interpreter.lexer import lex
+from logical_interpreter.logical_interpreter.lexer import compile_patterns, iter_lex, lex
 
 class TestLexer(unittest.TestCase):
     def setUp(self):
@@ -42,5 +42,30 @@ class TestLexer(unittest.TestCase):
         expected_tokens = [('(', 'LPAREN'), ('a', 'VAR'), ('<->', 'EQUIV'), ('b', 'VAR'), (')', 'RPAREN'), ('&', 'AND'), ('~', 'NOT'), ('(', 'LPAREN'), ('c', 'VAR'), ('->', 'IMPLIES'), ('d', 'VAR'), (')', 'RPAREN')]
         self.assertEqual(lex(characters, self.token_patterns), expected_tokens)
 
+    def test_iter_lex_is_lazy(self):
+        tokens = iter_lex("a & b $", self.token_patterns)
+        self.assertEqual(next(tokens), ('a', 'VAR'))
+        self.assertEqual(next(tokens), ('&', 'AND'))
+        self.assertEqual(next(tokens), ('b', 'VAR'))
+        with self.assertRaises(SyntaxError):
+            next(tokens)
+
+    def test_error_position(self):
+        characters = "(a & b)\n  | ~c $ d"
+        with self.assertRaises(SyntaxError) as context:
+            lex(characters, self.token_patterns)
+        self.assertEqual((context.exception.lineno, context.exception.offset), (2, 8))
+        self.assertEqual(context.exception.text, "  | ~c $ d")
+        self.assertIn("line 2, column 8", str(context.exception))
+
+    def test_first_pattern_wins(self):
+        patterns = [(re.compile(r'->'), 'IMPLIES'), (re.compile(r'-'), 'MINUS'), (re.compile(r'>'), 'GT')]
+        self.assertEqual(lex("-->>", patterns), [('-', 'MINUS'), ('->', 'IMPLIES'), ('>', 'GT')])
+
+    def test_patterns_are_compiled_once(self):
+        first = compile_patterns(tuple(self.token_patterns))
+        self.assertIs(compile_patterns(tuple(self.token_patterns)), first)
+        self.assertEqual(first[1][first[0].groupindex['_1']], 'LPAREN')
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,81 @@
+import unittest
+from itertools import islice
+
+from logical_interpreter.benchmarks.bench_lexer import generate_formula
+from logical_interpreter.logical_interpreter.log_bdd import BDD, FALSE, TRUE
+from logical_interpreter.logical_interpreter.log_bitset import iter_ones
+from logical_interpreter.logical_interpreter.log_formula import Formula
+from logical_interpreter.logical_interpreter.log_parser import parse
+
+
+def build(text):
+    formula = parse(text)
+    bdd = BDD(formula.vars)
+    return bdd, bdd.build(formula.ast)
+
+
+class TestBDD(unittest.TestCase):
+    def test_canonical(self):
+        formula = parse("(a -> b) & (b -> a) | c")
+        bdd = BDD(formula.vars)
+        f = bdd.build(formula.ast)
+        g = bdd.build(parse("c | (a ~ b)").ast)
+        self.assertEqual(f, g)
+        self.assertEqual(bdd.build(parse("a | !a").ast), TRUE)
+        self.assertEqual(bdd.build(parse("a & !a").ast), FALSE)
+        self.assertEqual(bdd.size(f), 6)
+
+    def test_satisfiability_and_tautology(self):
+        bdd, f = build("(a -> b) & a & !b")
+        self.assertFalse(bdd.satisfiable(f))
+        bdd, f = build("(a -> b) | (b -> a)")
+        self.assertTrue(bdd.tautology(f))
+        bdd, f = build("a -> b")
+        self.assertTrue(bdd.satisfiable(f))
+        self.assertFalse(bdd.tautology(f))
+
+    def test_count_and_minterms_match_column(self):
+        for seed in range(20):
+            text = generate_formula(40, variables=5, seed=seed)
+            formula = Formula(text)
+            bdd, f = build(text)
+            self.assertEqual(list(bdd.iter_minterms(f)), list(iter_ones(formula.column, formula.size)))
+            self.assertEqual(bdd.count(f), bin(formula.column).count('1'))
+            self.assertEqual(bdd.column(f), formula.column)
+
+    def test_cofactor(self):
+        bdd, f = build("a & b | !a & c")
+        self.assertEqual(bdd.cofactor(f, 'a', 1), bdd.var('b'))
+        self.assertEqual(bdd.cofactor(f, 'a', 0), bdd.var('c'))
+        self.assertEqual(bdd.cofactor(bdd.cofactor(f, 'b', 0), 'c', 1), bdd.negate(bdd.var('a')))
+
+    def test_sixty_variables(self):
+        names = ['x%d' % i for i in range(60)]
+        bdd, f = build(' & '.join('(%s ~ %s)' % (names[i], names[i + 1]) for i in range(0, 60, 2)))
+        self.assertEqual(bdd.size(f), 3 * 30 + 2)
+        self.assertEqual(bdd.count(f), 1 << 30)
+        self.assertEqual(list(islice(bdd.iter_minterms(f), 3)), [0, 3, 12])
+        self.assertEqual(next(bdd.iter_minterms(bdd.negate(f))), 1)
+
+
+class TestFormulaBDDBackend(unittest.TestCase):
+    def test_forms_match_bitset_backend(self):
+        text = "!(a -> (!b | b & c) ~ (d & !(c -> b)))"
+        bitset = Formula(text)
+        bdd = Formula(text, backend='bdd')
+        self.assertIsNotNone(bdd.bdd)
+        self.assertIsNone(bdd._column)
+        for form in ('disjunction_digital_form', 'conjunction_digital_form', 'index_form',
+                     'disjunctive_form', 'conjunctive_form'):
+            self.assertEqual(getattr(bdd, form)(), getattr(bitset, form)())
+        self.assertEqual(bdd.truth_table, bitset.truth_table)
+
+    def test_wide_formula_streams_minterms(self):
+        names = ['x%d' % i for i in range(40)]
+        formula = Formula(' & '.join(names[:-1]) + ' -> ' + names[-1], backend='bdd')
+        self.assertEqual(formula.bdd.count(formula.bdd_root), (1 << 40) - 1)
+        self.assertEqual(list(formula.maxterms()), [(1 << 40) - 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
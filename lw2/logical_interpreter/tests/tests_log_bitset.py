@@ -0,0 +1,61 @@
+import unittest
+from itertools import product
+
+from logical_interpreter.benchmarks.bench_lexer import generate_formula
+from logical_interpreter.logical_interpreter.log_ast import And, Expr, Var
+from logical_interpreter.logical_interpreter.log_bitset import evaluate_column, iter_ones, to_bits, variable_masks
+from logical_interpreter.logical_interpreter.log_formula import Formula
+from logical_interpreter.logical_interpreter.log_parser import parse
+
+
+class TestBitset(unittest.TestCase):
+    def test_variable_masks(self):
+        self.assertEqual([to_bits(mask, 8) for mask in variable_masks(3)], ['00001111', '00110011', '01010101'])
+        self.assertEqual(variable_masks(0), [])
+
+    def test_column_matches_row_evaluation(self):
+        for seed in range(20):
+            formula = parse(generate_formula(60, variables=5, seed=seed))
+            column = evaluate_column(formula.ast, formula.vars)
+            for i, values in enumerate(product([0, 1], repeat=len(formula.vars))):
+                self.assertEqual((column >> i) & 1, int(formula.evaluate(values)))
+
+    def test_iter_ones(self):
+        self.assertEqual(list(iter_ones(0b10110, 8)), [1, 2, 4])
+        self.assertEqual(list(iter_ones(0, 8)), [])
+
+    def test_unknown_node_raises(self):
+        class Constant(Expr):
+            def eval(self, env):
+                return True
+
+        with self.assertRaises(TypeError):
+            evaluate_column(And(Constant(), Var('a')), ['a'])
+
+
+class TestFormulaColumn(unittest.TestCase):
+    def test_forms_read_from_column(self):
+        formula = Formula("(a -> b) ~ !c")
+        self.assertEqual(to_bits(formula.column, formula.size), '10100110')
+        self.assertEqual(list(formula.minterms()), [0, 2, 5, 6])
+        self.assertEqual(list(formula.maxterms()), [1, 3, 4, 7])
+        self.assertEqual(formula.disjunction_digital_form(), "| (0, 2, 5, 6)")
+        self.assertEqual(formula.conjunction_digital_form(), "& (1, 3, 4, 7)")
+        self.assertEqual(formula.disjunctive_form(), "(!a & !b & !c) | (!a & b & !c) | (a & !b & c) | (a & b & !c)")
+        self.assertEqual(formula.index_form(), "Binary: 10100110, Decimal: 166")
+
+    def test_truth_table_is_lazy(self):
+        formula = Formula("a | b")
+        self.assertIsNone(formula._truth_table)
+        self.assertEqual(formula.truth_table[1], ({'a': 0, 'b': 1}, True))
+        self.assertIs(formula.truth_table, formula.truth_table)
+
+    def test_twenty_variables(self):
+        names = ['x%d' % i for i in range(20)]
+        formula = Formula(' & '.join(names))
+        self.assertEqual(formula.column, 1 << (formula.size - 1))
+        self.assertEqual(formula.disjunction_digital_form(), "| (%d)" % (formula.size - 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
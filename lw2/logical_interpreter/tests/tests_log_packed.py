@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from logical_interpreter.benchmarks.bench_lexer import generate_formula
+from logical_interpreter.logical_interpreter.log_bitset import evaluate_column, iter_ones, to_bits
+from logical_interpreter.logical_interpreter.log_formula import Formula
+from logical_interpreter.logical_interpreter.log_packed import PackedTruthTable
+from logical_interpreter.logical_interpreter.log_parser import parse
+
+
+class TestPackedTruthTable(unittest.TestCase):
+    def test_matches_bitset_column(self):
+        for variables in (1, 3, 6, 7, 10):
+            for seed in range(3):
+                formula = parse(generate_formula(60, variables, seed))
+                column = evaluate_column(formula.ast, formula.vars)
+                size = 1 << len(formula.vars)
+                for chunk_rows in (64, 256):
+                    table = PackedTruthTable(formula.ast, formula.vars, chunk_rows)
+                    self.assertEqual(table.to_int(), column)
+                    self.assertEqual(table.to_bits(), to_bits(column, size))
+                    self.assertEqual(table.minterms().tolist(), list(iter_ones(column, size)))
+                    self.assertEqual(table.count(), bin(column).count('1'))
+
+    def test_words_use_little_bit_order(self):
+        formula = parse("a & !b | c")
+        table = PackedTruthTable(formula.ast, formula.vars)
+        self.assertEqual(table.words.dtype, np.uint64)
+        self.assertEqual(table.words.tolist(), [0b10111010])
+        self.assertEqual([table[i] for i in range(len(table))], [False, True, False, True, True, True, False, True])
+        self.assertEqual(table.maxterms().tolist(), [0, 2, 6])
+        with self.assertRaises(IndexError):
+            table[8]
+
+    def test_rejects_bad_chunk_size(self):
+        formula = parse("a")
+        for chunk_rows in (32, 100):
+            with self.assertRaises(ValueError):
+                PackedTruthTable(formula.ast, formula.vars, chunk_rows)
+
+    def test_many_variables_in_chunks(self):
+        names = ['x%d' % i for i in range(22)]
+        formula = parse(' | '.join(names))
+        table = PackedTruthTable(formula.ast, formula.vars, chunk_rows=1 << 16)
+        self.assertEqual(table.words.size, 1 << 16)
+        self.assertEqual(table.count(), (1 << 22) - 1)
+        self.assertEqual(table.maxterms().tolist(), [0])
+
+
+class TestFormulaPackedBackend(unittest.TestCase):
+    def test_forms_match_bitset_backend(self):
+        text = "(a -> b) ~ !c | d & !e"
+        bitset = Formula(text)
+        packed = Formula(text, backend='packed')
+        self.assertIsNotNone(packed.packed)
+        for form in ('disjunctive_form', 'conjunctive_form', 'disjunction_digital_form',
+                     'conjunction_digital_form', 'index_form'):
+            self.assertEqual(getattr(packed, form)(), getattr(bitset, form)())
+        self.assertEqual(packed.truth_table, bitset.truth_table)
+        self.assertEqual(packed.column, bitset.column)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            Formula("a", backend='gpu')
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
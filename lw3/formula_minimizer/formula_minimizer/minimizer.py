@@ -7,11 +7,8 @@ from .karnaugh_map import optimize_kmap_dnf, optimize_kmap_cnf
 class Formula(logical_interpreter.Formula):
     def __init__(self, formula: str) -> None:
         super().__init__(formula)
-        self.min_terms = []
-        self.max_terms = []
-        for bits, value in self.truth_table:
-            term_index = int("".join(map(str, list(bits.values()))), 2)
-            self.min_terms.append(term_index) if value else self.max_terms.append(term_index)
+        self.min_terms = list(self.truth_table.minterms())
+        self.max_terms = list(self.truth_table.maxterms())
 
 
     def calculated_method_dnf(self):
@@ -1,2 +1,3 @@
 from logical_interpreter.logical_interpreter.log_parser import parse
-from logical_interpreter.logical_interpreter.log_formula import Formula
\ No newline at end of file
+from logical_interpreter.logical_interpreter.log_formula import Formula
+from logical_interpreter.logical_interpreter.log_truth_table import TruthTable
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""
+Truth-table rows per second of the tree walk, the compiled function, the bitset column and
+the packed NumPy column.
+
+Run from the project root:
+    python -m logical_interpreter.benchmarks.bench_eval --variables 16 --tokens 400
+"""
+import argparse
+import time
+from itertools import product
+
+from logical_interpreter.benchmarks.bench_lexer import generate_formula
+from logical_interpreter.logical_interpreter.log_bitset import evaluate_column
+from logical_interpreter.logical_interpreter.log_packed import PackedTruthTable
+from logical_interpreter.logical_interpreter.log_parser import parse
+
+
+def run(variables: int = 16, tokens: int = 400, seed: int = 0) -> dict[str, float]:
+    """
+    Evaluates a generated formula on every row of its truth table, in every way.
+
+    Args:
+        variables (int): Number of distinct variables.
+        tokens (int): Approximate number of tokens of the formula.
+        seed (int): Seed of the formula generator.
+
+    Returns:
+        dict[str, float]: Rows per second of each evaluation path, and the compile time.
+    """
+    formula = parse(generate_formula(tokens, variables, seed))
+    rows = list(product([0, 1], repeat=len(formula.vars)))
+
+    start = time.perf_counter()
+    expected = [formula.ast.eval(dict(zip(formula.vars, values))) for values in rows]
+    tree_walk = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = formula.compiled
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = [compiled(*values) for values in rows]
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    column = evaluate_column(formula.ast, formula.vars)
+    bitset = time.perf_counter() - start
+
+    start = time.perf_counter()
+    packed = PackedTruthTable(formula.ast, formula.vars)
+    packed_time = time.perf_counter() - start
+
+    assert result == expected
+    assert packed.to_int() == column
+    assert all((column >> i) & 1 == int(value) for i, value in enumerate(expected))
+    return {
+        'rows': len(rows),
+        'tree_walk': len(rows) / tree_walk,
+        'compiled': len(rows) / elapsed,
+        'bitset': len(rows) / bitset,
+        'packed': len(rows) / packed_time,
+        'compile_seconds': compile_time,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmarks formula evaluation.')
+    parser.add_argument('--variables', type=int, default=16)
+    parser.add_argument('--tokens', type=int, default=400)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    result = run(args.variables, args.tokens, args.seed)
+    print('%d rows, compiled in %.4f s' % (result['rows'], result['compile_seconds']))
+    print('  tree walk %12.0f rows/s' % result['tree_walk'])
+    for name in ('compiled', 'bitset', 'packed'):
+        print('  %-9s %12.0f rows/s  x%.1f' % (name, result[name], result[name] / result['tree_walk']))
+
+
+if __name__ == '__main__':
+    main()
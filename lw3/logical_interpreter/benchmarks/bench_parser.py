@@ -0,0 +1,87 @@
+"""
+Recursive-descent Parser against the iterative PrecedenceParser.
+
+Run from the project root:
+    python -m logical_interpreter.benchmarks.bench_parser --tokens 1000000 --depth 100000
+"""
+import argparse
+import time
+
+from logical_interpreter.benchmarks.bench_lexer import generate_formula
+from logical_interpreter.logical_interpreter.log_lexer import log_lex
+from logical_interpreter.logical_interpreter.log_parser import Parser, PrecedenceParser
+
+
+def nested_formula(depth: int) -> str:
+    """
+    Builds a formula with ``depth`` levels of parentheses, each holding a negation.
+
+    Args:
+        depth (int): Nesting depth.
+
+    Returns:
+        str: The formula.
+    """
+    return '(!' * depth + 'a' + ' & b)' * depth
+
+
+def time_parser(parser_class: type, tokens: list[tuple[str, str]]) -> float | str:
+    """
+    Times one parse of the tokens.
+
+    Args:
+        parser_class (type): Parser or PrecedenceParser.
+        tokens (list[tuple[str, str]]): The tokens to parse.
+
+    Returns:
+        float | str: Seconds spent, or the name of the error that stopped the parser.
+    """
+    start = time.perf_counter()
+    try:
+        parser_class(tokens).parse()
+    except RecursionError:
+        return 'RecursionError'
+    return time.perf_counter() - start
+
+
+def run(tokens: int = 10 ** 6, depth: int = 10 ** 5, seed: int = 0) -> dict[str, dict[str, float | str]]:
+    """
+    Times both parsers on a flat generated formula and on a deeply nested one.
+
+    Args:
+        tokens (int): Approximate number of tokens of the flat formula.
+        depth (int): Nesting depth of the nested formula.
+        seed (int): Seed of the formula generator.
+
+    Returns:
+        dict[str, dict[str, float | str]]: Timings per formula and parser.
+    """
+    results = {}
+    for name, formula in (('flat', generate_formula(tokens, seed=seed)), ('nested', nested_formula(depth))):
+        lexed = log_lex(formula)
+        results[name] = {
+            'tokens': len(lexed),
+            'recursive': time_parser(Parser, lexed),
+            'precedence': time_parser(PrecedenceParser, lexed),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmarks the logical formula parsers.')
+    parser.add_argument('--tokens', type=int, default=10 ** 6)
+    parser.add_argument('--depth', type=int, default=10 ** 5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for name, timings in run(args.tokens, args.depth, args.seed).items():
+        print('%s formula, %d tokens' % (name, timings.pop('tokens')))
+        for parser_name, seconds in timings.items():
+            if isinstance(seconds, str):
+                print('  %-12s %s' % (parser_name, seconds))
+            else:
+                print('  %-12s %8.3f s' % (parser_name, seconds))
+
+
+if __name__ == '__main__':
+    main()
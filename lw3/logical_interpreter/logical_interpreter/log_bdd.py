@@ -0,0 +1,355 @@
+from typing import Iterator
+
+from logical_interpreter.logical_interpreter.log_ast import *
+from logical_interpreter.logical_interpreter.log_compiler import children
+
+# Node ids of the terminals
+FALSE = 0
+TRUE = 1
+
+
+class BDD:
+    """
+    Reduced ordered binary decision diagrams over a fixed variable order.
+
+    Nodes are integer ids shared by all the functions of the manager. The
+    unique table makes every node (level, low, high) exist once, so equal
+    functions have equal ids; the computed table caches the results of ite.
+    Level i tests the i-th variable, the most significant bit of a row index
+    of the truth table, and both terminals sit at level len(variables).
+
+    Attributes:
+        variables (list[str]): The variable names, in order.
+        unique (dict[tuple[int, int, int], int]): Node ids by level, low and high child.
+        computed (dict[tuple[int, int, int], int]): Results of ite by operands.
+    """
+
+    def __init__(self, variables: list[str]) -> None:
+        """
+        Initializes a BDD manager holding only the terminals.
+
+        Args:
+            variables (list[str]): The variable names, in order.
+        """
+        self.variables = variables
+        self._levels = {name: i for i, name in enumerate(variables)}
+        count = len(variables)
+        self._level = [count, count]
+        self._low = [FALSE, TRUE]
+        self._high = [FALSE, TRUE]
+        self.unique = {}
+        self.computed = {}
+
+    def __len__(self) -> int:
+        """
+        Returns the number of nodes, terminals included.
+
+        Returns:
+            int: The number of nodes.
+        """
+        return len(self._level)
+
+    def size(self, f: int) -> int:
+        """
+        Counts the nodes reachable from a function, terminals included.
+
+        Args:
+            f (int): The function.
+
+        Returns:
+            int: The number of nodes of the function.
+        """
+        seen = {f}
+        stack = [f]
+        while stack:
+            node = stack.pop()
+            if node > TRUE:
+                for child in (self._low[node], self._high[node]):
+                    if child not in seen:
+                        seen.add(child)
+                        stack.append(child)
+        return len(seen)
+
+    def node(self, level: int, low: int, high: int) -> int:
+        """
+        Returns the node testing a level, creating it if it does not exist.
+
+        Args:
+            level (int): The level of the variable tested.
+            low (int): The node taken when the variable is 0.
+            high (int): The node taken when the variable is 1.
+
+        Returns:
+            int: The node id, the child itself if both children are equal.
+        """
+        if low == high:
+            return low
+        key = (level, low, high)
+        node = self.unique.get(key)
+        if node is None:
+            node = self.unique[key] = len(self._level)
+            self._level.append(level)
+            self._low.append(low)
+            self._high.append(high)
+        return node
+
+    def var(self, name: str) -> int:
+        """
+        Returns the function of a single variable.
+
+        Args:
+            name (str): The variable name.
+
+        Returns:
+            int: The node id.
+        """
+        return self.node(self._levels[name], FALSE, TRUE)
+
+    def _split(self, f: int, level: int) -> tuple[int, int]:
+        """
+        Returns the cofactors of a function with respect to the variable of a level above or at its root.
+
+        Args:
+            f (int): The function.
+            level (int): The level.
+
+        Returns:
+            tuple[int, int]: The function with the variable set to 0 and to 1.
+        """
+        if self._level[f] == level:
+            return self._low[f], self._high[f]
+        return f, f
+
+    def ite(self, f: int, g: int, h: int) -> int:
+        """
+        Returns if-then-else of three functions, (f & g) | (!f & h).
+
+        Args:
+            f (int): The condition.
+            g (int): The function where f holds.
+            h (int): The function where f does not hold.
+
+        Returns:
+            int: The node id of the result.
+        """
+        if f == TRUE:
+            return g
+        if f == FALSE:
+            return h
+        if g == h:
+            return g
+        if g == TRUE and h == FALSE:
+            return f
+        key = (f, g, h)
+        result = self.computed.get(key)
+        if result is None:
+            # Depth is bounded by the number of variables
+            level = min(self._level[f], self._level[g], self._level[h])
+            f0, f1 = self._split(f, level)
+            g0, g1 = self._split(g, level)
+            h0, h1 = self._split(h, level)
+            result = self.node(level, self.ite(f0, g0, h0), self.ite(f1, g1, h1))
+            self.computed[key] = result
+        return result
+
+    def negate(self, f: int) -> int:
+        """
+        Returns the negation of a function.
+
+        Args:
+            f (int): The function.
+
+        Returns:
+            int: The node id of !f.
+        """
+        return self.ite(f, FALSE, TRUE)
+
+    def apply(self, node_type: type, f: int, g: int) -> int:
+        """
+        Combines two functions with a binary operator of the log_ast node types.
+
+        Args:
+            node_type (type): And, Or, Implies or Equiv.
+            f (int): The left operand.
+            g (int): The right operand.
+
+        Returns:
+            int: The node id of the result.
+        """
+        if node_type is And:
+            return self.ite(f, g, FALSE)
+        if node_type is Or:
+            return self.ite(f, TRUE, g)
+        if node_type is Implies:
+            return self.ite(f, g, TRUE)
+        return self.ite(f, g, self.negate(g))
+
+    def build(self, ast: Expr) -> int:
+        """
+        Builds the function of an AST, visited in postorder without recursion.
+
+        Args:
+            ast (Expr): The root of the AST.
+
+        Returns:
+            int: The node id of the function.
+
+        Raises:
+            TypeError: If the AST holds a node that is not one of the log_ast node types.
+        """
+        values = {}
+        stack = [(ast, False)]
+        while stack:
+            node, ready = stack.pop()
+            if id(node) in values:
+                continue
+            if isinstance(node, Var):
+                values[id(node)] = self.var(node.name)
+                continue
+            operands = children(node)
+            if not ready:
+                stack.append((node, True))
+                stack.extend((operand, False) for operand in reversed(operands))
+                continue
+            args = [values[id(operand)] for operand in operands]
+            if isinstance(node, Not):
+                values[id(node)] = self.negate(args[0])
+            else:
+                values[id(node)] = self.apply(type(node), *args)
+        return values[id(ast)]
+
+    def satisfiable(self, f: int) -> bool:
+        """
+        Checks whether some assignment makes the function true.
+
+        Args:
+            f (int): The function.
+
+        Returns:
+            bool: Whether the function is satisfiable.
+        """
+        return f != FALSE
+
+    def tautology(self, f: int) -> bool:
+        """
+        Checks whether every assignment makes the function true.
+
+        Args:
+            f (int): The function.
+
+        Returns:
+            bool: Whether the function is a tautology.
+        """
+        return f == TRUE
+
+    def count(self, f: int) -> int:
+        """
+        Counts the assignments of all the variables that make the function true.
+
+        Args:
+            f (int): The function.
+
+        Returns:
+            int: The number of models.
+        """
+        counts = {FALSE: 0, TRUE: 1}
+
+        def models(node: int) -> int:
+            # Models over the levels from the level of the node down
+            if node not in counts:
+                level = self._level[node]
+                low, high = self._low[node], self._high[node]
+                counts[node] = (models(low) << (self._level[low] - level - 1)) + \
+                               (models(high) << (self._level[high] - level - 1))
+            return counts[node]
+
+        return models(f) << self._level[f]
+
+    def cofactor(self, f: int, name: str, value: int | bool) -> int:
+        """
+        Returns the function with one variable fixed.
+
+        Args:
+            f (int): The function.
+            name (str): The variable name.
+            value (int | bool): The value of the variable.
+
+        Returns:
+            int: The node id of the cofactor.
+        """
+        level = self._levels[name]
+        results = {}
+
+        def restrict(node: int) -> int:
+            if self._level[node] > level:
+                return node
+            if node not in results:
+                if self._level[node] == level:
+                    results[node] = self._high[node] if value else self._low[node]
+                else:
+                    results[node] = self.node(self._level[node], restrict(self._low[node]),
+                                              restrict(self._high[node]))
+            return results[node]
+
+        return restrict(f)
+
+    def iter_minterms(self, f: int) -> Iterator[int]:
+        """
+        Yields the truth-table row indices where the function is true, in increasing order.
+
+        Args:
+            f (int): The function.
+
+        Yields:
+            int: The row index.
+        """
+        count = len(self.variables)
+
+        def walk(node: int, level: int, prefix: int) -> Iterator[int]:
+            if node == FALSE:
+                return
+            if level == count:
+                yield prefix
+            elif self._level[node] > level:
+                yield from walk(node, level + 1, prefix << 1)
+                yield from walk(node, level + 1, prefix << 1 | 1)
+            else:
+                yield from walk(self._low[node], level + 1, prefix << 1)
+                yield from walk(self._high[node], level + 1, prefix << 1 | 1)
+
+        return walk(f, 0, 0)
+
+    def column(self, f: int) -> int:
+        """
+        Builds the truth-table column of a function, bit i holding the value on row i.
+
+        The column of every node is assembled from the columns of its children,
+        so the cost follows the size of the column, not the number of rows times
+        the size of the formula.
+
+        Args:
+            f (int): The function.
+
+        Returns:
+            int: The column.
+        """
+        count = len(self.variables)
+        columns = {}
+
+        def build(node: int, level: int) -> int:
+            # Column over the rows of the levels from this level down
+            if node == FALSE:
+                return 0
+            if node == TRUE:
+                return (1 << (1 << (count - level))) - 1
+            key = (node, level)
+            if key not in columns:
+                half = 1 << (count - level - 1)
+                if self._level[node] > level:
+                    low = high = build(node, level + 1)
+                else:
+                    low, high = build(self._low[node], level + 1), build(self._high[node], level + 1)
+                columns[key] = low | high << half
+            return columns[key]
+
+        return build(f, 0)
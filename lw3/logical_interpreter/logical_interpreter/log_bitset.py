@@ -0,0 +1,181 @@
+from typing import Iterator
+
+from logical_interpreter.logical_interpreter.log_ast import *
+from logical_interpreter.logical_interpreter.log_compiler import children
+
+# A column holds one bit per truth-table row: bit i is the value on row i,
+# rows ordered as itertools.product([0, 1], repeat=n), so the first variable
+# is the most significant bit of the row index
+
+# Rows spelled at once when a column is streamed
+CHUNK_ROWS = 1 << 16
+
+
+def variable_masks(count: int) -> list[int]:
+    """
+    Builds the column of every variable of a truth table.
+
+    Args:
+        count (int): Number of variables.
+
+    Returns:
+        list[int]: For every variable, in order, the integer whose bit i is the
+        value of the variable on row i.
+    """
+    size = 1 << count
+    masks = []
+    for i in range(count):
+        block = 1 << (count - 1 - i)
+        # Ones in the upper half of a period of 2 * block rows, doubled up to the size
+        mask = ((1 << block) - 1) << block
+        width = 2 * block
+        while width < size:
+            mask |= mask << width
+            width *= 2
+        masks.append(mask)
+    return masks
+
+
+def row_values(index: int, count: int) -> tuple[int, ...]:
+    """
+    Returns the variable values of a truth-table row.
+
+    Args:
+        index (int): The row index.
+        count (int): Number of variables.
+
+    Returns:
+        tuple[int, ...]: The values of the variables, in order.
+    """
+    return tuple((index >> (count - 1 - i)) & 1 for i in range(count))
+
+
+def use_counts(ast: Expr) -> dict[int, int]:
+    """
+    Counts how many parents every node of the AST has.
+
+    Args:
+        ast (Expr): The root of the AST.
+
+    Returns:
+        dict[int, int]: The number of parents by node id, the root counted once.
+
+    Raises:
+        TypeError: If the AST holds a node that is not one of the log_ast node types.
+    """
+    counts = {id(ast): 1}
+    stack = [ast]
+    while stack:
+        for operand in children(stack.pop()):
+            if id(operand) not in counts:
+                counts[id(operand)] = 0
+                stack.append(operand)
+            counts[id(operand)] += 1
+    return counts
+
+
+def evaluate_column(ast: Expr, variables: list[str]) -> int:
+    """
+    Evaluates the AST on every row of the truth table at once with bitwise operators.
+
+    Every variable is replaced by its column and every node becomes one big
+    integer operation, visited in postorder without recursion. Operands are
+    released once their last parent is computed.
+
+    Args:
+        ast (Expr): The root of the AST.
+        variables (list[str]): The variable names, in truth-table order.
+
+    Returns:
+        int: The result column.
+
+    Raises:
+        TypeError: If the AST holds a node that is not one of the log_ast node types.
+    """
+    full = (1 << (1 << len(variables))) - 1
+    columns = dict(zip(variables, variable_masks(len(variables))))
+    pending = use_counts(ast)
+    values = {}
+    stack = [(ast, False)]
+    while stack:
+        node, ready = stack.pop()
+        if id(node) in values:
+            continue
+        if isinstance(node, Var):
+            values[id(node)] = columns[node.name]
+            continue
+        operands = children(node)
+        if not ready:
+            stack.append((node, True))
+            stack.extend((operand, False) for operand in reversed(operands))
+            continue
+        args = [values[id(operand)] for operand in operands]
+        if isinstance(node, Not):
+            value = full ^ args[0]
+        elif isinstance(node, And):
+            value = args[0] & args[1]
+        elif isinstance(node, Or):
+            value = args[0] | args[1]
+        elif isinstance(node, Implies):
+            value = (full ^ args[0]) | args[1]
+        else:
+            value = full ^ (args[0] ^ args[1])
+        for operand in operands:
+            pending[id(operand)] -= 1
+            if not pending[id(operand)]:
+                del values[id(operand)]
+        values[id(node)] = value
+    return values[id(ast)]
+
+
+def iter_bits(column: int, size: int, chunk_rows: int = CHUNK_ROWS) -> Iterator[str]:
+    """
+    Spells a column as strings of 0 and 1, row 0 first, a chunk of rows at a time.
+
+    Args:
+        column (int): The column.
+        size (int): Number of rows.
+        chunk_rows (int): Rows per string, a multiple of 8.
+
+    Yields:
+        str: The values of the rows of one chunk.
+    """
+    data = column.to_bytes(-(-size // 8), 'little')
+    step = chunk_rows // 8
+    for start in range(0, len(data), step):
+        rows = min(chunk_rows, size - start * 8)
+        yield to_bits(int.from_bytes(data[start:start + step], 'little'), rows)
+
+
+def iter_ones(column: int, size: int) -> Iterator[int]:
+    """
+    Yields the indices of the set bits of a column in increasing order.
+
+    Args:
+        column (int): The column.
+        size (int): Number of rows.
+
+    Yields:
+        int: The row index of every set bit.
+    """
+    base = 0
+    for bits in iter_bits(column, size):
+        i = bits.find('1')
+        while i >= 0:
+            yield base + i
+            i = bits.find('1', i + 1)
+        base += len(bits)
+
+
+def to_bits(column: int, size: int) -> str:
+    """
+    Spells a column as a string of 0 and 1, row 0 first.
+
+    Args:
+        column (int): The column.
+        size (int): Number of rows.
+
+    Returns:
+        str: The values of the rows.
+    """
+    return format(column, '0%db' % size)[::-1] if size else ''
@@ -1,13 +1,26 @@
-from typing import Optional
+from typing import Callable, Iterable, Optional, Sequence
 
 from logical_interpreter.logical_interpreter.log_ast import *
-from logical_interpreter.logical_interpreter.log_lexer import log_lex
+from logical_interpreter.logical_interpreter.log_compiler import compile_ast
+from logical_interpreter.logical_interpreter.log_dag import build
+from logical_interpreter.logical_interpreter.log_lexer import iter_log_lex, log_lex
+
+# Binding power and node class of the binary operators, loosest first: ~ < -> < | < &
+BINARY_OPERATORS = {
+    'EQUIV': (1, Equiv),
+    'IMPLIES': (2, Implies),
+    'OR': (3, Or),
+    'AND': (4, And),
+}
 
 
 class LogicalFormula:
     """
     Class representing a logical formula.
 
+    Evaluation goes through a Python function compiled from the AST on first
+    use; if the AST cannot be compiled the tree is walked instead.
+
     Attributes:
         ast (Expr): The abstract syntax tree of the logical formula.
         vars (list[str]): The list of variables in the logical formula.
@@ -23,6 +36,23 @@ class LogicalFormula:
         """
         self.ast = ast
         self.vars = variables
+        self._compiled = None
+        self._compile_failed = False
+
+    @property
+    def compiled(self) -> Optional[Callable[..., bool]]:
+        """
+        The compiled function taking the variable values positionally in the order of vars.
+
+        Returns:
+            Optional[Callable[..., bool]]: The function, or None if the AST could not be compiled.
+        """
+        if self._compiled is None and not self._compile_failed:
+            try:
+                self._compiled = compile_ast(self.ast, self.vars)
+            except (TypeError, KeyError, SyntaxError, RecursionError, MemoryError):
+                self._compile_failed = True
+        return self._compiled
 
     def __call__(self, kwargs: dict[str, bool]) -> bool:
         """
@@ -34,28 +64,147 @@ class LogicalFormula:
         Returns:
             bool: The result of evaluating the logical formula.
         """
-        return self.ast.eval(kwargs)
+        function = self.compiled
+        if function is None:
+            return self.ast.eval(kwargs)
+        return function(*[kwargs[name] for name in self.vars])
+
+    def evaluate(self, values: Sequence[int | bool]) -> bool:
+        """
+        Evaluates the logical formula with the variable values given in the order of vars.
+
+        Args:
+            values (Sequence[int | bool]): The values of the variables.
+
+        Returns:
+            bool: The result of evaluating the logical formula.
+        """
+        function = self.compiled
+        if function is None:
+            return self.ast.eval(dict(zip(self.vars, values)))
+        return function(*values)
 
-def parse(logical_formula: str) -> LogicalFormula:
+def parse(logical_formula: str, builder: Callable[..., Expr] = build) -> LogicalFormula:
     """
     Parses a logical formula string into a LogicalFormula object.
 
     Args:
         logical_formula (str): The logical formula as a string.
+        builder (Callable[..., Expr]): Builds every node from its class and operands;
+            a HashConsBuilder makes equal subformulas one shared node.
 
     Returns:
         LogicalFormula: The parsed logical formula.
     """
-    tokens = log_lex(logical_formula)
-    parser = Parser(tokens)
+    parser = PrecedenceParser(iter_log_lex(logical_formula), builder)
     ast = parser.parse()
+    return LogicalFormula(ast, parser.variables)
+
+
+class PrecedenceParser:
+    """
+    Iterative operator-precedence (shunting-yard) parser.
+
+    Builds the same AST as Parser in one pass over the tokens, keeping pending
+    operators and operands on explicit stacks, so deeply nested parentheses and
+    long chains of negations do not hit the recursion limit. All binary
+    operators are left-associative and '!' binds tighter than any of them.
+
+    Attributes:
+        tokens (Iterable[tuple[str, str]]): The tokens to parse, possibly a lazy iterator.
+        builder (Callable[..., Expr]): Builds every node from its class and operands.
+        variables (list[str]): Variable names in order of first appearance, filled by parse().
+    """
 
-    variables = []
-    for token in tokens:
-        if token[1] == 'VAR' and token[0] not in variables:
-            variables.append(token[0])
+    def __init__(self, tokens: Iterable[tuple[str, str]], builder: Callable[..., Expr] = build) -> None:
+        """
+        Initializes a PrecedenceParser instance.
+
+        Args:
+            tokens (Iterable[tuple[str, str]]): The tokens to parse.
+            builder (Callable[..., Expr]): Builds every node from its class and operands.
+        """
+        self.tokens = tokens
+        self.builder = builder
+        self.variables = []
+
+    def parse(self) -> Expr:
+        """
+        Parses the tokens into an AST.
+
+        Returns:
+            Expr: The root of the AST.
+
+        Raises:
+            SyntaxError: If the tokens do not form a formula.
+        """
+        operands = []
+        operators = []
+        seen = set()
+        depth = 0
+        expect_operand = True
+
+        for text, tag in self.tokens:
+            if expect_operand:
+                if tag == 'VAR':
+                    if text not in seen:
+                        seen.add(text)
+                        self.variables.append(text)
+                    operands.append(self.builder(Var, text))
+                    self._negate(operands, operators)
+                    expect_operand = False
+                elif tag == 'NOT' or tag == 'LPAREN':
+                    operators.append(tag)
+                    depth += tag == 'LPAREN'
+                else:
+                    raise SyntaxError('Expected variable or parenthesis')
+            elif tag in BINARY_OPERATORS:
+                power = BINARY_OPERATORS[tag][0]
+                while operators and operators[-1] in BINARY_OPERATORS and BINARY_OPERATORS[operators[-1]][0] >= power:
+                    self._reduce(operands, operators.pop())
+                operators.append(tag)
+                expect_operand = True
+            elif tag == 'RPAREN' and depth:
+                while operators[-1] != 'LPAREN':
+                    self._reduce(operands, operators.pop())
+                operators.pop()
+                depth -= 1
+                self._negate(operands, operators)
+            elif depth:
+                raise SyntaxError('Expected closing parenthesis')
+            else:
+                raise SyntaxError('Unexpected token after parsing complete')
+
+        if expect_operand:
+            raise SyntaxError('Expected variable or parenthesis')
+        if depth:
+            raise SyntaxError('Expected closing parenthesis')
+        while operators:
+            self._reduce(operands, operators.pop())
+        return operands[0]
+
+    def _negate(self, operands: list[Expr], operators: list[str]) -> None:
+        """
+        Applies the negations waiting in front of the operand just completed.
 
-    return LogicalFormula(ast, variables)
+        Args:
+            operands (list[Expr]): The operand stack.
+            operators (list[str]): The operator stack.
+        """
+        while operators and operators[-1] == 'NOT':
+            operators.pop()
+            operands[-1] = self.builder(Not, operands[-1])
+
+    def _reduce(self, operands: list[Expr], tag: str) -> None:
+        """
+        Replaces the two topmost operands with a binary node.
+
+        Args:
+            operands (list[Expr]): The operand stack.
+            tag (str): The tag of the binary operator.
+        """
+        right = operands.pop()
+        operands[-1] = self.builder(BINARY_OPERATORS[tag][1], operands[-1], right)
 
 class Parser:
     """
@@ -63,17 +212,20 @@ class Parser:
 
     Attributes:
         tokens (list[tuple[str, str]]): The list of tokens to parse.
+        builder (Callable[..., Expr]): Builds every node from its class and operands.
         pos (int): The current position in the token list.
     """
 
-    def __init__(self, tokens: list[tuple[str, str]]) -> None:
+    def __init__(self, tokens: list[tuple[str, str]], builder: Callable[..., Expr] = build) -> None:
         """
         Initializes a Parser instance.
 
         Args:
             tokens (list[tuple[str, str]]): The list of tokens to parse.
+            builder (Callable[..., Expr]): Builds every node from its class and operands.
         """
         self.tokens = tokens
+        self.builder = builder
         self.pos = 0
 
     def parse(self) -> Var:
@@ -125,7 +277,7 @@ class Parser:
         left = self.implies()
         while self.match('EQUIV'):
             right = self.implies()
-            left = Equiv(left, right)
+            left = self.builder(Equiv, left, right)
         return left
 
     def implies(self) -> Var:
@@ -138,7 +290,7 @@ class Parser:
         left = self.or_expr()
         while self.match('IMPLIES'):
             right = self.or_expr()
-            left = Implies(left, right)
+            left = self.builder(Implies, left, right)
         return left
 
     def or_expr(self) -> Var:
@@ -151,7 +303,7 @@ class Parser:
         left = self.and_expr()
         while self.match('OR'):
             right = self.and_expr()
-            left = Or(left, right)
+            left = self.builder(Or, left, right)
         return left
 
     def and_expr(self) -> Var:
@@ -164,7 +316,7 @@ class Parser:
         left = self.not_expr()
         while self.match('AND'):
             right = self.not_expr()
-            left = And(left, right)
+            left = self.builder(And, left, right)
         return left
 
     def not_expr(self) -> Not | Var:
@@ -176,7 +328,7 @@ class Parser:
         """
         if self.match('NOT'):
             operand = self.not_expr()
-            return Not(operand)
+            return self.builder(Not, operand)
         return self.atom()
 
     def atom(self) -> Var:
@@ -196,5 +348,5 @@ class Parser:
             return expr
         var = self.match('VAR')
         if var:
-            return Var(var)
+            return self.builder(Var, var)
         raise SyntaxError('Expected variable or parenthesis')
\ No newline at end of file
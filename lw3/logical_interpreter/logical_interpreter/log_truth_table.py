@@ -0,0 +1,209 @@
+from collections.abc import Mapping, Sequence
+from typing import Iterator
+
+from logical_interpreter.logical_interpreter.log_bitset import iter_ones, row_values
+
+
+class Row(Mapping):
+    """
+    Read-only view of the variable values of one truth-table row.
+
+    The values are computed from the row index on access, so a row costs the
+    same whatever the number of variables. Compares equal to the dict it
+    replaces.
+
+    Attributes:
+        index (int): The row index.
+    """
+
+    def __init__(self, positions: dict[str, int], index: int) -> None:
+        """
+        Initializes a Row view.
+
+        Args:
+            positions (dict[str, int]): The shift of every variable in the row index, shared between rows.
+            index (int): The row index.
+        """
+        self._positions = positions
+        self.index = index
+
+    def __getitem__(self, name: str) -> int:
+        """
+        Returns the value of a variable on the row.
+
+        Args:
+            name (str): The variable name.
+
+        Returns:
+            int: 0 or 1.
+        """
+        return (self.index >> self._positions[name]) & 1
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the variable names in truth-table order.
+
+        Returns:
+            Iterator[str]: The variable names.
+        """
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of variables.
+
+        Returns:
+            int: The number of variables.
+        """
+        return len(self._positions)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the row.
+
+        Returns:
+            str: The row, spelled as a dict.
+        """
+        return repr(dict(self))
+
+
+class TruthTable(Sequence):
+    """
+    Truth table stored as the variable order and a result column.
+
+    Bit i of the column is the result on row i, rows ordered as
+    itertools.product([0, 1], repeat=n). Items are (Row, bool) pairs built on
+    access, so the table can be used wherever a list of (dict, bool) pairs was.
+    The column is also kept as little-endian bytes, so reading one result
+    costs O(1) instead of a shift of the whole integer.
+
+    Attributes:
+        variables (list[str]): The variable names, in truth-table order.
+        column (int): The result column.
+        size (int): The number of rows.
+    """
+
+    def __init__(self, variables: list[str], column: int) -> None:
+        """
+        Initializes a TruthTable instance.
+
+        Args:
+            variables (list[str]): The variable names, in truth-table order.
+            column (int): The result column.
+        """
+        self.variables = variables
+        self.column = column
+        self.size = 1 << len(variables)
+        self._data = column.to_bytes(-(-self.size // 8), 'little')
+        self._positions = {name: len(variables) - 1 - i for i, name in enumerate(variables)}
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows.
+
+        Returns:
+            int: The number of rows.
+        """
+        return self.size
+
+    def __getitem__(self, index: int | slice) -> tuple[Row, bool] | list[tuple[Row, bool]]:
+        """
+        Returns a row and its result.
+
+        Args:
+            index (int | slice): The row index, negative indices counting from the end.
+
+        Returns:
+            tuple[Row, bool] | list[tuple[Row, bool]]: The row view and its result, or a list of them for a slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f'Row {index} out of range')
+        return Row(self._positions, index), self.result(index)
+
+    def __iter__(self) -> Iterator[tuple[Row, bool]]:
+        """
+        Iterates over the rows and their results.
+
+        Returns:
+            Iterator[tuple[Row, bool]]: The row views and their results.
+        """
+        positions = self._positions
+        index = 0
+        for byte in self._data:
+            for bit in range(min(8, self.size - index)):
+                yield Row(positions, index), bool(byte >> bit & 1)
+                index += 1
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares with another truth table or with a sequence of (dict, bool) pairs.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: Whether both hold the same rows and results.
+        """
+        if isinstance(other, TruthTable):
+            return self.variables == other.variables and self.column == other.column
+        if isinstance(other, (list, tuple)):
+            return len(other) == self.size and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the truth table.
+
+        Returns:
+            str: The rows, spelled as the list of (dict, bool) pairs.
+        """
+        return repr(list(self))
+
+    def result(self, index: int) -> bool:
+        """
+        Returns the result on a row.
+
+        Args:
+            index (int): The row index.
+
+        Returns:
+            bool: The result.
+        """
+        return bool(self._data[index >> 3] >> (index & 7) & 1)
+
+    def values(self, index: int) -> tuple[int, ...]:
+        """
+        Returns the variable values of a row.
+
+        Args:
+            index (int): The row index.
+
+        Returns:
+            tuple[int, ...]: The values of the variables, in order.
+        """
+        return row_values(index, len(self.variables))
+
+    def minterms(self) -> Iterator[int]:
+        """
+        Yields the indices of the rows where the result is true.
+
+        Yields:
+            int: The row index.
+        """
+        return iter_ones(self.column, self.size)
+
+    def maxterms(self) -> Iterator[int]:
+        """
+        Yields the indices of the rows where the result is false.
+
+        Yields:
+            int: The row index.
+        """
+        return iter_ones(self.column ^ ((1 << self.size) - 1), self.size)
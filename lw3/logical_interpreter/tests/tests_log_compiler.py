@@ -0,0 +1,58 @@
+import unittest
+from itertools import product
+
+from logical_interpreter.logical_interpreter.log_ast import And, Expr, Var
+from logical_interpreter.logical_interpreter.log_compiler import compile_ast, generate_source
+from logical_interpreter.logical_interpreter.log_parser import parse
+
+
+class TestCompiler(unittest.TestCase):
+    def test_matches_tree_walk(self):
+        for text in ["a & b", "a | !b", "a -> b", "a ~ b", "!(a -> b) ~ (c | a & !d)", "x", "!!x | x"]:
+            formula = parse(text)
+            function = compile_ast(formula.ast, formula.vars)
+            for values in product([0, 1], repeat=len(formula.vars)):
+                expected = formula.ast.eval(dict(zip(formula.vars, values)))
+                result = function(*values)
+                self.assertEqual(result, expected)
+                self.assertIs(type(result), type(expected))
+
+    def test_generates_flat_code(self):
+        formula = parse("!(a -> b) & c")
+        self.assertEqual(generate_source(formula.ast, formula.vars),
+                         "def formula(v0, v1, v2):\n"
+                         "    t0 = not v0 or v1\n"
+                         "    t1 = not t0\n"
+                         "    t2 = t1 and v2\n"
+                         "    return t2\n")
+
+    def test_shared_nodes_are_computed_once(self):
+        shared = And(Var('a'), Var('b'))
+        source = generate_source(And(shared, shared), ['a', 'b'])
+        self.assertEqual(source.count(' and '), 2)
+
+    def test_variable_names_do_not_clash(self):
+        formula = parse("not & t0 | v1")
+        self.assertFalse(formula({'not': 1, 't0': 0, 'v1': 0}))
+        self.assertTrue(formula.evaluate([1, 1, 0]))
+
+    def test_deep_formula_evaluates_without_recursion(self):
+        depth = 20000
+        formula = parse('(!' * depth + 'a' + ' -> b)' * depth)
+        self.assertTrue(formula.evaluate([1, 0]))
+        self.assertTrue(formula({'a': 0, 'b': 1}))
+
+    def test_falls_back_to_tree_walk(self):
+        class Constant(Expr):
+            def eval(self, env):
+                return True
+
+        formula = parse("a")
+        formula.ast = And(Constant(), Var('a'))
+        self.assertIsNone(formula.compiled)
+        self.assertEqual(formula({'a': 1}), 1)
+        self.assertEqual(formula.evaluate([0]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
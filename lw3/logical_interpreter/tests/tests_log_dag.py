@@ -0,0 +1,66 @@
+import unittest
+from itertools import product
+
+from logical_interpreter.benchmarks.bench_lexer import generate_formula
+from logical_interpreter.logical_interpreter.log_ast import Implies, Var
+from logical_interpreter.logical_interpreter.log_dag import DAG, HashConsBuilder, topological_order
+from logical_interpreter.logical_interpreter.log_formula import Formula
+from logical_interpreter.logical_interpreter.log_lexer import log_lex
+from logical_interpreter.logical_interpreter.log_parser import Parser, parse
+
+
+class TestHashConsing(unittest.TestCase):
+    def test_interns_equal_subformulas(self):
+        builder = HashConsBuilder()
+        formula = parse("(C -> B) & !(C -> B) | (B -> C)", builder)
+        left = formula.ast.left
+        self.assertIs(left.left, left.right.operand)
+        self.assertIsNot(left.left, formula.ast.right)
+        self.assertIs(left.left.right, formula.ast.right.left)
+        # C and B twice each, then C -> B once
+        self.assertEqual(builder.shared, 5)
+        self.assertEqual(len(builder), 7)
+
+    def test_variables_interned_per_name(self):
+        builder = HashConsBuilder()
+        self.assertIs(builder(Var, 'a'), builder(Var, 'a'))
+        self.assertIsNot(builder(Implies, builder(Var, 'a'), builder(Var, 'b')),
+                         builder(Implies, builder(Var, 'b'), builder(Var, 'a')))
+
+    def test_both_parsers_share_nodes(self):
+        text = "!(a ~ b) -> !(a ~ b)"
+        tree = parse(text, HashConsBuilder()).ast
+        self.assertIs(tree.left, tree.right)
+        tree = Parser(log_lex(text), HashConsBuilder()).parse()
+        self.assertIs(tree.left, tree.right)
+        tree = parse(text).ast
+        self.assertIsNot(tree.left, tree.right)
+
+
+class TestDAG(unittest.TestCase):
+    def test_topological_order_lists_shared_nodes_once(self):
+        formula = parse("(a & b) | !(a & b)", HashConsBuilder())
+        order = topological_order(formula.ast)
+        self.assertEqual(len(order), 5)
+        self.assertIs(order[-1], formula.ast)
+        dag = DAG(formula.ast)
+        self.assertEqual(dag.shared, 1)
+        self.assertEqual(len(dag), 5)
+
+    def test_evaluates_like_tree_walk(self):
+        for seed in range(10):
+            text = generate_formula(80, variables=4, seed=seed)
+            tree = parse(text)
+            dag = DAG(parse(text, HashConsBuilder()).ast)
+            for values in product([0, 1], repeat=len(tree.vars)):
+                env = dict(zip(tree.vars, values))
+                self.assertEqual(dag.eval(env), tree.ast.eval(env))
+
+    def test_formula_reports_shared_nodes(self):
+        formula = Formula("!(a -> (!b | b & c) ~ (d & !(c -> b)))")
+        self.assertEqual(formula.shared_nodes, 3)
+        self.assertEqual(formula.index_form(), Formula("(a & !a) | " + "!(a -> (!b | b & c) ~ (d & !(c -> b)))").index_form())
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
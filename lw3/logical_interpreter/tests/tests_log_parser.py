@@ -1,6 +1,7 @@
 import unittest
-from logical_interpreter.logical_interpreter.log_parser import parse, Parser
-from logical_interpreter.logical_interpreter.log_ast import And, Or
+from logical_interpreter.logical_interpreter.log_parser import parse, Parser, PrecedenceParser
+from logical_interpreter.logical_interpreter.log_lexer import log_lex
+from logical_interpreter.logical_interpreter.log_ast import And, Or, Not, Var, Implies
 
 
 class TestLogicalFormula(unittest.TestCase):
@@ -54,5 +55,42 @@ class TestParser(unittest.TestCase):
         with self.assertRaises(SyntaxError):
             parser.parse()
 
+class TestPrecedenceParser(unittest.TestCase):
+    def test_builds_same_ast_as_recursive_parser(self):
+        for formula in ["a & b | c", "a | b & c", "!a & !(b -> c) ~ d", "a -> b -> c", "a ~ b ~ c",
+                        "!!a | (b & (c | !d)) -> e", "((a))", "a & b & c | d -> e ~ f"]:
+            tokens = log_lex(formula)
+            self.assertEqual(repr(PrecedenceParser(tokens).parse()), repr(Parser(tokens).parse()))
+
+    def test_collects_variables_in_order(self):
+        parser = PrecedenceParser(log_lex("(b | a) & !b -> c"))
+        parser.parse()
+        self.assertEqual(parser.variables, ['b', 'a', 'c'])
+        self.assertEqual(parse("(b | a) & !b -> c").vars, ['b', 'a', 'c'])
+
+    def test_reports_syntax_errors(self):
+        for formula in ["", "a b", "(a", "a)", "a &", "()", "(a b)", "a ! b"]:
+            tokens = log_lex(formula)
+            with self.assertRaises(SyntaxError) as expected:
+                Parser(tokens).parse()
+            with self.assertRaises(SyntaxError) as actual:
+                PrecedenceParser(tokens).parse()
+            self.assertEqual(str(actual.exception), str(expected.exception))
+
+    def test_deep_nesting_without_recursion(self):
+        depth = 20000
+        ast = PrecedenceParser(log_lex('(!' * depth + 'a' + ' -> b)' * depth)).parse()
+        for _ in range(depth):
+            self.assertIsInstance(ast, Implies)
+            self.assertEqual(ast.right.name, 'b')
+            self.assertIsInstance(ast.left, Not)
+            ast = ast.left.operand
+        self.assertIsInstance(ast, Var)
+        ast = parse('!' * depth + 'a').ast
+        for _ in range(depth):
+            ast = ast.operand
+        self.assertEqual(ast.name, 'a')
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
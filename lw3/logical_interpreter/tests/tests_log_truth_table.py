@@ -0,0 +1,74 @@
+import time
+import unittest
+
+from logical_interpreter.logical_interpreter.log_formula import Formula
+from logical_interpreter.logical_interpreter.log_truth_table import Row, TruthTable
+
+
+class TestTruthTable(unittest.TestCase):
+    def setUp(self):
+        # a -> b
+        self.table = TruthTable(['a', 'b'], 0b1011)
+
+    def test_rows_behave_like_dicts(self):
+        row, result = self.table[2]
+        self.assertIsInstance(row, Row)
+        self.assertEqual(row, {'a': 1, 'b': 0})
+        self.assertEqual(list(row.keys()), ['a', 'b'])
+        self.assertEqual(list(row.values()), [1, 0])
+        self.assertEqual(row['b'], 0)
+        self.assertFalse(result)
+        self.assertEqual(repr(row), "{'a': 1, 'b': 0}")
+
+    def test_equals_list_of_pairs(self):
+        expected = [({'a': 0, 'b': 0}, True), ({'a': 0, 'b': 1}, True),
+                    ({'a': 1, 'b': 0}, False), ({'a': 1, 'b': 1}, True)]
+        self.assertEqual(self.table, expected)
+        self.assertEqual(list(self.table), expected)
+        self.assertEqual(repr(self.table), repr(expected))
+        self.assertNotEqual(self.table, expected[:3])
+        self.assertEqual(self.table, TruthTable(['a', 'b'], 0b1011))
+
+    def test_indexing(self):
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(self.table[-1], ({'a': 1, 'b': 1}, True))
+        self.assertEqual(self.table[1:3], [({'a': 0, 'b': 1}, True), ({'a': 1, 'b': 0}, False)])
+        self.assertEqual(self.table.values(2), (1, 0))
+        self.assertTrue(self.table.result(3))
+        with self.assertRaises(IndexError):
+            self.table[4]
+
+    def test_minterms_and_maxterms(self):
+        self.assertEqual(list(self.table.minterms()), [0, 1, 3])
+        self.assertEqual(list(self.table.maxterms()), [2])
+
+    def test_large_table_stays_compact(self):
+        names = ['x%d' % i for i in range(20)]
+        table = Formula(' & '.join(names)).truth_table
+        self.assertEqual(len(table), 1 << 20)
+        row, result = table[(1 << 20) - 1]
+        self.assertTrue(result)
+        self.assertEqual(set(row.values()), {1})
+        self.assertEqual(list(table.minterms()), [(1 << 20) - 1])
+
+    def test_lookup_and_iteration_do_not_shift_the_column(self):
+        names = ['x%d' % i for i in range(20)]
+        table = Formula(' | '.join(names)).truth_table
+        start = time.perf_counter()
+        for i in range(10000):
+            self.assertEqual(table.result(i), i != 0)
+        self.assertFalse(table[0][1])
+        self.assertTrue(table[1][1])
+        self.assertLess(time.perf_counter() - start, 1)
+
+        start = time.perf_counter()
+        count = 0
+        for i, (row, result) in enumerate(table):
+            count += result
+        self.assertEqual(count, (1 << 20) - 1)
+        self.assertEqual(i, (1 << 20) - 1)
+        self.assertLess(time.perf_counter() - start, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
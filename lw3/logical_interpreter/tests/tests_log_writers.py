@@ -0,0 +1,64 @@
+import io
+import unittest
+
+from logical_interpreter.logical_interpreter.log_formula import Formula
+from logical_interpreter.logical_interpreter.log_writers import iter_normal_form, iter_table_lines, write
+
+
+class CountingFile:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(len(text))
+
+
+class TestWriters(unittest.TestCase):
+    def test_table_formats(self):
+        lines = list(iter_table_lines(['a', 'b'], ['01', '1', '0'], 'csv'))
+        self.assertEqual(lines, ['a,b,Result\n', '0,0,0\n', '0,1,1\n', '1,0,1\n', '1,1,0\n'])
+        lines = list(iter_table_lines(['a'], ['10'], 'tsv'))
+        self.assertEqual(lines, ['a\tResult\n', '0\t1\n', '1\t0\n'])
+        with self.assertRaises(ValueError):
+            next(iter_table_lines(['a'], ['10'], 'xml'))
+
+    def test_normal_forms(self):
+        self.assertEqual(''.join(iter_normal_form(['a', 'b'], [1, 2])), '(!a & b) | (a & !b)')
+        self.assertEqual(''.join(iter_normal_form(['a', 'b'], [1, 2], conjunctive=True)), '(a | !b) & (!a | b)')
+        self.assertEqual(''.join(iter_normal_form(['a'], [])), '')
+
+    def test_write_buffers_chunks(self):
+        file = CountingFile()
+        self.assertEqual(write(file, ['abc'] * 100, buffer_size=64), 300)
+        self.assertEqual(sum(file.writes), 300)
+        self.assertEqual(len(file.writes), 5)
+
+
+class TestFormulaStreaming(unittest.TestCase):
+    def test_print_truth_table_formats(self):
+        formula = Formula("a | !b")
+        out = io.StringIO()
+        formula.print_truth_table(out, fmt='csv')
+        self.assertEqual(out.getvalue(), "a,b,Result\n0,0,1\n0,1,0\n1,0,1\n1,1,1\n")
+
+    def test_written_forms_match_strings(self):
+        for backend in ('bitset', 'packed'):
+            formula = Formula("(a -> b) ~ (c | !d) & e", backend=backend)
+            for write_form, form in ((formula.write_disjunctive_form, formula.disjunctive_form),
+                                     (formula.write_conjunctive_form, formula.conjunctive_form)):
+                out = io.StringIO()
+                self.assertEqual(write_form(out), len(form()))
+                self.assertEqual(out.getvalue(), form())
+
+    def test_wide_table_is_streamed(self):
+        names = ['x%d' % i for i in range(16)]
+        formula = Formula(' ~ '.join(names))
+        file = CountingFile()
+        formula.print_truth_table(file, fmt='tsv')
+        self.assertGreater(len(file.writes), 1)
+        self.assertLess(max(file.writes), 2 * (1 << 16))
+        self.assertEqual(sum(file.writes), len('\t'.join(names)) + 8 + (1 << 16) * 34)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file